@@ -1,4 +1,46 @@
-from breakpoint.engine.evaluator import evaluate
-from breakpoint.models.decision import Decision
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["Decision", "evaluate"]
+if TYPE_CHECKING:
+    from breakpoint.engine.disk_cache import DiskDecisionCache
+    from breakpoint.engine.evaluator import (
+        Evaluator,
+        aevaluate,
+        aevaluate_many,
+        evaluate,
+        evaluate_many,
+        iter_evaluate_many,
+    )
+    from breakpoint.engine.memo import DecisionMemo, PolicyResultCache
+    from breakpoint.engine.streaming import StreamGuard
+    from breakpoint.models.decision import Decision
+
+# Public names resolve on first access, so `import breakpoint` (and the CLI) stay cheap.
+_EXPORTS = {
+    "Decision": "breakpoint.models.decision",
+    "DecisionMemo": "breakpoint.engine.memo",
+    "DiskDecisionCache": "breakpoint.engine.disk_cache",
+    "Evaluator": "breakpoint.engine.evaluator",
+    "PolicyResultCache": "breakpoint.engine.memo",
+    "StreamGuard": "breakpoint.engine.streaming",
+    "aevaluate": "breakpoint.engine.evaluator",
+    "aevaluate_many": "breakpoint.engine.evaluator",
+    "evaluate": "breakpoint.engine.evaluator",
+    "evaluate_many": "breakpoint.engine.evaluator",
+    "iter_evaluate_many": "breakpoint.engine.evaluator",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,21 @@
+from breakpoint.benchmarks.compare import compare_results, median_interval
+from breakpoint.benchmarks.generator import nested_json_pair, red_team_categories, synthetic_pair
+from breakpoint.benchmarks.runner import run_benchmark, run_suite, scaling_curves
+from breakpoint.benchmarks.startup import STARTUP_BUDGETS_US, check_startup, import_times
+from breakpoint.benchmarks.suite import Benchmark, build_suite
+
+__all__ = [
+    "Benchmark",
+    "STARTUP_BUDGETS_US",
+    "build_suite",
+    "check_startup",
+    "compare_results",
+    "import_times",
+    "median_interval",
+    "nested_json_pair",
+    "red_team_categories",
+    "run_benchmark",
+    "run_suite",
+    "scaling_curves",
+    "synthetic_pair",
+]
@@ -0,0 +1,133 @@
+import math
+import statistics
+from dataclasses import replace
+
+from breakpoint.engine.aggregator import aggregate_policy_results
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.policies.base import PolicyResult
+from breakpoint.engine.policies.latency import evaluate_latency_policy
+from breakpoint.models.decision import Decision
+
+
+def compare_results(
+    baseline: dict,
+    candidate: dict,
+    thresholds: dict,
+    confidence: float = 0.95,
+) -> Decision:
+    """Gate two ``breakpoint bench`` result documents with the latency policy.
+
+    Each benchmark's median is run through ``evaluate_latency_policy`` (with
+    ``min_baseline_latency_ms`` forced to 0, since micro-benchmarks are far below LLM latencies).
+    A WARN/BLOCK is downgraded to ALLOW when the candidate's confidence interval for the median
+    overlaps the baseline's, so run-to-run noise does not fail the gate.
+    """
+    if not 0 < confidence < 1:
+        raise ConfigValidationError("confidence must be between 0 and 1.")
+    baseline_runs = _benchmarks_by_name(baseline, "baseline")
+    candidate_runs = _benchmarks_by_name(candidate, "candidate")
+    policy_thresholds = {**thresholds, "min_baseline_latency_ms": 0}
+
+    results = []
+    comparisons = []
+    for name in list(baseline_runs) + [name for name in candidate_runs if name not in baseline_runs]:
+        base = baseline_runs.get(name)
+        cand = candidate_runs.get(name)
+        base_record = _latency_record(base)
+        cand_record = _latency_record(cand)
+        result = evaluate_latency_policy(baseline=base_record, candidate=cand_record, thresholds=policy_thresholds)
+
+        comparison = {"benchmark": name, "status": result.status}
+        if base is not None and cand is not None:
+            base_low, base_high = median_interval(base["samples_ms"], confidence)
+            cand_low, cand_high = median_interval(cand["samples_ms"], confidence)
+            comparison.update(
+                {
+                    "baseline_median_ms": base_record.get("latency_ms"),
+                    "candidate_median_ms": cand_record.get("latency_ms"),
+                    "baseline_interval_ms": [base_low, base_high],
+                    "candidate_interval_ms": [cand_low, cand_high],
+                    "increase_pct": result.details.get("increase_pct"),
+                }
+            )
+            if result.status != "ALLOW" and "latency_ms" in base_record and cand_low <= base_high:
+                comparison["within_noise"] = True
+                result = PolicyResult(policy="latency", status="ALLOW", details=result.details)
+            comparison["status"] = result.status
+        comparisons.append(comparison)
+        results.append(
+            PolicyResult(
+                policy=name,
+                status=result.status,
+                reasons=[f"{name}: {reason}" for reason in result.reasons],
+                codes=result.codes,
+                details={**result.details, **comparison},
+            )
+        )
+
+    decision = aggregate_policy_results(results)
+    increases = [item["increase_pct"] for item in comparisons if isinstance(item.get("increase_pct"), float)]
+    return replace(
+        decision,
+        metrics={
+            "benchmarks_compared": len(comparisons),
+            "benchmarks_flagged": sum(1 for item in comparisons if item["status"] != "ALLOW"),
+            **({"latency_delta_pct_max": round(max(increases), 4)} if increases else {}),
+        },
+        metadata={
+            "confidence": confidence,
+            "thresholds": policy_thresholds,
+            "baseline": _run_info(baseline),
+            "candidate": _run_info(candidate),
+        },
+    )
+
+
+def median_interval(samples: list[float], confidence: float = 0.95) -> tuple[float, float]:
+    """Distribution-free confidence interval for the median from order statistics.
+
+    With too few samples for the requested confidence this widens to (min, max).
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        raise ValueError("samples must not be empty.")
+    alpha = (1 - confidence) / 2
+    # Largest k with P(Binomial(n, 1/2) < k) <= alpha; the interval is the k-th smallest and
+    # k-th largest sample.
+    k = 0
+    cumulative = 0.0
+    while k < n // 2:
+        cumulative += math.comb(n, k) / 2**n
+        if cumulative > alpha:
+            break
+        k += 1
+    k = max(k, 1)
+    return ordered[k - 1], ordered[n - k]
+
+
+def _benchmarks_by_name(document: dict, label: str) -> dict[str, dict]:
+    benchmarks = document.get("benchmarks") if isinstance(document, dict) else None
+    if not isinstance(benchmarks, list):
+        raise ConfigValidationError(f"{label} is not a breakpoint bench results document (missing 'benchmarks').")
+    runs = {}
+    for item in benchmarks:
+        if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+            raise ConfigValidationError(f"{label}: every benchmark needs a 'name'.")
+        samples = item.get("samples_ms")
+        if not isinstance(samples, list) or not samples or not all(isinstance(value, (int, float)) for value in samples):
+            raise ConfigValidationError(f"{label}: benchmark '{item['name']}' needs a non-empty 'samples_ms' list.")
+        runs[item["name"]] = item
+    return runs
+
+
+def _latency_record(run: dict | None) -> dict:
+    if run is None:
+        return {}
+    median = statistics.median(run["samples_ms"])
+    # A zero median cannot anchor a percent change; report it as missing data.
+    return {"latency_ms": float(median)} if median > 0 else {}
+
+
+def _run_info(document: dict) -> dict:
+    return {key: document[key] for key in ("engine_version", "python", "platform", "created_at") if key in document}
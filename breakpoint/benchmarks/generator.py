@@ -0,0 +1,123 @@
+import json
+import random
+
+# Plain-prose vocabulary; none of these words match the default PII or red-team patterns.
+_WORDS = (
+    "the", "a", "customer", "order", "account", "service", "support", "request", "update", "policy",
+    "shipping", "refund", "product", "team", "please", "thanks", "review", "status", "delivery", "invoice",
+    "schedule", "issue", "resolved", "pending", "details", "available", "confirm", "change", "address", "plan",
+    "quickly", "today", "tomorrow", "week", "report", "summary", "latest", "version", "feature", "access",
+    "and", "or", "with", "for", "from", "about", "after", "before", "into", "over",
+)
+_DOMAINS = ("example.com", "mail.test", "corp.example.org")
+
+
+def synthetic_text(rng: random.Random, size: int, pii_density: float = 0.0) -> str:
+    """Prose of roughly ``size`` bytes; ``pii_density`` is the fraction of words replaced by PII."""
+    text = " ".join(rng.choices(_WORDS, k=max(1, size // 6)))
+    if len(text) < size:
+        text += " " + " ".join(rng.choices(_WORDS, k=(size - len(text)) // 6 + 1))
+    return inject_pii(rng, text[:size], pii_density)
+
+
+def inject_pii(rng: random.Random, text: str, pii_density: float) -> str:
+    """Replace about ``pii_density`` of the words with emails, phone numbers, SSNs and card numbers."""
+    if pii_density <= 0:
+        return text
+    words = text.split(" ")
+    for index in rng.sample(range(len(words)), min(len(words), round(len(words) * pii_density))):
+        words[index] = _pii_value(rng)
+    return " ".join(words)
+
+
+def mutate_text(rng: random.Random, text: str, edit_rate: float = 0.1) -> str:
+    """Replace about ``edit_rate`` of the words, keeping the length close to the original."""
+    words = text.split(" ")
+    if edit_rate > 0:
+        for index in rng.sample(range(len(words)), round(len(words) * edit_rate)):
+            words[index] = rng.choice(_WORDS)
+    return " ".join(words)
+
+
+def synthetic_pair(
+    seed: int,
+    size: int,
+    pii_density: float = 0.0,
+    edit_rate: float = 0.1,
+) -> tuple[dict, dict]:
+    """Deterministic baseline/candidate records with outputs of ``size`` bytes and similar metadata."""
+    rng = random.Random(f"{seed}:{size}:{pii_density}:{edit_rate}")
+    baseline_output = synthetic_text(rng, size)
+    candidate_output = inject_pii(rng, mutate_text(rng, baseline_output, edit_rate), pii_density)
+    baseline = {"output": baseline_output, "cost_usd": 0.10, "latency_ms": 400, "tokens_total": size // 4 + 1}
+    candidate = {"output": candidate_output, "cost_usd": 0.105, "latency_ms": 410, "tokens_total": size // 4 + 1}
+    return baseline, candidate
+
+
+def nested_json_pair(seed: int, depth: int, breadth: int = 3) -> tuple[dict, dict]:
+    """Baseline/candidate records whose outputs are JSON objects nested ``depth`` levels deep.
+
+    The candidate changes the innermost leaf type so the schema walk has to reach the bottom.
+    """
+    rng = random.Random(f"{seed}:json:{depth}:{breadth}")
+    baseline_payload = _nested_payload(rng, depth, breadth)
+    candidate_payload = json.loads(json.dumps(baseline_payload))
+    node = candidate_payload
+    while "child" in node:
+        node = node["child"]
+    node["leaf"] = str(node["leaf"])
+    return {"output": json.dumps(baseline_payload)}, {"output": json.dumps(candidate_payload)}
+
+
+def red_team_categories(seed: int, pattern_count: int, keywords: bool = False) -> dict:
+    """``pattern_count`` word-boundary phrase patterns spread over a few categories; with
+    ``keywords``, the same phrases as ``{"keywords": [...]}`` categories."""
+    rng = random.Random(f"{seed}:red_team:{pattern_count}")
+    categories: dict[str, list[str]] = {"injection": [], "toxicity": [], "competitors": []}
+    names = list(categories)
+    for index in range(pattern_count):
+        phrase = " ".join(rng.choices(_WORDS, k=2)) + f" marker{index}"
+        categories[names[index % len(names)]].append(phrase if keywords else rf"\b{phrase}\b")
+    if keywords:
+        return {name: {"keywords": phrases} for name, phrases in categories.items()}
+    return categories
+
+
+def _nested_payload(rng: random.Random, depth: int, breadth: int) -> dict:
+    root: dict = {}
+    node = root
+    for level in range(depth):
+        node["id"] = level
+        node["name"] = " ".join(rng.choices(_WORDS, k=3))
+        node["tags"] = rng.choices(_WORDS, k=breadth)
+        node["items"] = [{"sku": rng.randrange(10_000), "qty": rng.randrange(1, 9)} for _ in range(breadth)]
+        if level == depth - 1:
+            node["leaf"] = rng.randrange(1_000)
+        else:
+            node["child"] = {}
+            node = node["child"]
+    return root
+
+
+def _pii_value(rng: random.Random) -> str:
+    kind = rng.randrange(4)
+    if kind == 0:
+        return f"user{rng.randrange(10_000)}@{rng.choice(_DOMAINS)}"
+    if kind == 1:
+        return f"555-{rng.randrange(100, 1000)}-{rng.randrange(1000, 10_000)}"
+    if kind == 2:
+        return f"{rng.randrange(100, 1000)}-{rng.randrange(10, 100)}-{rng.randrange(1000, 10_000)}"
+    return _card_number(rng)
+
+
+def _card_number(rng: random.Random) -> str:
+    digits = [4] + [rng.randrange(10) for _ in range(14)]
+    checksum = 0
+    for index, digit in enumerate(reversed(digits)):
+        if index % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        checksum += digit
+    digits.append((10 - checksum % 10) % 10)
+    return "".join(str(digit) for digit in digits)
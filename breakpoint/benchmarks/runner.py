@@ -0,0 +1,150 @@
+import gc
+import math
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+
+from breakpoint.benchmarks.suite import Benchmark
+from breakpoint.engine.memo import engine_version
+
+RESULTS_FORMAT = 1
+
+# Slopes of log(time) against log(scale) over the largest points of a series; fixed
+# per-call overhead flattens the curve at small sizes, so only the tail is judged.
+_TAIL_POINTS = 3
+_CONSTANT_MAX_SLOPE = 0.3
+_LINEAR_MAX_SLOPE = 1.3
+
+
+def run_suite(
+    benchmarks: list[Benchmark],
+    repeat: int = 5,
+    min_sample_seconds: float = 0.005,
+    seed: int = 0,
+    progress=None,
+) -> dict:
+    """Time each benchmark ``repeat`` times and return the machine-readable results document."""
+    results = []
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, repeat=repeat, min_sample_seconds=min_sample_seconds)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return {
+        "format": RESULTS_FORMAT,
+        "engine_version": engine_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "seed": seed,
+        "repeat": repeat,
+        "benchmarks": results,
+        "scaling": scaling_curves(results),
+    }
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int = 5, min_sample_seconds: float = 0.005) -> dict:
+    func = benchmark.setup()
+    started = time.perf_counter()
+    func()
+    first_call = time.perf_counter() - started
+    # Fast cases are looped so each sample is long enough for the clock to resolve.
+    loops = max(1, min(100_000, math.ceil(min_sample_seconds / max(first_call, 1e-9))))
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(loops):
+                func()
+            samples.append((time.perf_counter() - started) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    samples_ms = [round(sample * 1000, 6) for sample in samples]
+    return {
+        "name": benchmark.name,
+        "family": benchmark.family,
+        "series": benchmark.series,
+        "params": benchmark.params,
+        "scale": benchmark.scale,
+        "loops": loops,
+        "samples_ms": samples_ms,
+        "median_ms": round(statistics.median(samples_ms), 6),
+        "min_ms": min(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 6),
+        "stdev_ms": round(statistics.stdev(samples_ms), 6) if len(samples_ms) > 1 else 0.0,
+    }
+
+
+def scaling_curves(results: list[dict]) -> list[dict]:
+    """Fit log-log slopes of median time against each series' scale param.
+
+    A slope near 1 is linear, near 2 quadratic; ``verdict`` is based on the tail slope.
+    """
+    series: dict[str, list[dict]] = {}
+    for result in results:
+        series.setdefault(result["series"], []).append(result)
+
+    curves = []
+    for name, members in series.items():
+        scale = members[0]["scale"]
+        points = sorted(
+            (member["params"][scale], member["median_ms"])
+            for member in members
+            if member["params"][scale] > 0 and member["median_ms"] > 0
+        )
+        if len(points) < 2:
+            continue
+        slope = _log_log_slope(points)
+        tail_slope = _log_log_slope(points[-_TAIL_POINTS:])
+        if tail_slope < _CONSTANT_MAX_SLOPE:
+            verdict = "constant"
+        elif tail_slope < _LINEAR_MAX_SLOPE:
+            verdict = "linear"
+        else:
+            verdict = "superlinear"
+        curves.append(
+            {
+                "series": name,
+                "family": members[0]["family"],
+                "scale": scale,
+                "points": [[x, y] for x, y in points],
+                "slope": round(slope, 3),
+                "tail_slope": round(tail_slope, 3),
+                "verdict": verdict,
+            }
+        )
+    return curves
+
+
+def print_results(document: dict) -> None:
+    print(f"{'benchmark':<58} {'median ms':>12} {'stdev ms':>10} {'loops':>7}")
+    for result in document["benchmarks"]:
+        print(
+            f"{result['name']:<58} {result['median_ms']:>12.4f} {result['stdev_ms']:>10.4f} {result['loops']:>7}"
+        )
+    if document["scaling"]:
+        print()
+        print("Scaling (log-log slope of median time; ~1 linear, ~2 quadratic):")
+        for curve in document["scaling"]:
+            flag = "  <-- check" if curve["verdict"] == "superlinear" else ""
+            print(
+                f"  {curve['series']} vs {curve['scale']}: slope {curve['slope']:.2f}, "
+                f"tail {curve['tail_slope']:.2f} ({curve['verdict']}){flag}"
+            )
+
+
+def _log_log_slope(points: list[tuple[float, float]]) -> float:
+    xs = [math.log(x) for x, _y in points]
+    ys = [math.log(y) for _x, y in points]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    if denominator == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
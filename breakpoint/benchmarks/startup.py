@@ -0,0 +1,95 @@
+import statistics
+import subprocess
+import sys
+from functools import lru_cache
+
+# Cumulative `-X importtime` budgets (microseconds) for a cold import in a fresh interpreter.
+# They sit well above the measured cost, so only a real regression (an eager
+# evaluator or asyncio import, say) trips them.
+STARTUP_BUDGETS_US = {
+    "breakpoint": 20_000,
+    "breakpoint.cli.main": 80_000,
+}
+
+# Modules that must stay out of `import breakpoint` and CLI startup; the code paths that need
+# them import them on first use.
+DEFERRED_MODULES = (
+    "asyncio",
+    "concurrent.futures.process",
+    "importlib.metadata",
+    "breakpoint.engine.evaluator",
+)
+
+
+def import_times(module: str, python: str = sys.executable) -> dict[str, tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter and return ``{name: (self_us, cumulative_us)}``
+    for every module that import loaded, parsed from ``-X importtime``."""
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {completed.stderr.strip().splitlines()[-1:]}")
+
+    # Interpreter startup (site, encodings) is reported too; drop what a bare interpreter loads.
+    startup = _interpreter_modules(python)
+    times: dict[str, tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header, or not an importtime line
+        name = fields[2].strip()
+        if name == module or name not in startup:
+            times[name] = (int(fields[0]), int(fields[1]))
+    if module not in times:
+        raise RuntimeError(f"-X importtime reported nothing for {module}.")
+    return times
+
+
+def check_startup(budgets: dict[str, int] | None = None, repeat: int = 5, python: str = sys.executable) -> list[dict]:
+    """Median cumulative import time per module against its budget, plus any deferred module it loaded."""
+    results = []
+    for module, budget in (STARTUP_BUDGETS_US if budgets is None else budgets).items():
+        samples = []
+        for _ in range(repeat):
+            times = import_times(module, python=python)
+            samples.append(times[module][1])
+        median = round(statistics.median(samples))
+        deferred = sorted(name for name in DEFERRED_MODULES if name in times and name != module)
+        heaviest = sorted(((name, value[0]) for name, value in times.items()), key=lambda item: -item[1])[:5]
+        results.append(
+            {
+                "module": module,
+                "samples_us": samples,
+                "median_us": median,
+                "budget_us": budget,
+                "deferred_loaded": deferred,
+                "heaviest_self_us": [[name, value] for name, value in heaviest],
+                "ok": median <= budget and not deferred,
+            }
+        )
+    return results
+
+
+def print_startup(results: list[dict]) -> None:
+    print(f"{'module':<28} {'median ms':>10} {'budget ms':>10}  status")
+    for result in results:
+        status = "ok" if result["ok"] else "OVER BUDGET"
+        if result["deferred_loaded"]:
+            status = f"loads {', '.join(result['deferred_loaded'])}"
+        print(f"{result['module']:<28} {result['median_us'] / 1000:>10.1f} {result['budget_us'] / 1000:>10.1f}  {status}")
+        heaviest = ", ".join(f"{name} {value / 1000:.1f}" for name, value in result["heaviest_self_us"])
+        print(f"  heaviest (self ms): {heaviest}")
+
+
+@lru_cache(maxsize=None)
+def _interpreter_modules(python: str) -> frozenset[str]:
+    completed = subprocess.run(
+        [python, "-c", "import sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return frozenset(completed.stdout.split())
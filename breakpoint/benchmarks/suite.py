@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable
+
+from breakpoint.benchmarks.generator import nested_json_pair, red_team_categories, synthetic_pair
+from breakpoint.engine.config import load_config
+from breakpoint.engine.evaluator import Evaluator, evaluate
+from breakpoint.engine.policies.red_team import compile_red_team_policy
+from breakpoint.engine.policies.registry import BUILTIN_POLICIES
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+PII_DENSITIES = (0.001, 0.01, 0.1)
+JSON_DEPTHS = (2, 8, 32, 128, 512)
+RED_TEAM_PATTERN_COUNTS = (3, 30, 300, 3_000, 10_000)
+RED_TEAM_TEXT_SIZE = 10_000
+# One-shot evaluate() is about per-call overhead, which larger outputs would only hide.
+ONE_SHOT_MAX_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """One timed case. ``setup()`` does the untimed work and returns the callable to time;
+    ``scale`` names the param that varies along its scaling curve."""
+
+    family: str
+    params: dict
+    scale: str
+    setup: Callable[[], Callable[[], object]]
+
+    @property
+    def name(self) -> str:
+        return f"{self.family}[{','.join(f'{key}={value}' for key, value in sorted(self.params.items()))}]"
+
+    @property
+    def series(self) -> str:
+        fixed = {key: value for key, value in self.params.items() if key != self.scale}
+        if not fixed:
+            return self.family
+        return f"{self.family}[{','.join(f'{key}={value}' for key, value in sorted(fixed.items()))}]"
+
+
+def build_suite(
+    seed: int = 0,
+    sizes: tuple[int, ...] = SIZES,
+    pii_densities: tuple[float, ...] = PII_DENSITIES,
+    json_depths: tuple[int, ...] = JSON_DEPTHS,
+    red_team_pattern_counts: tuple[int, ...] = RED_TEAM_PATTERN_COUNTS,
+) -> list[Benchmark]:
+    """Every built-in policy at each output size, PII densities, nested JSON for the output
+    contract, red-team regex and keyword counts, and end-to-end ``Evaluator.evaluate()`` and
+    one-shot ``evaluate()`` in both modes."""
+    benchmarks = []
+    for policy in BUILTIN_POLICIES:
+        for size in sizes:
+            benchmarks.append(
+                Benchmark(
+                    f"policy.{policy.name}",
+                    {"size_bytes": size},
+                    "size_bytes",
+                    partial(_policy_case, policy.name, seed, size, 0.0),
+                )
+            )
+    for density in pii_densities:
+        for size in sizes:
+            benchmarks.append(
+                Benchmark(
+                    "pii.density",
+                    {"pii_density": density, "size_bytes": size},
+                    "size_bytes",
+                    partial(_policy_case, "pii", seed, size, density),
+                )
+            )
+    for depth in json_depths:
+        benchmarks.append(
+            Benchmark("output_contract.depth", {"depth": depth}, "depth", partial(_json_case, seed, depth))
+        )
+    for family, keywords in (("red_team.patterns", False), ("red_team.keywords", True)):
+        for pattern_count in red_team_pattern_counts:
+            benchmarks.append(
+                Benchmark(
+                    family,
+                    {"patterns": pattern_count, "size_bytes": RED_TEAM_TEXT_SIZE},
+                    "patterns",
+                    partial(_red_team_case, seed, pattern_count, keywords),
+                )
+            )
+    for mode in ("lite", "full"):
+        for size in sizes:
+            benchmarks.append(
+                Benchmark(
+                    f"evaluate.{mode}",
+                    {"size_bytes": size},
+                    "size_bytes",
+                    partial(_evaluate_case, mode, seed, size),
+                )
+            )
+        for size in sizes:
+            if size <= ONE_SHOT_MAX_SIZE:
+                benchmarks.append(
+                    Benchmark(
+                        f"evaluate.{mode}.one_shot",
+                        {"size_bytes": size},
+                        "size_bytes",
+                        partial(_one_shot_case, mode, seed, size),
+                    )
+                )
+    return benchmarks
+
+
+@lru_cache(maxsize=4)
+def _pair(seed: int, size: int, pii_density: float) -> tuple[dict, dict]:
+    # Large pairs take a while to generate; families at the same size share them.
+    return synthetic_pair(seed, size, pii_density=pii_density)
+
+
+def _policy_case(name: str, seed: int, size: int, pii_density: float):
+    config = load_config()
+    policy = next(policy for policy in BUILTIN_POLICIES if policy.name == name)
+    run = policy.bind(policy.policy_config(config, "full"))
+    baseline, candidate = _pair(seed, size, pii_density)
+    return partial(run, baseline, candidate)
+
+
+def _json_case(seed: int, depth: int):
+    config = load_config()
+    policy = next(policy for policy in BUILTIN_POLICIES if policy.name == "output_contract")
+    run = policy.bind(policy.policy_config(config, "full"))
+    baseline, candidate = nested_json_pair(seed, depth)
+    return partial(run, baseline, candidate)
+
+
+def _red_team_case(seed: int, pattern_count: int, keywords: bool = False):
+    run = compile_red_team_policy({"categories": red_team_categories(seed, pattern_count, keywords)})
+    baseline, candidate = _pair(seed, RED_TEAM_TEXT_SIZE, 0.0)
+    return partial(run, baseline, candidate)
+
+
+def _evaluate_case(mode: str, seed: int, size: int):
+    evaluator = Evaluator(mode=mode)
+    baseline, candidate = _pair(seed, size, 0.0)
+    return partial(evaluator.evaluate, baseline=baseline, candidate=candidate)
+
+
+def _one_shot_case(mode: str, seed: int, size: int):
+    baseline, candidate = _pair(seed, size, 0.0)
+    return partial(evaluate, baseline=baseline, candidate=candidate, mode=mode)
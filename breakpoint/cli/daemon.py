@@ -0,0 +1,75 @@
+import json
+import os
+import socket
+
+DAEMON_SOCKET_ENV = "BREAKPOINT_DAEMON_SOCKET"
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+# A minimal HTTP/1.1 client over the socket: http.client (and the ssl/email modules it pulls in)
+# would cost more startup time than the daemon saves.
+
+
+def daemon_socket_path() -> str | None:
+    """The socket named by ``BREAKPOINT_DAEMON_SOCKET`` when it exists, else None."""
+    path = os.environ.get(DAEMON_SOCKET_ENV, "").strip()
+    if not path or not os.path.exists(path):
+        return None
+    return path
+
+
+def request_daemon(
+    path: str,
+    route: str,
+    payload: dict,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> tuple[int, dict] | None:
+    """POST ``payload`` to a ``breakpoint serve --socket`` daemon and return (HTTP status, JSON body).
+
+    Returns None when no daemon answers (nothing listening, connection dropped, timeout or a
+    malformed reply), so the caller can evaluate in-process instead.
+    """
+    body = json.dumps(payload).encode("utf-8")
+    request = (
+        f"POST {route} HTTP/1.1\r\n"
+        "Host: localhost\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    ).encode("ascii") + body
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(request)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+    return _parse_response(b"".join(chunks))
+
+
+def _parse_response(raw: bytes) -> tuple[int, dict] | None:
+    head, separator, body = raw.partition(b"\r\n\r\n")
+    if not separator:
+        return None
+    lines = head.decode("latin-1").split("\r\n")
+    status_line = lines[0].split(" ", 2)
+    if len(status_line) < 2 or not status_line[1].isdigit():
+        return None
+    for line in lines[1:]:
+        name, _colon, value = line.partition(":")
+        if name.strip().lower() == "content-length" and value.strip().isdigit():
+            if len(body) < int(value.strip()):
+                return None  # connection dropped mid-reply
+            body = body[: int(value.strip())]
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return int(status_line[1]), payload
@@ -3,16 +3,17 @@ import json
 import os
 import shutil
 import sys
+from typing import TYPE_CHECKING
 
-try:
-    from importlib.metadata import version as _pkg_version
-except ImportError:
-    _pkg_version = lambda _: "0.0.0"
-
+from breakpoint.cli.pairs import iter_pair_decisions, iter_pair_records, split_combined_input
 from breakpoint.engine.errors import ConfigValidationError
 from breakpoint.engine.config import available_presets, load_config
-from breakpoint.engine.metrics import summarize_decisions
-from breakpoint.engine.evaluator import evaluate
+
+if TYPE_CHECKING:
+    from breakpoint.engine.evaluator import Evaluator
+
+# Subcommand dependencies (the evaluator, metrics, disk cache, profiler, benchmarks) are
+# imported inside the handlers that use them so every invocation does not pay for all of them.
 
 _METRIC_DISPLAY_ORDER = [
     "cost_delta_pct",
@@ -79,23 +80,73 @@ def _red(s: str) -> str:
     return _color(s, "31")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "accept":
+        return _run_accept(args)
+    if args.command == "evaluate":
+        return _run_evaluate(args)
+    if args.command == "profile":
+        return _run_profile(args, parser)
+    if args.command == "bench" and args.bench_command == "compare":
+        return _run_bench_compare(args)
+    if args.command == "bench" and args.bench_command == "startup":
+        return _run_bench_startup(args)
+    if args.command == "bench":
+        return _run_bench(args)
+    if args.command == "serve":
+        return _run_serve(args)
+    if args.command == "config" and args.config_command == "print":
+        return _run_config_print(args)
+    if args.command == "config" and args.config_command == "presets":
+        return _run_config_presets(args)
+    if args.command == "config" and args.config_command == "compile":
+        return _run_config_compile(args)
+    if args.command == "metrics" and args.metrics_command == "summarize":
+        return _run_metrics_summarize(args)
+    return 1
+
+
+class _VersionAction(argparse.Action):
+    # importlib.metadata is slow to import, so the version is only looked up when asked for.
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            from importlib.metadata import version
+
+            installed = version("breakpoint-ai")
+        except ImportError:
+            installed = "0.0.0"
+        print(f"{parser.prog} {installed}")
+        parser.exit()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="breakpoint")
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {_pkg_version('breakpoint-ai')}",
-    )
+    parser.add_argument("--version", action=_VersionAction, help="show program's version number and exit")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     evaluate_parser = subparsers.add_parser("evaluate", help="Compare baseline and candidate.")
-    evaluate_parser.add_argument("baseline_path", help="Path to baseline JSON input.")
+    evaluate_parser.add_argument(
+        "baseline_path",
+        nargs="?",
+        default=None,
+        help="Path to baseline JSON input. Omit when using --pairs.",
+    )
     evaluate_parser.add_argument(
         "candidate_path",
         nargs="?",
         default=None,
         help="Path to candidate JSON input. If omitted, baseline_path must contain {baseline:..., candidate:...}.",
     )
+    evaluate_parser.add_argument(
+        "--pairs",
+        help="Path to a JSONL suite (one {id, baseline, candidate} object per line; '-' for stdin). "
+        "Streams one NDJSON decision per line to stdout.",
+    )
     evaluate_parser.add_argument(
         "--mode",
         choices=["lite", "full"],
@@ -103,6 +154,11 @@ def main() -> int:
         help="Execution mode: lite (default) or full.",
     )
     evaluate_parser.add_argument("--strict", action="store_true", help="Promote WARN to BLOCK.")
+    evaluate_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop running policies once the decision is certain to be BLOCK (skipped policies report ALLOW).",
+    )
     evaluate_parser.add_argument(
         "--accept-risk",
         action="append",
@@ -117,6 +173,10 @@ def main() -> int:
         help="Built-in policy preset name (merged before --config).",
     )
     evaluate_parser.add_argument("--env", help="Config environment name (for environments.<name> overrides).")
+    evaluate_parser.add_argument(
+        "--compiled",
+        help="Full mode only. Load a snapshot written by 'breakpoint config compile' instead of --config/--preset/--env.",
+    )
     evaluate_parser.add_argument("--json", action="store_true", help="Emit JSON decision output.")
     evaluate_parser.add_argument("--verbose", action="store_true", help="Show full policy results, metrics, and comparison.")
     evaluate_parser.add_argument(
@@ -129,6 +189,21 @@ def main() -> int:
         choices=["warn", "block"],
         help="Return non-zero based on threshold: warn fails on WARN/BLOCK, block fails only on BLOCK.",
     )
+    evaluate_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Record per-policy wall/CPU time and input sizes in metadata.timings.",
+    )
+    evaluate_parser.add_argument(
+        "--cache-dir",
+        help="Reuse decisions from an on-disk cache directory shared across runs (default: $BREAKPOINT_CACHE_DIR).",
+    )
+    evaluate_parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=50000,
+        help="Evict least-recently-used cache entries beyond this count (default: 50000).",
+    )
     evaluate_parser.add_argument(
         "--now",
         help="Evaluation time for waiver expiry checks (ISO-8601, e.g. 2026-02-15T00:00:00Z).",
@@ -162,6 +237,18 @@ def main() -> int:
         help="Emit compact JSON (no indentation).",
     )
     config_subparsers.add_parser("presets", help="List built-in preset names.")
+    config_compile_parser = config_subparsers.add_parser(
+        "compile",
+        help="Write a validated, integrity-checked config snapshot for 'evaluate --compiled'.",
+    )
+    config_compile_parser.add_argument("--out", required=True, help="Snapshot path to write (e.g. policy.bpc).")
+    config_compile_parser.add_argument("--config", help="Path to custom JSON config.")
+    config_compile_parser.add_argument(
+        "--preset",
+        choices=available_presets(),
+        help="Built-in policy preset name (merged before --config).",
+    )
+    config_compile_parser.add_argument("--env", help="Config environment name (for environments.<name> overrides).")
 
     metrics_parser = subparsers.add_parser("metrics", help="Compute metrics from decision JSON artifacts.")
     metrics_subparsers = metrics_parser.add_subparsers(dest="metrics_command", required=True)
@@ -179,27 +266,154 @@ def main() -> int:
     )
     metrics_summarize_parser.add_argument("--json", action="store_true", help="Emit summary as JSON.")
 
-    args = parser.parse_args()
-    if args.command == "accept":
-        return _run_accept(args)
-    if args.command == "evaluate":
-        return _run_evaluate(args)
-    if args.command == "config" and args.config_command == "print":
-        return _run_config_print(args)
-    if args.command == "config" and args.config_command == "presets":
-        return _run_config_presets(args)
-    if args.command == "metrics" and args.metrics_command == "summarize":
-        return _run_metrics_summarize(args)
-    return 1
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="Run an evaluate invocation under cProfile and tracemalloc and report hot spots.",
+        description=(
+            "Profile an evaluate invocation (single pair, bake-off directory or --pairs suite), e.g. "
+            "'breakpoint profile --pstats run.pstats evaluate --pairs cases.jsonl --mode full'."
+        ),
+    )
+    profile_parser.add_argument("--top", type=int, default=20, help="Number of hottest functions to show (default: 20).")
+    profile_parser.add_argument(
+        "--sort",
+        choices=["tottime", "cumulative", "calls"],
+        default="tottime",
+        help="Sort order for the hottest functions (default: tottime).",
+    )
+    profile_parser.add_argument("--repeat", type=int, default=1, help="Run the invocation N times (default: 1).")
+    profile_parser.add_argument("--pstats", help="Write raw cProfile stats to this .pstats file.")
+    profile_parser.add_argument(
+        "--collapsed",
+        help="Write sampled stacks in collapsed (flamegraph.pl / speedscope) format to this file.",
+    )
+    profile_parser.add_argument(
+        "--sample-interval-ms",
+        type=float,
+        default=1.0,
+        help="Stack sampling interval for --collapsed (default: 1.0).",
+    )
+    profile_parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (lower overhead).")
+    profile_parser.add_argument("--json", action="store_true", help="Emit the report as JSON.")
+    profile_parser.add_argument(
+        "evaluate_args",
+        nargs=argparse.REMAINDER,
+        help="The evaluate invocation to profile, starting with 'evaluate'.",
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Run the built-in benchmark suite on synthetic workloads.",
+        description=(
+            "Time every built-in policy and end-to-end evaluation on seeded synthetic inputs "
+            "(100 B to 10 MB outputs, PII densities, nested JSON, red-team pattern counts) and "
+            "report log-log scaling slopes."
+        ),
+    )
+    bench_parser.add_argument("--quick", action="store_true", help="Smaller sizes and fewer repeats (outputs up to 100 KB).")
+    bench_parser.add_argument("--filter", help="Only run benchmarks whose name contains this substring.")
+    bench_parser.add_argument("--repeat", type=int, help="Timed samples per benchmark (default: 5, or 3 with --quick).")
+    bench_parser.add_argument("--max-size", type=int, help="Skip output sizes above this many bytes.")
+    bench_parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic workload generator (default: 0).")
+    bench_parser.add_argument("--list", action="store_true", help="List benchmark names without running them.")
+    bench_parser.add_argument("--out", help="Write the JSON results document to this path.")
+    bench_parser.add_argument("--json", action="store_true", help="Print the JSON results document instead of a table.")
+    bench_subparsers = bench_parser.add_subparsers(dest="bench_command")
+    bench_compare_parser = bench_subparsers.add_parser(
+        "compare",
+        help="Gate two bench result files with the latency policy thresholds.",
+        description=(
+            "Compare per-benchmark medians of two 'breakpoint bench --out' files (e.g. main vs PR) through "
+            "the latency policy. Regressions whose median confidence intervals overlap are treated as noise."
+        ),
+    )
+    bench_compare_parser.add_argument("baseline_path", help="Results from the reference run (e.g. main).")
+    bench_compare_parser.add_argument("candidate_path", help="Results from the run under test.")
+    bench_compare_parser.add_argument("--config", help="Path to custom JSON config (latency_policy thresholds).")
+    bench_compare_parser.add_argument("--preset", choices=available_presets(), help="Built-in policy preset name.")
+    bench_compare_parser.add_argument("--env", help="Config environment name (for environments.<name> overrides).")
+    bench_compare_parser.add_argument("--warn-increase-pct", type=float, help="Override latency_policy.warn_increase_pct.")
+    bench_compare_parser.add_argument("--block-increase-pct", type=float, help="Override latency_policy.block_increase_pct.")
+    bench_compare_parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level of the median intervals used to discount noise (default: 0.95).",
+    )
+    bench_compare_parser.add_argument("--json", action="store_true", help="Emit JSON decision output.")
+    bench_compare_parser.add_argument(
+        "--exit-codes",
+        action="store_true",
+        help="Return non-zero exit codes for WARN/BLOCK (useful for CI).",
+    )
+    bench_compare_parser.add_argument(
+        "--fail-on",
+        choices=["warn", "block"],
+        help="Return non-zero based on threshold: warn fails on WARN/BLOCK, block fails only on BLOCK.",
+    )
+    bench_startup_parser = bench_subparsers.add_parser(
+        "startup",
+        help="Check cold import time of the library and CLI against budgets.",
+        description=(
+            "Import 'breakpoint' and the CLI in fresh interpreters under -X importtime and fail if the median "
+            "cumulative import time exceeds its budget or a deferred module (asyncio, the evaluator, ...) is loaded."
+        ),
+    )
+    bench_startup_parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module (default: 5).")
+    bench_startup_parser.add_argument("--json", action="store_true", help="Emit JSON results.")
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve evaluations over local HTTP with warm, compiled configs.",
+        description=(
+            "Long-lived evaluation server. POST /v1/evaluate and /v1/evaluate/batch return the same decision JSON "
+            "as 'evaluate --json'; GET /healthz and /v1/stats report health and engine stats. Evaluators are kept "
+            "per project key (metadata.project_key) and options in an LRU."
+        ),
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1).")
+    serve_parser.add_argument("--port", type=int, default=8750, help="Port to bind; 0 picks a free port (default: 8750).")
+    serve_parser.add_argument(
+        "--socket",
+        help="Listen on this Unix socket instead of TCP; 'breakpoint evaluate' forwards to it when "
+        "BREAKPOINT_DAEMON_SOCKET names it.",
+    )
+    serve_parser.add_argument("--mode", choices=["lite", "full"], default="lite", help="Default evaluation mode.")
+    serve_parser.add_argument("--config", help="Default JSON config path.")
+    serve_parser.add_argument("--preset", choices=available_presets(), help="Default built-in policy preset.")
+    serve_parser.add_argument("--env", help="Default config environment name.")
+    serve_parser.add_argument(
+        "--project",
+        action="append",
+        default=[],
+        metavar="KEY=CONFIG",
+        help="Evaluate requests with metadata.project_key KEY in full mode against CONFIG (repeatable).",
+    )
+    serve_parser.add_argument(
+        "--max-evaluators",
+        type=int,
+        default=32,
+        help="Warm evaluators to keep, least recently used evicted first (default: 32).",
+    )
+    serve_parser.add_argument("--max-body-mb", type=float, default=64.0, help="Largest accepted request body (default: 64).")
+    serve_parser.add_argument("--verbose", action="store_true", help="Log every request to stderr.")
+    return parser
 
 
 def _run_evaluate(args: argparse.Namespace) -> int:
+    if args.pairs is not None:
+        return _run_evaluate_pairs(args)
     try:
         _validate_evaluate_mode_flags(args)
+        if args.baseline_path is None:
+            raise ValueError("baseline_path is required unless --pairs is given.")
+        daemon_path = _daemon_socket_for(args)
+        # With a daemon to forward to, the evaluator is only built if the daemon does not answer.
+        evaluator = None if daemon_path else _build_evaluator(args)
         stdin_cache: dict[str, str] = {}
         if args.candidate_path is None:
             payload = _read_json(args.baseline_path, stdin_cache)
-            baseline_data, candidate_data = _split_combined_input(payload)
+            baseline_data, candidate_data = split_combined_input(payload)
         elif os.path.isdir(args.candidate_path):
             import glob
             files = sorted(glob.glob(os.path.join(args.candidate_path, "*.json")))
@@ -207,21 +421,16 @@ def _run_evaluate(args: argparse.Namespace) -> int:
                 print(f"ERROR: No .json files found in directory '{args.candidate_path}'.", file=sys.stderr)
                 return 1
             
+            evaluator = evaluator or _build_evaluator(args)
             baseline_data = _read_json(args.baseline_path, stdin_cache)
             results = []
             
             for fpath in files:
                 candidate_data = _read_json(fpath, stdin_cache)
-                decision = evaluate(
+                decision = evaluator.evaluate(
                     baseline=baseline_data,
                     candidate=candidate_data,
-                    strict=args.strict,
-                    mode=args.mode,
-                    config_path=args.config,
-                    config_environment=args.env,
                     metadata=_evaluation_metadata(args),
-                    preset=args.preset,
-                    accepted_risks=list(args.accept_risk),
                 )
                 results.append((fpath, decision, candidate_data))
                 
@@ -241,33 +450,18 @@ def _run_evaluate(args: argparse.Namespace) -> int:
             baseline_data = _read_json(args.baseline_path, stdin_cache)
             candidate_data = _read_json(args.candidate_path, stdin_cache)
 
-        decision = evaluate(
-            baseline=baseline_data,
-            candidate=candidate_data,
-            strict=args.strict,
-            mode=args.mode,
-            config_path=args.config,
-            config_environment=args.env,
-            metadata=_evaluation_metadata(args),
-            preset=args.preset,
-            accepted_risks=list(args.accept_risk),
-        )
-    except Exception as exc:
-        error_code = "CONFIG_VALIDATION_ERROR" if isinstance(exc, ConfigValidationError) else "INPUT_VALIDATION_ERROR"
-        if args.json:
-            print(
-                json.dumps(
-                    {
-                        "schema_version": "1.0.0",
-                        "status": "BLOCK",
-                        "reasons": [str(exc)],
-                        "reason_codes": [error_code],
-                    },
-                    indent=2,
-                )
+        decision = None
+        if daemon_path:
+            decision = _evaluate_with_daemon(daemon_path, args, baseline_data, candidate_data)
+        if decision is None:
+            evaluator = evaluator or _build_evaluator(args)
+            decision = evaluator.evaluate(
+                baseline=baseline_data,
+                candidate=candidate_data,
+                metadata=_evaluation_metadata(args),
             )
-        else:
-            print(f"ERROR: {exc}", file=sys.stderr)
+    except Exception as exc:
+        _print_evaluate_error(exc, as_json=args.json)
         return 1
 
     if args.json:
@@ -295,10 +489,294 @@ def _run_evaluate(args: argparse.Namespace) -> int:
     return exit_code
 
 
+def _run_evaluate_pairs(args: argparse.Namespace) -> int:
+    try:
+        _validate_evaluate_mode_flags(args)
+        if args.baseline_path is not None or args.candidate_path is not None:
+            raise ValueError("--pairs cannot be combined with baseline/candidate paths.")
+        evaluator = _build_evaluator(args)
+        run_metadata = _evaluation_metadata(args) or {}
+        stream = sys.stdin if args.pairs == "-" else open(args.pairs, "r", encoding="utf-8")
+    except Exception as exc:
+        _print_evaluate_error(exc, as_json=True)
+        return 1
+
+    overall_code = 0
+    with stream:
+        for payload, decision in iter_pair_decisions(evaluator, iter_pair_records(stream), run_metadata):
+            sys.stdout.write(json.dumps(payload) + "\n")
+            if decision is None:
+                code = 1
+            else:
+                code = _result_exit_code(
+                    status=decision.status,
+                    exit_codes_enabled=args.exit_codes,
+                    fail_on=args.fail_on,
+                )
+            overall_code = max(overall_code, code)
+    sys.stdout.flush()
+    return overall_code
+
+
+def _run_profile(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from breakpoint.cli.profile import print_report, profile_call, run_quietly
+
+    if not args.evaluate_args or args.evaluate_args[0] != "evaluate":
+        print("ERROR: Pass the invocation to profile, e.g. 'breakpoint profile evaluate a.json b.json'.", file=sys.stderr)
+        return 1
+    if args.top < 1 or args.repeat < 1 or args.sample_interval_ms <= 0:
+        print("ERROR: --top, --repeat and --sample-interval-ms must be positive.", file=sys.stderr)
+        return 1
+    evaluate_args = parser.parse_args(args.evaluate_args)
+
+    def run() -> int:
+        exit_code = 0
+        for _ in range(args.repeat):
+            exit_code = run_quietly(lambda: _run_evaluate(evaluate_args))
+        return exit_code
+
+    report = profile_call(
+        run,
+        memory=not args.no_memory,
+        sample_interval=args.sample_interval_ms / 1000 if args.collapsed else None,
+    )
+    if args.pstats:
+        report.stats.dump_stats(args.pstats)
+    if args.collapsed:
+        report.write_collapsed(args.collapsed)
+
+    if args.json:
+        payload = report.to_dict(args.top, args.sort)
+        payload["evaluate_exit_code"] = report.result
+        print(json.dumps(payload, indent=2))
+    else:
+        print_report(report, args.top, args.sort)
+        if args.pstats:
+            print(f"Wrote {args.pstats}")
+        if args.collapsed:
+            print(f"Wrote {args.collapsed} ({sum(report.collapsed_stacks.values())} samples)")
+    return report.result
+
+
+def _run_bench(args: argparse.Namespace) -> int:
+    from breakpoint.benchmarks.runner import print_results, run_suite
+    from breakpoint.benchmarks.suite import (
+        JSON_DEPTHS,
+        PII_DENSITIES,
+        RED_TEAM_PATTERN_COUNTS,
+        SIZES,
+        build_suite,
+    )
+
+    repeat = args.repeat if args.repeat is not None else (3 if args.quick else 5)
+    if repeat < 1:
+        print("ERROR: --repeat must be positive.", file=sys.stderr)
+        return 1
+    max_size = args.max_size if args.max_size is not None else (100_000 if args.quick else None)
+    sizes = tuple(size for size in SIZES if max_size is None or size <= max_size)
+    benchmarks = build_suite(
+        seed=args.seed,
+        sizes=sizes,
+        pii_densities=PII_DENSITIES,
+        json_depths=JSON_DEPTHS[:4] if args.quick else JSON_DEPTHS,
+        red_team_pattern_counts=RED_TEAM_PATTERN_COUNTS[:4] if args.quick else RED_TEAM_PATTERN_COUNTS,
+    )
+    if args.filter:
+        benchmarks = [benchmark for benchmark in benchmarks if args.filter in benchmark.name]
+    if args.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+    if not benchmarks:
+        print("ERROR: No benchmarks match the given filters.", file=sys.stderr)
+        return 1
+
+    def progress(result: dict) -> None:
+        print(f"{result['name']}: {result['median_ms']:.4f} ms", file=sys.stderr)
+
+    document = run_suite(benchmarks, repeat=repeat, seed=args.seed, progress=None if args.json else progress)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+            handle.write("\n")
+    if args.json:
+        print(json.dumps(document, indent=2))
+    else:
+        print_results(document)
+        if args.out:
+            print(f"Wrote {args.out}")
+    return 0
+
+
+def _run_bench_startup(args: argparse.Namespace) -> int:
+    from breakpoint.benchmarks.startup import check_startup, print_startup
+
+    if args.repeat < 1:
+        print("ERROR: --repeat must be positive.", file=sys.stderr)
+        return 1
+    try:
+        results = check_startup(repeat=args.repeat)
+    except RuntimeError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps({"results": results}, indent=2))
+    else:
+        print_startup(results)
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+def _run_bench_compare(args: argparse.Namespace) -> int:
+    from breakpoint.benchmarks.compare import compare_results
+
+    try:
+        thresholds = dict(load_config(args.config, environment=args.env, preset=args.preset).get("latency_policy", {}))
+        if args.warn_increase_pct is not None:
+            thresholds["warn_increase_pct"] = args.warn_increase_pct
+        if args.block_increase_pct is not None:
+            thresholds["block_increase_pct"] = args.block_increase_pct
+        documents = []
+        for path in (args.baseline_path, args.candidate_path):
+            with open(path, "r", encoding="utf-8") as handle:
+                documents.append(json.load(handle))
+        decision = compare_results(documents[0], documents[1], thresholds, confidence=args.confidence)
+    except (OSError, ValueError, ConfigValidationError) as exc:
+        _print_evaluate_error(exc, args.json)
+        return 1
+
+    if args.json:
+        payload = decision.to_dict()
+        payload["details"] = decision.details
+        print(json.dumps(payload, indent=2))
+    else:
+        _print_bench_comparison(decision)
+    return _result_exit_code(decision.status, exit_codes_enabled=args.exit_codes, fail_on=args.fail_on)
+
+
+def _print_bench_comparison(decision) -> None:
+    print(f"Benchmark comparison: {_status_symbol(decision.status)} {decision.status}")
+    print()
+    print(f"{'benchmark':<58} {'base ms':>11} {'cand ms':>11} {'delta':>9}  status")
+    for name, details in decision.details.items():
+        base = details.get("baseline_median_ms")
+        cand = details.get("candidate_median_ms")
+        increase = details.get("increase_pct")
+        status = details.get("status", "")
+        if details.get("within_noise"):
+            status += " (within noise)"
+        print(
+            f"{name:<58} {f'{base:.4f}' if base is not None else '-':>11} "
+            f"{f'{cand:.4f}' if cand is not None else '-':>11} "
+            f"{f'{increase:+.1f}%' if increase is not None else '-':>9}  {status}"
+        )
+    if decision.reasons:
+        print()
+        print("Reasons:")
+        for reason in decision.reasons:
+            print(f"- {reason}")
+
+
+def _build_evaluator(args: argparse.Namespace) -> "Evaluator":
+    from breakpoint.engine.disk_cache import cache_from_env
+    from breakpoint.engine.evaluator import Evaluator
+
+    compiled_config = None
+    if args.compiled:
+        from breakpoint.engine.snapshot import load_snapshot
+
+        compiled_config = load_snapshot(args.compiled)
+    return Evaluator(
+        mode=args.mode,
+        config_path=args.config,
+        config_environment=args.env,
+        preset=args.preset,
+        config=compiled_config,
+        strict=args.strict,
+        accepted_risks=list(args.accept_risk),
+        fail_fast=args.fail_fast,
+        memo=cache_from_env(args.cache_dir, max_entries=args.cache_max_entries),
+        timings=args.timings,
+    )
+
+
+def _daemon_socket_for(args: argparse.Namespace) -> str | None:
+    """The daemon socket to forward a single-pair evaluate to, or None to evaluate in-process.
+
+    --compiled, --timings and the decision cache depend on local files or per-process state, so
+    those runs stay in-process.
+    """
+    if args.compiled or args.timings:
+        return None
+    from breakpoint.cli.daemon import daemon_socket_path
+
+    if args.cache_dir or os.environ.get("BREAKPOINT_CACHE_DIR", "").strip():
+        return None
+    return daemon_socket_path()
+
+
+def _evaluate_with_daemon(path: str, args: argparse.Namespace, baseline_data: dict, candidate_data: dict):
+    """Evaluate through the daemon; None when it does not answer. Errors it reports are re-raised
+    as the exceptions in-process evaluation would raise."""
+    from breakpoint.cli.daemon import request_daemon
+    from breakpoint.engine.config import resolve_config_sources
+    from breakpoint.models.decision import Decision
+
+    # Config sources are resolved here so the daemon sees this process's BREAKPOINT_* variables
+    # and working directory, not its own.
+    preset, config_path, environment = resolve_config_sources(args.config, args.env, args.preset)
+    if config_path and not os.path.isfile(config_path):
+        return None  # the in-process error names the path as given
+    request = {
+        "baseline": baseline_data,
+        "candidate": candidate_data,
+        "metadata": _evaluation_metadata(args),
+        "include_details": True,
+        "mode": args.mode,
+        "config_path": os.path.abspath(config_path) if config_path else None,
+        "config_environment": environment,
+        "preset": preset,
+        "strict": args.strict,
+        "accepted_risks": list(args.accept_risk),
+        "fail_fast": args.fail_fast,
+    }
+    reply = request_daemon(path, "/v1/evaluate", request)
+    if reply is None:
+        return None
+    status, payload = reply
+    if status == 200:
+        return Decision(**payload)
+    reason = (payload.get("reasons") or [f"daemon returned HTTP {status}"])[0]
+    if status == 400 and payload.get("reason_codes") == ["CONFIG_VALIDATION_ERROR"]:
+        raise ConfigValidationError(reason)
+    if status == 400:
+        raise ValueError(reason)
+    return None
+
+
+def _print_evaluate_error(exc: Exception, as_json: bool) -> None:
+    error_code = "CONFIG_VALIDATION_ERROR" if isinstance(exc, ConfigValidationError) else "INPUT_VALIDATION_ERROR"
+    if as_json:
+        print(
+            json.dumps(
+                {
+                    "schema_version": "1.0.0",
+                    "status": "BLOCK",
+                    "reasons": [str(exc)],
+                    "reason_codes": [error_code],
+                },
+                indent=2,
+            )
+        )
+    else:
+        print(f"ERROR: {exc}", file=sys.stderr)
+
+
 def _validate_evaluate_mode_flags(args: argparse.Namespace) -> None:
     mode = args.mode
     if mode == "full" and args.accept_risk:
         raise ValueError("--accept-risk is only available in --mode lite.")
+    if args.compiled and (args.config or args.preset or args.env):
+        raise ValueError("--compiled already contains the merged config; drop --config/--preset/--env.")
     if mode == "lite":
         full_only_flags = []
         if args.config:
@@ -307,6 +785,8 @@ def _validate_evaluate_mode_flags(args: argparse.Namespace) -> None:
             full_only_flags.append("--preset")
         if args.env:
             full_only_flags.append("--env")
+        if args.compiled:
+            full_only_flags.append("--compiled")
         if args.now:
             full_only_flags.append("--now")
         if full_only_flags:
@@ -338,6 +818,49 @@ def _run_config_print(args: argparse.Namespace) -> int:
     return 0
 
 
+def _run_serve(args: argparse.Namespace) -> int:
+    from breakpoint.cli.serve import EvaluatorPool, make_server, make_unix_server, serve
+
+    defaults = {"mode": args.mode}
+    for key, value in (("config_path", args.config), ("preset", args.preset), ("config_environment", args.env)):
+        if value is not None:
+            defaults[key] = value
+    projects = {}
+    for item in args.project:
+        key, separator, config_path = item.partition("=")
+        if not separator or not key.strip() or not config_path:
+            print(f"ERROR: --project expects KEY=CONFIG, got '{item}'.", file=sys.stderr)
+            return 1
+        projects[key.strip()] = {"mode": "full", "config_path": config_path}
+    try:
+        pool = EvaluatorPool(max_entries=args.max_evaluators, defaults=defaults, projects=projects)
+        pool.warm()
+        max_body_bytes = int(args.max_body_mb * 1024 * 1024)
+        if args.socket:
+            server = make_unix_server(args.socket, pool, max_body_bytes=max_body_bytes, verbose=args.verbose)
+        else:
+            server = make_server(args.host, args.port, pool, max_body_bytes=max_body_bytes, verbose=args.verbose)
+    except (ValueError, OSError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    serve(server)
+    return 0
+
+
+def _run_config_compile(args: argparse.Namespace) -> int:
+    from breakpoint.engine.snapshot import write_snapshot
+
+    try:
+        snapshot = write_snapshot(args.out, args.config, environment=args.env, preset=args.preset)
+    except (OSError, ConfigValidationError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    print(f"Wrote {args.out} (engine {snapshot['engine_version']}, integrity {snapshot['integrity'][:12]})")
+    for dropped in snapshot["dropped_patterns"]:
+        print(f"Dropped invalid pattern: {dropped}", file=sys.stderr)
+    return 0
+
+
 def _run_config_presets(_args: argparse.Namespace) -> int:
     for name in available_presets():
         print(name)
@@ -345,6 +868,8 @@ def _run_config_presets(_args: argparse.Namespace) -> int:
 
 
 def _run_metrics_summarize(args: argparse.Namespace) -> int:
+    from breakpoint.engine.metrics import summarize_decisions
+
     try:
         summary = summarize_decisions(list(args.paths), installs_path=args.installs)
     except Exception as exc:
@@ -436,16 +961,6 @@ def _read_json(path: str, stdin_cache: dict[str, str]) -> dict:
         return json.load(f)
 
 
-def _split_combined_input(payload: dict) -> tuple[dict, dict]:
-    if not isinstance(payload, dict):
-        raise ValueError("Combined input must be a JSON object.")
-    baseline = payload.get("baseline")
-    candidate = payload.get("candidate")
-    if not isinstance(baseline, dict) or not isinstance(candidate, dict):
-        raise ValueError("Combined input must contain object keys 'baseline' and 'candidate'.")
-    return baseline, candidate
-
-
 def _exit_code(status: str) -> int:
     if status == "ALLOW":
         return 0
@@ -500,6 +1015,8 @@ def _print_text_decision(
         else:
             print("  No risky deltas detected.")
         print()
+        if "timings" in decision.metadata:
+            _print_timings(decision.metadata["timings"], indent="  ")
         print(f"  Exit: {exit_code}")
         print()
         return
@@ -527,9 +1044,11 @@ def _print_text_decision(
     print()
     print("Policy Results:")
     policy_statuses = _policy_status_by_reason_code(decision.reason_codes)
-    policies_to_show = _POLICY_DISPLAY_ORDER if mode == "full" else _POLICY_DISPLAY_ORDER_LITE
-    for policy in policies_to_show:
+    for policy in _policies_to_show(mode):
         pol_status = policy_statuses.get(policy, "ALLOW")
+        if decision.details.get(policy, {}).get("skipped"):
+            print(f"⚪ - {_policy_label(policy)}: Skipped (fail-fast)")
+            continue
         detail = _policy_detail_enhanced(
             policy, pol_status, decision.metrics, decision.details,
             baseline_data, candidate_data,
@@ -564,12 +1083,30 @@ def _print_text_decision(
             print(f"  • {code}")
         print()
 
+    if "timings" in decision.metadata:
+        _print_timings(decision.metadata["timings"])
+
     print(f"Recommended action: {_recommended_action(decision.status)}")
     print()
     print(f"Exit Code: {exit_code}")
     print(_SECTION_DIVIDER)
 
 
+def _print_timings(timings: dict, indent: str = "") -> None:
+    print(f"{indent}Timings (ms):")
+    for policy, entry in timings.get("policies", {}).items():
+        counters = ", ".join(
+            f"{name}={value}" for name, value in entry.items() if name not in ("wall_ms", "cpu_ms")
+        )
+        print(f"{indent}  {policy}: wall {entry['wall_ms']:.3f}, cpu {entry['cpu_ms']:.3f} ({counters})")
+    if timings.get("memo_hit"):
+        print(f"{indent}  decision served from cache")
+    for key, label in (("load_config_ms", "load_config"), ("overrides_ms", "waivers/overrides"), ("total_ms", "total")):
+        if key in timings:
+            print(f"{indent}  {label}: {timings[key]:.3f}")
+    print()
+
+
 def _print_bakeoff_summary(baseline_path: str, baseline_data: dict, results: list) -> None:
     print(_SECTION_DIVIDER)
     print("BreakPoint Multi-Candidate Bake-Off")
@@ -645,6 +1182,19 @@ def _policy_label(policy: str) -> str:
     return _POLICY_LABELS.get(policy, policy)
 
 
+def _policies_to_show(mode: str) -> list[str]:
+    """Built-ins in display order, then plugin policies for ``mode`` in registry order."""
+    from breakpoint.engine.policies.registry import registered_policies
+
+    builtins = _POLICY_DISPLAY_ORDER if mode == "full" else _POLICY_DISPLAY_ORDER_LITE
+    plugins = [
+        policy.name
+        for policy in registered_policies()
+        if policy.name not in _POLICY_DISPLAY_ORDER and mode in policy.modes
+    ]
+    return [*builtins, *plugins]
+
+
 def _policy_status_by_reason_code(reason_codes: list[str]) -> dict[str, str]:
     statuses = {policy: "ALLOW" for policy in _POLICY_DISPLAY_ORDER}
     for code in reason_codes:
@@ -661,19 +1211,9 @@ def _policy_status_by_reason_code(reason_codes: list[str]) -> dict[str, str]:
 
 
 def _policy_from_reason_code(code: str) -> str | None:
-    if code.startswith("PII_"):
-        return "pii"
-    if code.startswith("RED_TEAM_"):
-        return "red_team"
-    if code.startswith("OUTPUT_CONTRACT_"):
-        return "output_contract"
-    if code.startswith("COST_"):
-        return "cost"
-    if code.startswith("LATENCY_"):
-        return "latency"
-    if code.startswith("DRIFT_"):
-        return "drift"
-    return None
+    from breakpoint.engine.policies.registry import policy_for_reason_code
+
+    return policy_for_reason_code(code)
 
 
 def _severity_from_reason_code(code: str) -> str:
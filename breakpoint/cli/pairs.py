@@ -0,0 +1,55 @@
+import json
+
+
+def split_combined_input(payload: dict) -> tuple[dict, dict]:
+    if not isinstance(payload, dict):
+        raise ValueError("Combined input must be a JSON object.")
+    baseline = payload.get("baseline")
+    candidate = payload.get("candidate")
+    if not isinstance(baseline, dict) or not isinstance(candidate, dict):
+        raise ValueError("Combined input must contain object keys 'baseline' and 'candidate'.")
+    return baseline, candidate
+
+
+def iter_pair_records(lines):
+    """Yield (case_id, record, error) per non-blank JSONL line; record is None when error is set.
+
+    case_id falls back to the line number when the line has no 'id'/'case_id' key.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_number, None, f"Line {line_number}: invalid JSON ({exc.msg})."
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, f"Line {line_number}: each line must be a JSON object."
+            continue
+        case_id = record.get("id", record.get("case_id", line_number))
+        yield case_id, record, None
+
+
+def iter_pair_decisions(evaluator, records, run_metadata: dict):
+    """Yield (payload, decision) per record; decision is None for records that failed validation."""
+    for case_id, record, error in records:
+        if error is None:
+            try:
+                baseline, candidate = split_combined_input(record)
+                line_metadata = record.get("metadata")
+                if line_metadata is not None and not isinstance(line_metadata, dict):
+                    raise ValueError("Key 'metadata' must be a JSON object.")
+                metadata = {**(line_metadata or {}), **run_metadata}
+                decision = evaluator.evaluate(baseline=baseline, candidate=candidate, metadata=metadata)
+                yield {"case_id": case_id, **decision.to_dict()}, decision
+                continue
+            except Exception as exc:
+                error = str(exc)
+        yield {
+            "case_id": case_id,
+            "schema_version": "1.0.0",
+            "status": "BLOCK",
+            "reasons": [error],
+            "reason_codes": ["INPUT_VALIDATION_ERROR"],
+        }, None
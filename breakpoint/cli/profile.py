@@ -0,0 +1,218 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+
+from breakpoint.engine.instrumentation import observe_policies
+
+_SORT_KEYS = {"tottime": "tottime", "cumulative": "cumulative", "calls": "ncalls"}
+
+
+@dataclass
+class ProfileReport:
+    result: object
+    wall_seconds: float
+    stats: pstats.Stats
+    policy_peak_bytes: dict[str, int] = field(default_factory=dict)
+    policy_calls: dict[str, int] = field(default_factory=dict)
+    peak_bytes: int = 0
+    allocation_sites: list[tuple[str, int, int]] = field(default_factory=list)
+    collapsed_stacks: Counter = field(default_factory=Counter)
+
+    def hottest(self, limit: int, sort: str = "tottime") -> list[dict]:
+        key = _SORT_KEYS.get(sort, "tottime")
+        self.stats.sort_stats(key)
+        rows = []
+        for func in self.stats.fcn_list[:limit]:
+            primitive_calls, total_calls, tottime, cumtime, _callers = self.stats.stats[func]
+            filename, line, name = func
+            rows.append(
+                {
+                    "function": name,
+                    "location": f"{_short_path(filename)}:{line}",
+                    "ncalls": total_calls,
+                    "primitive_calls": primitive_calls,
+                    "tottime_ms": round(tottime * 1000, 3),
+                    "cumtime_ms": round(cumtime * 1000, 3),
+                }
+            )
+        return rows
+
+    def to_dict(self, limit: int, sort: str = "tottime") -> dict:
+        return {
+            "wall_ms": round(self.wall_seconds * 1000, 3),
+            "hottest": self.hottest(limit, sort),
+            "policy_peak_kib": {
+                name: round(size / 1024, 1) for name, size in sorted(self.policy_peak_bytes.items())
+            },
+            "policy_calls": dict(sorted(self.policy_calls.items())),
+            "peak_kib": round(self.peak_bytes / 1024, 1),
+            "allocation_sites": [
+                {"location": location, "kib": round(size / 1024, 1), "blocks": blocks}
+                for location, size, blocks in self.allocation_sites
+            ],
+        }
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, samples in sorted(self.collapsed_stacks.items()):
+                handle.write(f"{stack} {samples}\n")
+
+
+def profile_call(
+    func,
+    memory: bool = True,
+    sample_interval: float | None = None,
+    allocation_sites: int = 10,
+) -> ProfileReport:
+    """Run ``func()`` under cProfile (and tracemalloc when ``memory``), optionally sampling the
+    calling thread's stack every ``sample_interval`` seconds for collapsed-stack output."""
+    policy_peaks: dict[str, int] = {}
+    policy_calls: Counter = Counter()
+    absolute_peak = [0]
+    local = threading.local()
+
+    def on_start(_name: str) -> None:
+        if memory:
+            current, peak = tracemalloc.get_traced_memory()
+            absolute_peak[0] = max(absolute_peak[0], peak)
+            tracemalloc.reset_peak()
+            local.usage_at_start = current
+
+    def on_end(name: str, _result, _elapsed: float) -> None:
+        policy_calls[name] += 1
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            absolute_peak[0] = max(absolute_peak[0], peak)
+            growth = max(0, peak - getattr(local, "usage_at_start", peak))
+            policy_peaks[name] = max(policy_peaks.get(name, 0), growth)
+
+    sampler = _StackSampler(threading.get_ident(), sample_interval) if sample_interval else None
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(25)
+    profiler = cProfile.Profile()
+    overall_peak = 0
+    snapshot = None
+    started = time.perf_counter()
+    try:
+        if sampler is not None:
+            sampler.start()
+        with observe_policies(on_start, on_end):
+            if memory:
+                baseline_usage = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            profiler.enable()
+            try:
+                result = func()
+            finally:
+                profiler.disable()
+        if memory:
+            absolute_peak[0] = max(absolute_peak[0], tracemalloc.get_traced_memory()[1])
+            overall_peak = max(0, absolute_peak[0] - baseline_usage)
+            snapshot = tracemalloc.take_snapshot()
+    finally:
+        wall_seconds = time.perf_counter() - started
+        if sampler is not None:
+            sampler.stop()
+        if started_tracing:
+            tracemalloc.stop()
+
+    sites: list[tuple[str, int, int]] = []
+    if snapshot is not None:
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        for stat in snapshot.statistics("lineno")[:allocation_sites]:
+            frame = stat.traceback[0]
+            sites.append((f"{_short_path(frame.filename)}:{frame.lineno}", stat.size, stat.count))
+
+    return ProfileReport(
+        result=result,
+        wall_seconds=wall_seconds,
+        stats=pstats.Stats(profiler, stream=io.StringIO()),
+        policy_peak_bytes=policy_peaks,
+        policy_calls=dict(policy_calls),
+        peak_bytes=overall_peak,
+        allocation_sites=sites,
+        collapsed_stacks=sampler.stacks if sampler is not None else Counter(),
+    )
+
+
+def run_quietly(func):
+    """Call ``func()`` with its stdout discarded (the evaluate output is not part of the report)."""
+    with redirect_stdout(io.StringIO()):
+        return func()
+
+
+def print_report(report: ProfileReport, limit: int, sort: str) -> None:
+    print(f"Profiled run: {report.wall_seconds * 1000:.1f} ms wall")
+    print()
+    print(f"Hottest functions (by {sort}):")
+    print(f"  {'ncalls':>9} {'tottime ms':>11} {'cumtime ms':>11}  function")
+    for row in report.hottest(limit, sort):
+        print(
+            f"  {row['ncalls']:>9} {row['tottime_ms']:>11.3f} {row['cumtime_ms']:>11.3f}  "
+            f"{row['function']} ({row['location']})"
+        )
+    print()
+    if report.policy_peak_bytes:
+        print("Peak memory per policy (KiB allocated above usage when the policy started):")
+        for name, size in sorted(report.policy_peak_bytes.items(), key=lambda item: -item[1]):
+            print(f"  {name}: {size / 1024:.1f} ({report.policy_calls.get(name, 0)} runs)")
+        print()
+    if report.peak_bytes:
+        print(f"Peak traced memory during run: {report.peak_bytes / 1024:.1f} KiB")
+        print()
+    if report.allocation_sites:
+        print("Top allocation sites (still allocated at end of run):")
+        for location, size, blocks in report.allocation_sites:
+            print(f"  {size / 1024:.1f} KiB in {blocks} blocks: {location}")
+        print()
+
+
+class _StackSampler:
+    """Samples one thread's Python stack from a background thread via ``sys._current_frames()``."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="breakpoint-profile-sampler", daemon=True)
+        self.stacks: Counter = Counter()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+
+def _short_path(path: str) -> str:
+    marker = f"{os.sep}breakpoint{os.sep}"
+    index = path.rfind(marker)
+    if index != -1:
+        return path[index + 1 :]
+    return os.path.basename(path) if os.path.isabs(path) else path
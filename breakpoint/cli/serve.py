@@ -0,0 +1,352 @@
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from breakpoint.cli.pairs import iter_pair_decisions, split_combined_input
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.evaluator import Evaluator
+from breakpoint.engine.memo import engine_version
+from breakpoint.engine.policies.registry import registered_policies
+from breakpoint.engine.telemetry import stats
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8750
+DEFAULT_MAX_EVALUATORS = 32
+DEFAULT_MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# Keys that select an Evaluator; they mirror the keyword arguments of evaluate().
+EVALUATOR_OPTIONS = ("mode", "config_path", "config_environment", "preset", "strict", "accepted_risks", "fail_fast")
+# Options that name files or presets to load. Over TCP they come only from the pool's defaults and
+# projects; the owner-only Unix socket also takes them per request, for the CLI client.
+CONFIG_SOURCE_OPTIONS = ("config_path", "preset")
+REQUEST_OPTIONS = tuple(name for name in EVALUATOR_OPTIONS if name not in CONFIG_SOURCE_OPTIONS)
+
+
+class EvaluatorPool:
+    """Warm ``Evaluator`` instances keyed on project key and evaluator options, evicted least
+    recently used first.
+
+    Options are merged as ``defaults``, then ``projects[project_key]``, then the request's own.
+    Project keys that are not configured share the default entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_EVALUATORS,
+        defaults: dict | None = None,
+        projects: dict[str, dict] | None = None,
+    ) -> None:
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self.defaults = dict(defaults or {})
+        self.projects = {key: dict(options) for key, options in (projects or {}).items()}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, options: dict | None = None, project_key: str | None = None) -> Evaluator:
+        if project_key not in self.projects:
+            project_key = None
+        resolved = {**self.defaults, **self.projects.get(project_key, {}), **(options or {})}
+        unknown = sorted(set(resolved) - set(EVALUATOR_OPTIONS))
+        if unknown:
+            raise ValueError(f"Unknown evaluator option(s): {', '.join(unknown)}.")
+        for name in ("strict", "fail_fast"):
+            if not isinstance(resolved.get(name, False), bool):
+                raise ValueError(f"'{name}' must be a boolean.")
+        accepted_risks = resolved.get("accepted_risks")
+        if accepted_risks is not None:
+            if not isinstance(accepted_risks, list) or not all(isinstance(risk, str) for risk in accepted_risks):
+                raise ValueError("'accepted_risks' must be a list of strings.")
+            # Normalized the way the evaluator reads them, so spellings of one set share an entry.
+            resolved["accepted_risks"] = sorted({risk.strip().lower() for risk in accepted_risks if risk.strip()})
+        key = (project_key,) + tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (resolved.get(name) for name in EVALUATOR_OPTIONS)
+        )
+
+        with self._lock:
+            evaluator = self._entries.get(key)
+            if evaluator is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return evaluator
+            self.misses += 1
+        # Built outside the lock so a slow config load does not stall other projects; two
+        # threads racing on one key only waste a build.
+        evaluator = Evaluator(**resolved)
+        with self._lock:
+            evaluator = self._entries.setdefault(key, evaluator)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return evaluator
+
+    def warm(self) -> None:
+        """Build the default evaluator and one per configured project, surfacing config errors early."""
+        self.get()
+        for project_key in self.projects:
+            self.get(project_key=project_key)
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class EvaluationServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_config_sources = False
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        pool: EvaluatorPool,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        verbose: bool = False,
+    ) -> None:
+        super().__init__(address, EvaluationRequestHandler)
+        self.pool = pool
+        self.max_body_bytes = max_body_bytes
+        self.verbose = verbose
+        self.started = time.monotonic()
+
+
+class UnixEvaluationServer(socketserver.ThreadingUnixStreamServer):
+    """The same endpoints over a Unix domain socket, for the ``BREAKPOINT_DAEMON_SOCKET`` CLI client.
+
+    The socket is readable by its owner only, so requests may also name ``CONFIG_SOURCE_OPTIONS``.
+    """
+
+    daemon_threads = True
+    request_config_sources = True
+
+    def __init__(
+        self,
+        path: str,
+        pool: EvaluatorPool,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        verbose: bool = False,
+    ) -> None:
+        _remove_stale_socket(path)
+        super().__init__(path, EvaluationRequestHandler)
+        os.chmod(path, 0o600)
+        self.pool = pool
+        self.max_body_bytes = max_body_bytes
+        self.verbose = verbose
+        self.started = time.monotonic()
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+
+class EvaluationRequestHandler(BaseHTTPRequestHandler):
+    """JSON endpoints:
+
+    - ``POST /v1/evaluate``: ``{"baseline", "candidate", "metadata"?, "include_details"?, <options>}`` ->
+      ``Decision.to_dict()``, plus ``details`` when ``include_details`` is true
+    - ``POST /v1/evaluate/batch``: ``{"pairs": [{"id"?, "baseline", "candidate", "metadata"?}], "metadata"?,
+      <options>}`` -> ``{"decisions": [...]}``, one ``{"case_id", ...}`` record per pair as in ``--pairs``
+    - ``GET /healthz`` and ``GET /v1/stats`` (``breakpoint.engine.stats()`` plus the evaluator pool)
+
+    ``<options>`` are the ``REQUEST_OPTIONS`` keys (``EVALUATOR_OPTIONS`` over the Unix socket);
+    ``metadata.project_key`` selects a configured project.
+    """
+
+    server: "EvaluationServer | UnixEvaluationServer"
+    server_version = "breakpoint"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/healthz":
+            self._send(
+                HTTPStatus.OK,
+                {
+                    "status": "ok",
+                    "engine_version": engine_version(),
+                    "uptime_s": round(time.monotonic() - self.server.started, 3),
+                },
+            )
+        elif self.path == "/v1/stats":
+            self._send(HTTPStatus.OK, {**stats().to_dict(), "evaluators": self.server.pool.info()})
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"No route for GET {self.path}."})
+
+    def do_POST(self) -> None:
+        routes = {"/v1/evaluate": self._evaluate, "/v1/evaluate/batch": self._evaluate_batch}
+        route = routes.get(self.path)
+        if route is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"No route for POST {self.path}."})
+            return
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self._send(HTTPStatus.LENGTH_REQUIRED, {"error": "Content-Length is required."})
+            return
+        if int(length) > self.server.max_body_bytes:
+            self._send(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body is too large."})
+            self.close_connection = True
+            return
+        try:
+            body = json.loads(self.rfile.read(int(length)))
+            if not isinstance(body, dict):
+                raise ValueError("Request body must be a JSON object.")
+            payload = route(body)
+        except (ValueError, TypeError) as exc:
+            self._send(HTTPStatus.BAD_REQUEST, _error_payload(exc))
+            return
+        except Exception as exc:
+            # The message may describe server-side files; it goes to the log, not the client.
+            self.log_error("%s: %s", type(exc).__name__, exc)
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, _error_payload(RuntimeError("Internal server error.")))
+            return
+        self._send(HTTPStatus.OK, payload)
+
+    def _evaluate(self, body: dict) -> dict:
+        baseline, candidate = split_combined_input(body)
+        metadata = _metadata(body)
+        evaluator = self.server.pool.get(_options(body, self.server.request_config_sources), _project_key(metadata))
+        decision = evaluator.evaluate(baseline=baseline, candidate=candidate, metadata=metadata)
+        if body.get("include_details") is True:
+            return {**decision.to_dict(), "details": decision.details}
+        return decision.to_dict()
+
+    def _evaluate_batch(self, body: dict) -> dict:
+        pairs = body.get("pairs")
+        if not isinstance(pairs, list):
+            raise ValueError("Key 'pairs' must be a list.")
+        metadata = _metadata(body) or {}
+        evaluator = self.server.pool.get(_options(body, self.server.request_config_sources), _project_key(metadata))
+        records = []
+        for index, item in enumerate(pairs, start=1):
+            if isinstance(item, dict):
+                records.append((item.get("id", item.get("case_id", index)), item, None))
+            else:
+                records.append((index, None, f"Pair {index}: each pair must be a JSON object."))
+        return {"decisions": [payload for payload, _decision in iter_pair_decisions(evaluator, records, metadata)]}
+
+    def _send(self, status: HTTPStatus, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address.
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    pool: EvaluatorPool | None = None,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    verbose: bool = False,
+) -> EvaluationServer:
+    return EvaluationServer((host, port), pool or EvaluatorPool(), max_body_bytes=max_body_bytes, verbose=verbose)
+
+
+def make_unix_server(
+    path: str,
+    pool: EvaluatorPool | None = None,
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    verbose: bool = False,
+) -> UnixEvaluationServer:
+    return UnixEvaluationServer(path, pool or EvaluatorPool(), max_body_bytes=max_body_bytes, verbose=verbose)
+
+
+def serve(server: "EvaluationServer | UnixEvaluationServer") -> None:
+    if isinstance(server, UnixEvaluationServer):
+        location = f"unix:{server.server_address}"
+    else:
+        host, port = server.server_address[:2]
+        location = f"http://{host}:{port}"
+    print(f"breakpoint serve: listening on {location} (engine {engine_version()})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("breakpoint serve: shutting down", file=sys.stderr)
+    finally:
+        server.server_close()
+
+
+def _remove_stale_socket(path: str) -> None:
+    # A socket file left by a daemon that died is removed; one that still answers is not.
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"A daemon is already listening on {path}.")
+
+
+def _options(body: dict, config_sources: bool) -> dict:
+    if config_sources:
+        return {name: body[name] for name in EVALUATOR_OPTIONS if name in body}
+    for name in CONFIG_SOURCE_OPTIONS:
+        if body.get(name) is not None:
+            raise ValueError(f"'{name}' cannot be set per request; configure it with --config, --preset or --project.")
+    options = {name: body[name] for name in REQUEST_OPTIONS if name in body}
+    accepted_risks = options.get("accepted_risks")
+    if isinstance(accepted_risks, list):
+        known = {policy.name for policy in registered_policies()}
+        names = {risk.strip().lower() for risk in accepted_risks if isinstance(risk, str) and risk.strip()}
+        unknown = sorted(names - known)
+        if unknown:
+            raise ValueError(f"Unknown accepted risk(s): {', '.join(unknown)}.")
+    return options
+
+
+def _metadata(body: dict) -> dict | None:
+    metadata = body.get("metadata")
+    if metadata is not None and not isinstance(metadata, dict):
+        raise ValueError("Key 'metadata' must be a JSON object.")
+    return metadata
+
+
+def _project_key(metadata: dict | None) -> str | None:
+    project_key = (metadata or {}).get("project_key")
+    if isinstance(project_key, str) and project_key.strip():
+        return project_key.strip()
+    return None
+
+
+def _error_payload(exc: Exception) -> dict:
+    # Same shape as `breakpoint evaluate --json` errors.
+    if isinstance(exc, ConfigValidationError):
+        error_code = "CONFIG_VALIDATION_ERROR"
+    elif isinstance(exc, (ValueError, TypeError)):
+        error_code = "INPUT_VALIDATION_ERROR"
+    else:
+        error_code = "INTERNAL_ERROR"
+    return {"schema_version": "1.0.0", "status": "BLOCK", "reasons": [str(exc)], "reason_codes": [error_code]}
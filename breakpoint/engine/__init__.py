@@ -1,3 +1,59 @@
-from breakpoint.engine.evaluator import evaluate
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["evaluate"]
+if TYPE_CHECKING:
+    from breakpoint.engine.config import FrozenDict, FrozenList, invalidate_config_cache, load_config
+    from breakpoint.engine.disk_cache import DiskDecisionCache
+    from breakpoint.engine.evaluator import (
+        Evaluator,
+        aevaluate,
+        aevaluate_many,
+        evaluate,
+        evaluate_many,
+        iter_evaluate_many,
+    )
+    from breakpoint.engine.instrumentation import on_decision, on_policy_end, on_policy_start, remove_hook
+    from breakpoint.engine.memo import DecisionMemo, PolicyResultCache
+    from breakpoint.engine.streaming import StreamGuard
+    from breakpoint.engine.telemetry import EngineStats, reset_stats, stats
+
+# Resolved on first access (see breakpoint/__init__.py); importing a submodule such as
+# breakpoint.engine.config must not pull in the evaluator and every policy.
+_EXPORTS = {
+    "DecisionMemo": "breakpoint.engine.memo",
+    "DiskDecisionCache": "breakpoint.engine.disk_cache",
+    "EngineStats": "breakpoint.engine.telemetry",
+    "Evaluator": "breakpoint.engine.evaluator",
+    "FrozenDict": "breakpoint.engine.config",
+    "FrozenList": "breakpoint.engine.config",
+    "PolicyResultCache": "breakpoint.engine.memo",
+    "StreamGuard": "breakpoint.engine.streaming",
+    "aevaluate": "breakpoint.engine.evaluator",
+    "aevaluate_many": "breakpoint.engine.evaluator",
+    "evaluate": "breakpoint.engine.evaluator",
+    "evaluate_many": "breakpoint.engine.evaluator",
+    "invalidate_config_cache": "breakpoint.engine.config",
+    "iter_evaluate_many": "breakpoint.engine.evaluator",
+    "load_config": "breakpoint.engine.config",
+    "on_decision": "breakpoint.engine.instrumentation",
+    "on_policy_end": "breakpoint.engine.instrumentation",
+    "on_policy_start": "breakpoint.engine.instrumentation",
+    "remove_hook": "breakpoint.engine.instrumentation",
+    "reset_stats": "breakpoint.engine.telemetry",
+    "stats": "breakpoint.engine.telemetry",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
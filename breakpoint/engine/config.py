@@ -1,31 +1,141 @@
 import json
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from importlib import resources
 
 from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.policies.budget import BUDGET_ACTIONS
+from breakpoint.engine.policies.detectors import DETECTORS
+from breakpoint.engine.telemetry import record_cache, record_config_load
 from breakpoint.engine.waivers import parse_waivers
 
+_CACHE_SIZE = 64
+_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class FrozenDict(dict):
+    """Read-only dict returned by ``load_config()``; the same instance is shared by every caller.
+
+    It is still a ``dict`` (``isinstance`` checks and ``json.dumps`` work). ``dict(config)`` gives a
+    mutable shallow copy and ``copy.deepcopy(config)`` a fully mutable one.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config returned by load_config() is read-only; use copy.deepcopy() to modify it.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {key: _thaw(value, memo) for key, value in self.items()}
+
+
+class FrozenList(list):
+    """Read-only list counterpart of ``FrozenDict``."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config returned by load_config() is read-only; use copy.deepcopy() to modify it.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [_thaw(value, memo) for value in self]
+
 
 def load_config(
     config_path: str | None = None,
     environment: str | None = None,
     preset: str | None = None,
+) -> dict:
+    """Return the effective config as a read-only ``FrozenDict``.
+
+    Results are memoized on the resolved preset, config path (with its mtime and size),
+    environment name and the ``BREAKPOINT_*`` variables they fall back to, so repeated calls
+    skip parsing and validation. ``invalidate_config_cache()`` forgets them.
+    """
+    chosen_preset, chosen_path, chosen_environment = resolve_config_sources(config_path, environment, preset)
+    key = _cache_key(chosen_preset, chosen_path, chosen_environment)
+    if key is not None:
+        with _cache_lock:
+            cached = _cache.get(key)
+            if cached is not None:
+                _cache.move_to_end(key)
+        record_cache("config", cached is not None)
+        if cached is not None:
+            return cached
+
+    config = _freeze(_load_config_uncached(chosen_preset, chosen_path, chosen_environment))
+    record_config_load()
+    if key is not None:
+        with _cache_lock:
+            _cache[key] = config
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    return config
+
+
+def resolve_config_sources(
+    config_path: str | None = None,
+    environment: str | None = None,
+    preset: str | None = None,
+) -> tuple[str | None, str | None, str | None]:
+    """(preset, config path, environment) after falling back to the ``BREAKPOINT_*`` variables."""
+    return (
+        preset or os.getenv("BREAKPOINT_PRESET"),
+        config_path or os.getenv("BREAKPOINT_CONFIG"),
+        environment or os.getenv("BREAKPOINT_ENV"),
+    )
+
+
+def invalidate_config_cache() -> None:
+    """Drop memoized configs, e.g. after editing a config file within the same mtime tick."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _cache_key(preset: str | None, path: str | None, environment: str | None) -> tuple | None:
+    file_key = None
+    if path:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Let the uncached load report the error.
+            return None
+        file_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    return (preset, file_key, environment)
+
+
+def _load_config_uncached(
+    chosen_preset: str | None,
+    chosen_path: str | None,
+    chosen_environment: str | None,
 ) -> dict:
     try:
         default_config = _load_default_config()
         merged_config = default_config
 
-        chosen_preset = preset or os.getenv("BREAKPOINT_PRESET")
         if chosen_preset:
             merged_config = _deep_merge(merged_config, _load_preset_config(chosen_preset))
 
-        chosen_path = config_path or os.getenv("BREAKPOINT_CONFIG")
         if chosen_path:
             with open(chosen_path, "r", encoding="utf-8") as f:
                 custom = json.load(f)
             merged_config = _deep_merge(merged_config, custom)
 
-        chosen_environment = environment or os.getenv("BREAKPOINT_ENV")
         if chosen_environment:
             merged_config = _apply_environment_overrides(merged_config, chosen_environment)
         else:
@@ -40,6 +150,20 @@ def load_config(
         raise ConfigValidationError(str(exc)) from exc
 
 
+def _freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value, memo: dict):
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value.__deepcopy__(memo)
+    return value
+
+
 def _load_default_config() -> dict:
     package = "breakpoint.config"
     resource = resources.files(package).joinpath("default_policies.json")
@@ -48,13 +172,19 @@ def _load_default_config() -> dict:
 
 
 def available_presets() -> list[str]:
+    return list(_preset_names())
+
+
+@lru_cache(maxsize=1)
+def _preset_names() -> tuple[str, ...]:
+    # Presets ship inside the package, so one directory scan per process is enough.
     package = "breakpoint.config.presets"
     base = resources.files(package)
     names: list[str] = []
     for child in base.iterdir():
         if child.is_file() and child.name.endswith(".json"):
             names.append(child.name[:-5])
-    return sorted(names)
+    return tuple(sorted(names))
 
 
 def _load_preset_config(name: str) -> dict:
@@ -108,6 +238,7 @@ def _validate_config(config: dict) -> None:
     _validate_policy_thresholds(config, policy="latency_policy")
     _validate_drift_thresholds(config)
     _validate_output_contract_policy(config)
+    _validate_pii_policy(config)
     _validate_red_team_policy(config)
     _validate_strict_mode(config)
     parse_waivers(config.get("waivers"))
@@ -198,6 +329,26 @@ def _validate_output_contract_policy(config: dict) -> None:
             raise ConfigValidationError(f"Config key 'output_contract_policy.{key}' must be boolean.")
 
 
+def _validate_pii_policy(config: dict) -> None:
+    policy = config.get("pii_policy", {})
+    if not isinstance(policy, dict):
+        raise ConfigValidationError("Config key 'pii_policy' must be a JSON object.")
+
+    patterns = policy.get("patterns", {})
+    if not isinstance(patterns, dict):
+        raise ConfigValidationError("Config key 'pii_policy.patterns' must be a JSON object.")
+    for label, pattern in patterns.items():
+        if isinstance(pattern, str):
+            continue
+        if isinstance(pattern, dict) and set(pattern) == {"detector"} and pattern["detector"] in DETECTORS:
+            continue
+        raise ConfigValidationError(
+            f"Config key 'pii_policy.patterns.{label}' must be a regex string or "
+            f"{{\"detector\": name}} with one of: {', '.join(sorted(DETECTORS))}."
+        )
+    _validate_regex_budget("pii_policy", policy.get("regex_budget"))
+
+
 def _validate_red_team_policy(config: dict) -> None:
     policy = config.get("red_team_policy", {})
     if not isinstance(policy, dict):
@@ -212,10 +363,51 @@ def _validate_red_team_policy(config: dict) -> None:
         raise ConfigValidationError("Config key 'red_team_policy.categories' must be a JSON object.")
         
     for name, patterns in categories.items():
+        if isinstance(patterns, dict):
+            _validate_red_team_category(name, patterns)
+            continue
         if not isinstance(patterns, list):
-            raise ConfigValidationError(f"Config key 'red_team_policy.categories.{name}' must be a list of strings.")
+            raise ConfigValidationError(
+                f"Config key 'red_team_policy.categories.{name}' must be a list of strings "
+                "or an object with 'patterns' and/or 'keywords'."
+            )
         if not all(isinstance(pattern, str) for pattern in patterns):
             raise ConfigValidationError(f"Config key 'red_team_policy.categories.{name}' must be a list of strings.")
+    _validate_regex_budget("red_team_policy", policy.get("regex_budget"))
+
+
+def _validate_red_team_category(name: str, category: dict) -> None:
+    unknown = sorted(set(category) - {"patterns", "keywords"})
+    if unknown:
+        raise ConfigValidationError(
+            f"Config key 'red_team_policy.categories.{name}' has unknown key(s): {', '.join(unknown)}."
+        )
+    for key in ("patterns", "keywords"):
+        items = category.get(key, [])
+        if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+            raise ConfigValidationError(f"Config key 'red_team_policy.categories.{name}.{key}' must be a list of strings.")
+    if not all(keyword.strip() for keyword in category.get("keywords", [])):
+        raise ConfigValidationError(f"Config key 'red_team_policy.categories.{name}.keywords' must not contain empty strings.")
+
+
+def _validate_regex_budget(policy: str, budget) -> None:
+    if budget is None:
+        return
+    key = f"{policy}.regex_budget"
+    if not isinstance(budget, dict):
+        raise ConfigValidationError(f"Config key '{key}' must be a JSON object.")
+    unknown = sorted(set(budget) - {"pattern_ms", "policy_ms", "action"})
+    if unknown:
+        raise ConfigValidationError(f"Config key '{key}' has unknown key(s): {', '.join(unknown)}.")
+    for name in ("pattern_ms", "policy_ms"):
+        value = budget.get(name)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0):
+            raise ConfigValidationError(f"Config key '{key}.{name}' must be a positive number of milliseconds.")
+    if budget.get("pattern_ms") is None and budget.get("policy_ms") is None:
+        raise ConfigValidationError(f"Config key '{key}' must set 'pattern_ms' and/or 'policy_ms'.")
+    if budget.get("action", "BLOCK") not in BUDGET_ACTIONS:
+        raise ConfigValidationError(f"Config key '{key}.action' must be one of: {', '.join(BUDGET_ACTIONS)}.")
+
 
 def _validate_strict_mode(config: dict) -> None:
     policy = config.get("strict_mode", {})
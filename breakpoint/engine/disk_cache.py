@@ -0,0 +1,239 @@
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+
+from breakpoint.engine.memo import MemoStats, engine_fingerprint, engine_version
+from breakpoint.engine.waivers import Waiver
+from breakpoint.models.decision import Decision
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+CACHE_DIR_ENV = "BREAKPOINT_CACHE_DIR"
+
+_ENTRY_FORMAT = 1
+_GC_INTERVAL = 256
+_STALE_TEMP_SECONDS = 3600
+
+
+class DiskDecisionCache:
+    """Content-addressed decision cache in a directory that many processes can share.
+
+    A drop-in for ``DecisionMemo`` (``Evaluator(memo=DiskDecisionCache(path))``). Entries live at
+    ``<dir>/<key[:2]>/<key>.json`` and are written atomically (temp file + ``os.replace``), so
+    readers never see partial files. Keys already include the config and engine-version
+    fingerprints; entries written by another engine version are treated as misses. Reads
+    refresh an entry's mtime, and ``gc()`` removes least-recently-used entries beyond
+    ``max_entries`` / ``max_bytes`` under an exclusive lock (POSIX only).
+    """
+
+    def __init__(self, directory: str, max_entries: int | None = None, max_bytes: int | None = None) -> None:
+        for name, value in (("max_entries", max_entries), ("max_bytes", max_bytes)):
+            if value is not None and (not isinstance(value, int) or value < 1):
+                raise ValueError(f"{name} must be a positive integer.")
+        self.directory = os.path.abspath(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str):
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                entry = json.load(handle)
+            value = _decode_entry(entry)
+        except (OSError, ValueError, KeyError, TypeError):
+            value = None
+
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if value is not None:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def put(self, key: str, value) -> None:
+        path = self._entry_path(key)
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+        raw = json.dumps(_encode_entry(value), sort_keys=True, separators=(",", ":"))
+
+        with self._dir_lock(exclusive=False):
+            fd, tmp_path = tempfile.mkstemp(dir=shard, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    handle.write(raw)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+        # Short-lived CLI processes write only a few entries each, so collect on a random
+        # ~1/_GC_INTERVAL of writes rather than every Nth write of one process.
+        if (self.max_entries is not None or self.max_bytes is not None) and random.random() * _GC_INTERVAL < 1:
+            self.gc()
+
+    def gc(self, max_entries: int | None = None, max_bytes: int | None = None) -> int:
+        """Delete least-recently-used entries until both limits hold; return how many were removed."""
+        max_entries = self.max_entries if max_entries is None else max_entries
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        with self._dir_lock(exclusive=True):
+            entries = []
+            now = time.time()
+            for path, stat in self._iter_files():
+                if os.path.basename(path).startswith(".tmp-"):
+                    if now - stat.st_mtime > _STALE_TEMP_SECONDS:
+                        _unlink_quietly(path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            entries.sort()
+            total_bytes = sum(size for _mtime, size, _path in entries)
+            count = len(entries)
+            for _mtime, size, path in entries:
+                over_entries = max_entries is not None and count > max_entries
+                over_bytes = max_bytes is not None and total_bytes > max_bytes
+                if not (over_entries or over_bytes):
+                    break
+                if _unlink_quietly(path):
+                    removed += 1
+                count -= 1
+                total_bytes -= size
+
+        with self._lock:
+            self._evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._dir_lock(exclusive=True):
+            for path, _stat in self._iter_files():
+                _unlink_quietly(path)
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> MemoStats:
+        size = sum(1 for path, _stat in self._iter_files() if not os.path.basename(path).startswith(".tmp-"))
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=size,
+                max_size=self.max_entries or 0,
+            )
+
+    def __len__(self) -> int:
+        return self.stats().size
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> str:
+        if len(key) < 3 or not key.isalnum():
+            raise ValueError("Cache keys must be alphanumeric fingerprints.")
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _iter_files(self):
+        try:
+            shards = sorted(os.scandir(self.directory), key=lambda item: item.name)
+        except OSError:
+            return
+        for shard in shards:
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            try:
+                files = list(os.scandir(shard.path))
+            except OSError:
+                continue
+            for item in files:
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    yield item.path, item.stat()
+                except OSError:
+                    continue
+
+    @contextmanager
+    def _dir_lock(self, exclusive: bool):
+        # Writers share the lock; gc/clear take it exclusively so they never race a rename.
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, ".lock"), "a+") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def cache_from_env(directory: str | None = None, max_entries: int | None = None) -> DiskDecisionCache | None:
+    """Return a cache for ``directory`` (or ``$BREAKPOINT_CACHE_DIR``), or None when neither is set."""
+    directory = directory or os.environ.get(CACHE_DIR_ENV, "").strip() or None
+    if directory is None:
+        return None
+    return DiskDecisionCache(directory, max_entries=max_entries)
+
+
+def _encode_entry(value) -> dict:
+    decision, applied_waivers = value
+    return {
+        "format": _ENTRY_FORMAT,
+        "engine_version": engine_version(),
+        "engine": engine_fingerprint(),
+        "decision": {
+            "schema_version": decision.schema_version,
+            "status": decision.status,
+            "reasons": decision.reasons,
+            "reason_codes": decision.reason_codes,
+            "metrics": decision.metrics,
+            "details": decision.details,
+        },
+        "waivers_applied": [asdict(waiver) for waiver in applied_waivers],
+    }
+
+
+def _decode_entry(entry: dict):
+    if entry.get("format") != _ENTRY_FORMAT or entry.get("engine_version") != engine_version():
+        return None
+    if entry.get("engine") != engine_fingerprint():
+        return None
+    decision = Decision(**entry["decision"])
+    applied_waivers = [Waiver(**item) for item in entry["waivers_applied"]]
+    return decision, applied_waivers
+
+
+def _unlink_quietly(path: str) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
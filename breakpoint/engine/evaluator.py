@@ -1,11 +1,21 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Callable
+
 from breakpoint.engine.aggregator import aggregate_policy_results
 from breakpoint.engine.config import load_config
-from breakpoint.engine.policies.cost import evaluate_cost_policy
-from breakpoint.engine.policies.drift import evaluate_drift_policy
-from breakpoint.engine.policies.latency import evaluate_latency_policy
-from breakpoint.engine.policies.output_contract import evaluate_output_contract_policy
-from breakpoint.engine.policies.pii import evaluate_pii_policy
-from breakpoint.engine.policies.red_team import evaluate_red_team_policy
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.instrumentation import collect_counters, count, decision_observers, policy_observers
+from breakpoint.engine.memo import DecisionMemo, PolicyResultCache, input_digest, memo_key, policy_result_key
+from breakpoint.engine.metrics import decision_fingerprint
+from breakpoint.engine.policies.base import PolicyResult
+from breakpoint.engine.policies.registry import policies_for_mode, registered_policies
+from breakpoint.engine.telemetry import record_cache, record_decision, record_policy
 from breakpoint.engine.waivers import (
     Waiver,
     apply_waivers_to_policy_results,
@@ -14,6 +24,340 @@ from breakpoint.engine.waivers import (
 )
 from breakpoint.models.decision import Decision
 
+if TYPE_CHECKING:
+    # asyncio, the executor pools and the disk cache are imported where they are used; they
+    # dominate import time and most callers only evaluate synchronously.
+    import asyncio
+    from concurrent.futures import Executor
+
+    from breakpoint.engine.disk_cache import DiskDecisionCache
+
+
+# One-shot evaluate() keeps this many compiled evaluators, least recently used evicted first.
+_SHARED_EVALUATORS = 16
+_shared_evaluators: OrderedDict = OrderedDict()
+_shared_evaluators_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _BoundPolicy:
+    name: str
+    run: Callable[[dict, dict], PolicyResult]
+    inputs: tuple[tuple[str, str], ...]
+    config: object
+    cost: float
+
+
+class Evaluator:
+    """Evaluates baseline/candidate pairs against a config that is loaded and compiled once.
+
+    Build one per mode/config/preset/environment and reuse it; ``evaluate()`` keeps a small
+    LRU of instances keyed on its options, so one-shot calls are compiled once as well.
+    """
+
+    def __init__(
+        self,
+        mode: str = "lite",
+        config_path: str | None = None,
+        config_environment: str | None = None,
+        preset: str | None = None,
+        strict: bool = False,
+        accepted_risks: list[str] | None = None,
+        fail_fast: bool = False,
+        memo: "DecisionMemo | DiskDecisionCache | None" = None,
+        policy_cache: PolicyResultCache | None = None,
+        timings: bool = False,
+        config: dict | None = None,
+    ) -> None:
+        self.mode = _normalize_mode(mode)
+        started = time.perf_counter()
+        if config is not None:
+            # A pre-built effective config, e.g. from load_snapshot(); used as-is.
+            if config_path is not None or config_environment is not None or preset is not None:
+                raise ConfigValidationError("Pass either config or config_path/config_environment/preset, not both.")
+            self.config = config
+        else:
+            self.config = load_config(config_path, environment=config_environment, preset=preset)
+        self._load_config_ms = _elapsed_ms(started)
+        strict_effective = bool(strict)
+        if self.mode == "full":
+            strict_effective = strict_effective or bool(self.config.get("strict_mode", {}).get("enabled", False))
+        self.strict = strict_effective
+        self.accepted_risks = accepted_risks
+        self.fail_fast = bool(fail_fast)
+        self.memo = memo
+        self.policy_cache = policy_cache
+        self.timings = bool(timings)
+
+        config = self.config
+        self._config_fingerprint: str | None = None
+        # Policies keep registry order (built-ins, then plugins by name) for deterministic output,
+        # but run cheapest first.
+        policies = []
+        for policy in policies_for_mode(self.mode):
+            policy_config = policy.policy_config(config, self.mode)
+            policies.append(
+                _BoundPolicy(
+                    name=policy.name,
+                    run=policy.bind(policy_config),
+                    inputs=tuple(tuple(item) for item in policy.inputs),
+                    config=policy_config,
+                    cost=policy.cost,
+                )
+            )
+        self._policies = tuple(policies)
+        self._execution_order = tuple(sorted(policies, key=lambda policy: policy.cost))
+        self._policy_fingerprints = (
+            {policy.name: decision_fingerprint({"config": policy.config}) for policy in self._policies}
+            if policy_cache is not None
+            else {}
+        )
+        self._waivers = parse_waivers(config.get("waivers")) if self.mode == "full" else []
+
+    def evaluate(
+        self,
+        baseline_output: str | None = None,
+        candidate_output: str | None = None,
+        metadata: dict | None = None,
+        baseline: dict | None = None,
+        candidate: dict | None = None,
+    ) -> Decision:
+        metadata_input = metadata or {}
+        baseline_record, candidate_record = _normalize_inputs(
+            baseline_output=baseline_output,
+            candidate_output=candidate_output,
+            metadata=metadata_input,
+            baseline=baseline,
+            candidate=candidate,
+        )
+
+        timings = self._new_timings() if self.timings else None
+        aggregated, applied_waivers = self._decide(baseline_record, candidate_record, metadata_input, timings)
+        metadata_payload = _decision_metadata(
+            baseline_record,
+            candidate_record,
+            self.strict,
+            applied_waivers,
+            mode=self.mode,
+            accepted_risks=self.accepted_risks,
+            metadata_input=metadata_input,
+            fail_fast=self.fail_fast,
+        )
+        if self.fail_fast:
+            metadata_payload["skipped_policies"] = [
+                policy for policy, details in aggregated.details.items() if details.get("skipped")
+            ]
+        if timings is not None:
+            timings["total_ms"] = _elapsed_ms(timings.pop("_started"))
+            metadata_payload["timings"] = timings
+        decision = Decision(
+            schema_version=aggregated.schema_version,
+            status=aggregated.status,
+            reasons=aggregated.reasons,
+            reason_codes=aggregated.reason_codes,
+            metrics=aggregated.metrics,
+            metadata=metadata_payload,
+            details=aggregated.details,
+        )
+        record_decision(decision.status, decision.reason_codes)
+        for callback in decision_observers():
+            callback(decision)
+        return decision
+
+    def _decide(
+        self, baseline: dict, candidate: dict, metadata_input: dict, timings: dict | None = None
+    ) -> tuple[Decision, list[Waiver]]:
+        key = self._memo_key(baseline, candidate, metadata_input) if self.memo is not None else None
+        if key is not None:
+            cached = self.memo.get(key)
+            record_cache("memo", cached is not None)
+            if cached is not None:
+                if timings is not None:
+                    timings["memo_hit"] = True
+                return cached
+
+        if self.fail_fast:
+            policy_results = self._run_policies_fail_fast(baseline, candidate, metadata_input, timings)
+        else:
+            digests: dict = {}
+            results = {
+                policy.name: self._run_policy(policy, baseline, candidate, digests, timings)
+                for policy in self._execution_order
+            }
+            policy_results = [results[policy.name] for policy in self._policies]
+
+        started = time.perf_counter()
+        policy_results, applied_waivers = self._apply_overrides(policy_results, metadata_input)
+        if timings is not None:
+            timings["overrides_ms"] = _elapsed_ms(started)
+        outcome = (aggregate_policy_results(policy_results, strict=self.strict), applied_waivers)
+
+        if key is not None:
+            self.memo.put(key, outcome)
+        return outcome
+
+    def _memo_key(self, baseline: dict, candidate: dict, metadata_input: dict) -> str | None:
+        settings = {
+            "mode": self.mode,
+            "strict": self.strict,
+            "accepted_risks": self.accepted_risks,
+            "fail_fast": self.fail_fast,
+        }
+        evaluation_time = self._evaluation_time(metadata_input)
+        if evaluation_time is not None:
+            # Waiver expiry depends on the evaluation time, so it is part of the key.
+            settings["evaluation_time"] = evaluation_time.isoformat()
+        if self._config_fingerprint is None:
+            self._config_fingerprint = decision_fingerprint(self.config)
+        return memo_key(baseline, candidate, self._config_fingerprint, settings)
+
+    def _run_policies_fail_fast(
+        self, baseline: dict, candidate: dict, metadata_input: dict, timings: dict | None = None
+    ) -> list[PolicyResult]:
+        """Run policies cheapest first and stop once the final status is certain to be BLOCK.
+
+        Policies that did not run are reported as ALLOW with ``details={"skipped": True}``;
+        results are returned in the usual policy order so output stays deterministic.
+        """
+        empty_candidate = _is_blank_output(candidate)
+
+        def run_cost(policy: _BoundPolicy) -> float:
+            # An empty candidate makes drift a constant-time BLOCK, so check it first.
+            if policy.name == "drift" and empty_candidate:
+                return 0
+            return policy.cost
+
+        results: dict[str, PolicyResult] = {}
+        digests: dict = {}
+        for policy in sorted(self._policies, key=run_cost):
+            result = self._run_policy(policy, baseline, candidate, digests, timings)
+            results[policy.name] = result
+            if self._forces_block(result, metadata_input):
+                break
+        return [
+            results[policy.name]
+            if policy.name in results
+            else PolicyResult(policy=policy.name, status="ALLOW", details={"skipped": True})
+            for policy in self._policies
+        ]
+
+    def _run_policy(
+        self,
+        policy: _BoundPolicy,
+        baseline: dict,
+        candidate: dict,
+        digests: dict,
+        timings: dict | None = None,
+    ) -> PolicyResult:
+        observers = policy_observers()
+        for on_start, _on_end in observers:
+            if on_start is not None:
+                on_start(policy.name)
+        if timings is None:
+            wall_started = time.perf_counter()
+            result = self._run_policy_cached(policy, baseline, candidate, digests)
+            elapsed = time.perf_counter() - wall_started
+        else:
+            wall_started = time.perf_counter()
+            cpu_started = time.thread_time()
+            with collect_counters() as counters:
+                result = self._run_policy_cached(policy, baseline, candidate, digests)
+            elapsed = time.perf_counter() - wall_started
+        record_policy(policy.name, result.status, elapsed)
+        for _on_start, on_end in observers:
+            if on_end is not None:
+                on_end(policy.name, result, elapsed)
+        if timings is None:
+            return result
+
+        records = {"baseline": baseline, "candidate": candidate}
+        timings["policies"][policy.name] = {
+            "wall_ms": round(elapsed * 1000, 4),
+            "cpu_ms": round((time.thread_time() - cpu_started) * 1000, 4),
+            "input_chars": sum(
+                len(value) for side, field_name in policy.inputs
+                if isinstance(value := records[side].get(field_name), str)
+            ),
+            **counters,
+        }
+        return result
+
+    def _run_policy_cached(self, policy: _BoundPolicy, baseline: dict, candidate: dict, digests: dict) -> PolicyResult:
+        if self.policy_cache is None:
+            return policy.run(baseline, candidate)
+
+        # Digests are shared across the policies of one evaluation so each field is hashed once.
+        records = {"baseline": baseline, "candidate": candidate}
+        input_digests = []
+        for side, field_name in policy.inputs:
+            if (side, field_name) not in digests:
+                digests[(side, field_name)] = input_digest(records[side], field_name)
+            input_digests.append(digests[(side, field_name)])
+        if None in input_digests:
+            return policy.run(baseline, candidate)
+
+        key = policy_result_key(policy.name, self._policy_fingerprints[policy.name], input_digests)
+        result = self.policy_cache.get(key)
+        record_cache("policy_cache", result is not None)
+        if result is None:
+            result = policy.run(baseline, candidate)
+            self.policy_cache.put(key, result)
+        else:
+            count("policy_cache_hits")
+        return result
+
+    def _new_timings(self) -> dict:
+        return {"_started": time.perf_counter(), "load_config_ms": self._load_config_ms, "policies": {}}
+
+    def _forces_block(self, result: PolicyResult, metadata_input: dict) -> bool:
+        (effective,), _applied = self._apply_overrides([result], metadata_input)
+        return effective.status == "BLOCK" or (self.strict and effective.status == "WARN")
+
+    def _evaluation_time(self, metadata_input: dict) -> datetime | None:
+        if not self._waivers:
+            return None
+        evaluation_time_raw = metadata_input.get("evaluation_time") or metadata_input.get("now")
+        if not isinstance(evaluation_time_raw, str) or not evaluation_time_raw.strip():
+            raise ValueError(
+                "Waivers are configured, but metadata.evaluation_time is required (ISO-8601). "
+                "CLI: pass --now. Python: pass metadata={'evaluation_time': '...'}"
+            )
+        return parse_evaluation_time(evaluation_time_raw)
+
+    def _apply_overrides(self, policy_results: list, metadata_input: dict) -> tuple[list, list[Waiver]]:
+        """Apply waivers (full mode) and accepted risks (lite mode) to raw policy results."""
+        applied_waivers: list[Waiver] = []
+        evaluation_time = self._evaluation_time(metadata_input)
+        if evaluation_time is not None:
+            policy_results, applied_waivers = apply_waivers_to_policy_results(
+                policy_results, waivers=self._waivers, evaluation_time=evaluation_time
+            )
+
+        if self.mode == "lite":
+            policy_results = _apply_accepted_risks(policy_results, self.accepted_risks)
+        return policy_results, applied_waivers
+
+    def _incremental_policies(self) -> list:
+        """Compiled policies that only read the candidate output and can scan it chunk by chunk."""
+        return [
+            policy.run
+            for policy in self._policies
+            if policy.inputs == (("candidate", "output"),)
+            and hasattr(policy.run, "iter_findings")
+            and hasattr(policy.run, "result_from_counts")
+            and getattr(policy.run, "enabled", True)
+        ]
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 4)
+
+
+def _is_blank_output(record: dict) -> bool:
+    value = record.get("output", "")
+    text = value if isinstance(value, str) else str(value)
+    return not text.strip()
+
 
 def evaluate(
     baseline_output: str | None = None,
@@ -27,100 +371,367 @@ def evaluate(
     config_environment: str | None = None,
     preset: str | None = None,
     accepted_risks: list[str] | None = None,
+    fail_fast: bool = False,
+    memo: "DecisionMemo | DiskDecisionCache | None" = None,
+    policy_cache: PolicyResultCache | None = None,
+    timings: bool = False,
 ) -> Decision:
-    normalized_mode = _normalize_mode(mode)
-    config = load_config(config_path, environment=config_environment, preset=preset)
-    strict_effective = bool(strict)
-    if normalized_mode == "full":
-        strict_effective = strict_effective or bool(config.get("strict_mode", {}).get("enabled", False))
-    metadata_input = metadata or {}
-    baseline_record, candidate_record = _normalize_inputs(
+    if memo is None and policy_cache is None and not timings:
+        evaluator = _shared_evaluator(mode, config_path, config_environment, preset, strict, accepted_risks, fail_fast)
+    else:
+        evaluator = Evaluator(
+            mode=mode,
+            config_path=config_path,
+            config_environment=config_environment,
+            preset=preset,
+            strict=strict,
+            accepted_risks=accepted_risks,
+            fail_fast=fail_fast,
+            memo=memo,
+            policy_cache=policy_cache,
+            timings=timings,
+        )
+    return evaluator.evaluate(
         baseline_output=baseline_output,
         candidate_output=candidate_output,
-        metadata=metadata_input,
+        metadata=metadata,
         baseline=baseline,
         candidate=candidate,
     )
 
-    policy_results = [
-        evaluate_cost_policy(
-            baseline=baseline_record,
-            candidate=candidate_record,
-            thresholds=config["cost_policy"],
-            pricing=config.get("model_pricing", {}),
-        ),
-        evaluate_pii_policy(
-            candidate=candidate_record,
-            patterns=config["pii_policy"]["patterns"],
-            allowlist=config["pii_policy"].get("allowlist", []),
-        ),
-        evaluate_drift_policy(
-            baseline=baseline_record,
-            candidate=candidate_record,
-            thresholds=_drift_thresholds_for_mode(config.get("drift_policy", {}), normalized_mode),
-        ),
-    ]
-    if normalized_mode == "full":
-        policy_results.insert(
-            1,
-            evaluate_latency_policy(
-                baseline=baseline_record,
-                candidate=candidate_record,
-                thresholds=config.get("latency_policy", {}),
-            ),
+
+def _shared_evaluator(
+    mode: str,
+    config_path: str | None,
+    config_environment: str | None,
+    preset: str | None,
+    strict: bool,
+    accepted_risks: list[str] | None,
+    fail_fast: bool,
+) -> Evaluator:
+    """A compiled evaluator for one-shot ``evaluate()`` calls with these options.
+
+    Entries are reused while ``load_config()`` returns the same config object (it is memoized
+    on the file's mtime and size) and the plugin registry is unchanged.
+    """
+    config = load_config(config_path, environment=config_environment, preset=preset)
+    policies = registered_policies()
+    risks = None if accepted_risks is None else list(accepted_risks)
+    risks_key = None if risks is None else tuple(risks)
+    try:
+        key = (_normalize_mode(mode), id(config), id(policies), bool(strict), risks_key, bool(fail_fast))
+        hash(key)
+    except TypeError:  # accepted_risks items that cannot be a cache key
+        return Evaluator(mode=mode, config=config, strict=strict, accepted_risks=risks, fail_fast=fail_fast)
+
+    with _shared_evaluators_lock:
+        entry = _shared_evaluators.get(key)
+        # The ids are only meaningful while the entry keeps both objects alive.
+        if entry is not None and entry[0] is config and entry[1] is policies:
+            _shared_evaluators.move_to_end(key)
+            return entry[2]
+    evaluator = Evaluator(mode=mode, config=config, strict=strict, accepted_risks=risks, fail_fast=fail_fast)
+    with _shared_evaluators_lock:
+        _shared_evaluators[key] = (config, policies, evaluator)
+        _shared_evaluators.move_to_end(key)
+        while len(_shared_evaluators) > _SHARED_EVALUATORS:
+            _shared_evaluators.popitem(last=False)
+    return evaluator
+
+
+def evaluate_many(
+    pairs,
+    executor: str = "serial",
+    workers: int | None = None,
+    chunksize: int = 1,
+    strict: bool = False,
+    mode: str = "lite",
+    config_path: str | None = None,
+    config_environment: str | None = None,
+    preset: str | None = None,
+    accepted_risks: list[str] | None = None,
+    fail_fast: bool = False,
+    evaluator: Evaluator | None = None,
+) -> list[Decision]:
+    """Evaluate many pairs and return decisions in input order.
+
+    Each pair is ``(baseline, candidate)``, ``(baseline, candidate, metadata)`` or a dict with
+    ``baseline``/``candidate``/``metadata`` keys. ``executor`` is ``"serial"``, ``"thread"`` or
+    ``"process"``; process workers receive the compiled evaluator once, at pool start-up (on
+    spawn-based platforms, call this from under ``if __name__ == "__main__":``).
+    """
+    decisions: dict[int, Decision] = {}
+    for index, decision in iter_evaluate_many(
+        pairs,
+        executor=executor,
+        workers=workers,
+        chunksize=chunksize,
+        strict=strict,
+        mode=mode,
+        config_path=config_path,
+        config_environment=config_environment,
+        preset=preset,
+        accepted_risks=accepted_risks,
+        fail_fast=fail_fast,
+        evaluator=evaluator,
+    ):
+        decisions[index] = decision
+    return [decisions[index] for index in range(len(decisions))]
+
+
+def iter_evaluate_many(
+    pairs,
+    executor: str = "serial",
+    workers: int | None = None,
+    chunksize: int = 1,
+    strict: bool = False,
+    mode: str = "lite",
+    config_path: str | None = None,
+    config_environment: str | None = None,
+    preset: str | None = None,
+    accepted_risks: list[str] | None = None,
+    fail_fast: bool = False,
+    evaluator: Evaluator | None = None,
+):
+    """Return an iterator of ``(index, decision)`` tuples in completion order.
+
+    ``pairs`` may be any iterable, including an unbounded generator: at most a few chunks per
+    worker are in flight at a time.
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError("executor must be one of 'serial', 'thread' or 'process'.")
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError("workers must be a positive integer.")
+
+    if evaluator is None:
+        evaluator = Evaluator(
+            mode=mode,
+            config_path=config_path,
+            config_environment=config_environment,
+            preset=preset,
+            strict=strict,
+            accepted_risks=accepted_risks,
+            fail_fast=fail_fast,
         )
-        policy_results.insert(
-            3,
-            evaluate_output_contract_policy(
-                baseline=baseline_record,
-                candidate=candidate_record,
-                config=config.get("output_contract_policy", {}),
-            ),
+
+    return _iter_decisions(pairs, evaluator, executor, workers or os.cpu_count() or 1, chunksize)
+
+
+_EXECUTORS = ("serial", "thread", "process")
+
+# Set once per process-pool worker by the pool initializer.
+_WORKER_EVALUATOR: Evaluator | None = None
+
+
+def _iter_decisions(pairs, evaluator: Evaluator, executor: str, worker_count: int, chunksize: int):
+    if executor == "serial":
+        for index, pair in enumerate(pairs):
+            yield index, _evaluate_pair(evaluator, pair)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    if executor == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        pool = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="breakpoint-eval")
+        run_chunk = partial(_evaluate_chunk, evaluator)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_init_worker_evaluator,
+            initargs=(evaluator,),
+        )
+        run_chunk = _evaluate_chunk_in_worker
+
+    max_pending = worker_count * 2
+    pending: set = set()
+    with pool:
+        try:
+            for chunk in _chunked(enumerate(pairs), chunksize):
+                pending.add(pool.submit(run_chunk, chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def aevaluate(
+    baseline_output: str | None = None,
+    candidate_output: str | None = None,
+    metadata: dict | None = None,
+    baseline: dict | None = None,
+    candidate: dict | None = None,
+    strict: bool = False,
+    mode: str = "lite",
+    config_path: str | None = None,
+    config_environment: str | None = None,
+    preset: str | None = None,
+    accepted_risks: list[str] | None = None,
+    fail_fast: bool = False,
+    evaluator: Evaluator | None = None,
+    executor: "Executor | None" = None,
+    limiter: "asyncio.Semaphore | None" = None,
+) -> Decision:
+    """Async ``evaluate()`` that runs the policies on an executor instead of the event loop.
+
+    Uses a small shared thread pool unless ``executor`` is given. ``limiter`` bounds how many
+    evaluations run at once. Cancelling the coroutine drops work that has not started yet;
+    an evaluation already running on a worker finishes and its result is discarded.
+    """
+    if evaluator is None:
+        call = partial(
+            evaluate,
+            baseline_output=baseline_output,
+            candidate_output=candidate_output,
+            metadata=metadata,
+            baseline=baseline,
+            candidate=candidate,
+            strict=strict,
+            mode=mode,
+            config_path=config_path,
+            config_environment=config_environment,
+            preset=preset,
+            accepted_risks=accepted_risks,
+            fail_fast=fail_fast,
+        )
+    else:
+        call = partial(
+            evaluator.evaluate,
+            baseline_output=baseline_output,
+            candidate_output=candidate_output,
+            metadata=metadata,
+            baseline=baseline,
+            candidate=candidate,
         )
-        policy_results.insert(
-            5,
-            evaluate_red_team_policy(
-                candidate=candidate_record,
-                config=config.get("red_team_policy", {}),
+    return await _run_in_executor(call, executor, limiter)
+
+
+async def aevaluate_many(
+    pairs,
+    max_concurrency: int = 8,
+    strict: bool = False,
+    mode: str = "lite",
+    config_path: str | None = None,
+    config_environment: str | None = None,
+    preset: str | None = None,
+    accepted_risks: list[str] | None = None,
+    fail_fast: bool = False,
+    evaluator: Evaluator | None = None,
+    executor: "Executor | None" = None,
+) -> list[Decision]:
+    """Async ``evaluate_many()``: at most ``max_concurrency`` evaluations run at once.
+
+    Decisions are returned in input order. If one evaluation fails or the caller is cancelled,
+    the remaining evaluations are cancelled too.
+    """
+    import asyncio
+
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer.")
+    if evaluator is None:
+        evaluator = await _run_in_executor(
+            partial(
+                Evaluator,
+                mode=mode,
+                config_path=config_path,
+                config_environment=config_environment,
+                preset=preset,
+                strict=strict,
+                accepted_risks=accepted_risks,
+                fail_fast=fail_fast,
             ),
+            executor,
+            None,
         )
 
-    waivers = parse_waivers(config.get("waivers")) if normalized_mode == "full" else []
-    applied_waivers: list[Waiver] = []
-    if waivers:
-        evaluation_time_raw = metadata_input.get("evaluation_time") or metadata_input.get("now")
-        if not isinstance(evaluation_time_raw, str) or not evaluation_time_raw.strip():
-            raise ValueError(
-                "Waivers are configured, but metadata.evaluation_time is required (ISO-8601). "
-                "CLI: pass --now. Python: pass metadata={'evaluation_time': '...'}"
+    limiter = asyncio.Semaphore(max_concurrency)
+    tasks = [
+        asyncio.ensure_future(_run_in_executor(partial(_evaluate_pair, evaluator, pair), executor, limiter))
+        for pair in pairs
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def _run_in_executor(call, executor: "Executor | None", limiter: "asyncio.Semaphore | None"):
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    if limiter is None:
+        return await loop.run_in_executor(executor or _default_async_executor(), call)
+    async with limiter:
+        return await loop.run_in_executor(executor or _default_async_executor(), call)
+
+
+_ASYNC_EXECUTOR: "Executor | None" = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+
+def _default_async_executor() -> "Executor":
+    # Bounded and separate from the loop's default executor so evaluations never starve it.
+    global _ASYNC_EXECUTOR
+    with _ASYNC_EXECUTOR_LOCK:
+        if _ASYNC_EXECUTOR is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _ASYNC_EXECUTOR = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                thread_name_prefix="breakpoint-aeval",
             )
-        evaluation_time = parse_evaluation_time(evaluation_time_raw)
-        policy_results, applied_waivers = apply_waivers_to_policy_results(
-            policy_results, waivers=waivers, evaluation_time=evaluation_time
+        return _ASYNC_EXECUTOR
+
+
+def _init_worker_evaluator(evaluator: Evaluator) -> None:
+    global _WORKER_EVALUATOR
+    _WORKER_EVALUATOR = evaluator
+
+
+def _evaluate_chunk_in_worker(chunk: list) -> list[tuple[int, Decision]]:
+    return _evaluate_chunk(_WORKER_EVALUATOR, chunk)
+
+
+def _evaluate_chunk(evaluator: Evaluator, chunk: list) -> list[tuple[int, Decision]]:
+    return [(index, _evaluate_pair(evaluator, pair)) for index, pair in chunk]
+
+
+def _evaluate_pair(evaluator: Evaluator, pair) -> Decision:
+    if isinstance(pair, dict):
+        return evaluator.evaluate(
+            baseline=pair.get("baseline"),
+            candidate=pair.get("candidate"),
+            metadata=pair.get("metadata"),
         )
+    if isinstance(pair, (tuple, list)) and len(pair) in (2, 3):
+        metadata = pair[2] if len(pair) == 3 else None
+        return evaluator.evaluate(baseline=pair[0], candidate=pair[1], metadata=metadata)
+    raise ValueError("Each pair must be (baseline, candidate), (baseline, candidate, metadata) or a dict.")
 
-    if normalized_mode == "lite":
-        policy_results = _apply_accepted_risks(policy_results, accepted_risks)
 
-    aggregated = aggregate_policy_results(policy_results, strict=strict_effective)
-    metadata_payload = _decision_metadata(
-        baseline_record,
-        candidate_record,
-        strict_effective,
-        applied_waivers,
-        mode=normalized_mode,
-        accepted_risks=accepted_risks,
-        metadata_input=metadata_input,
-    )
-    return Decision(
-        schema_version=aggregated.schema_version,
-        status=aggregated.status,
-        reasons=aggregated.reasons,
-        reason_codes=aggregated.reason_codes,
-        metrics=aggregated.metrics,
-        metadata=metadata_payload,
-        details=aggregated.details,
-    )
+def _chunked(items, size: int):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 def _normalize_inputs(
@@ -181,8 +792,11 @@ def _decision_metadata(
     mode: str,
     accepted_risks: list[str] | None,
     metadata_input: dict,
+    fail_fast: bool = False,
 ) -> dict:
     metadata = {"strict": strict, "mode": mode}
+    if fail_fast:
+        metadata["fail_fast"] = True
 
     if isinstance(baseline.get("model"), str):
         metadata["baseline_model"] = baseline["model"]
@@ -233,15 +847,6 @@ def _normalize_mode(mode: str) -> str:
     return normalized
 
 
-def _drift_thresholds_for_mode(thresholds: dict, mode: str) -> dict:
-    if not isinstance(thresholds, dict):
-        return {"semantic_check_enabled": False} if mode == "lite" else {}
-    result = dict(thresholds)
-    if mode == "lite":
-        result["semantic_check_enabled"] = False
-    return result
-
-
 def _apply_accepted_risks(policy_results, accepted_risks: list[str] | None):
     accepted = {risk.strip().lower() for risk in (accepted_risks or []) if isinstance(risk, str) and risk.strip()}
     if not accepted:
@@ -0,0 +1,90 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Counters for the policy currently being timed; None (the common case) makes count() a no-op.
+_COUNTERS: ContextVar[dict | None] = ContextVar("breakpoint_policy_counters", default=None)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add to a named counter of the policy being timed, if ``Evaluator(timings=True)`` is active."""
+    counters = _COUNTERS.get()
+    if counters is not None:
+        counters[name] = counters.get(name, 0) + amount
+
+
+@contextmanager
+def collect_counters():
+    counters: dict[str, int] = {}
+    token = _COUNTERS.set(counters)
+    try:
+        yield counters
+    finally:
+        _COUNTERS.reset(token)
+
+
+# Observer tuples are replaced (never mutated) under the lock, so the evaluator can iterate
+# them without locking; both are empty in the common case.
+_POLICY_OBSERVERS: tuple[tuple, ...] = ()
+_DECISION_OBSERVERS: tuple = ()
+_OBSERVERS_LOCK = threading.Lock()
+
+
+@contextmanager
+def observe_policies(on_start=None, on_end=None):
+    """Call ``on_start(policy_name)`` / ``on_end(policy_name, result, elapsed_seconds)`` around
+    every policy run, in every thread, while the context is active."""
+    entry = (on_start, on_end)
+    _add_policy_observer(entry)
+    try:
+        yield
+    finally:
+        _remove_policy_observers(lambda item: item is entry)
+
+
+def on_policy_start(callback):
+    """Register ``callback(policy_name)`` to run before every policy; usable as a decorator."""
+    _add_policy_observer((callback, None))
+    return callback
+
+
+def on_policy_end(callback):
+    """Register ``callback(policy_name, result, elapsed_seconds)`` to run after every policy."""
+    _add_policy_observer((None, callback))
+    return callback
+
+
+def on_decision(callback):
+    """Register ``callback(decision)`` to run after every ``Evaluator.evaluate()``."""
+    global _DECISION_OBSERVERS
+    with _OBSERVERS_LOCK:
+        _DECISION_OBSERVERS = _DECISION_OBSERVERS + (callback,)
+    return callback
+
+
+def remove_hook(callback) -> None:
+    """Unregister a callback added with ``on_policy_start``/``on_policy_end``/``on_decision``."""
+    global _DECISION_OBSERVERS
+    _remove_policy_observers(lambda item: callback in item)
+    with _OBSERVERS_LOCK:
+        _DECISION_OBSERVERS = tuple(item for item in _DECISION_OBSERVERS if item is not callback)
+
+
+def policy_observers() -> tuple[tuple, ...]:
+    return _POLICY_OBSERVERS
+
+
+def decision_observers() -> tuple:
+    return _DECISION_OBSERVERS
+
+
+def _add_policy_observer(entry: tuple) -> None:
+    global _POLICY_OBSERVERS
+    with _OBSERVERS_LOCK:
+        _POLICY_OBSERVERS = _POLICY_OBSERVERS + (entry,)
+
+
+def _remove_policy_observers(predicate) -> None:
+    global _POLICY_OBSERVERS
+    with _OBSERVERS_LOCK:
+        _POLICY_OBSERVERS = tuple(item for item in _POLICY_OBSERVERS if not predicate(item))
@@ -0,0 +1,193 @@
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from breakpoint.engine.metrics import decision_fingerprint
+
+
+@dataclass(frozen=True)
+class MemoStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "max_size": self.max_size,
+        }
+
+
+class DecisionMemo:
+    """Thread-safe LRU of policy outcomes keyed by ``memo_key()``.
+
+    Pass one to ``Evaluator(memo=...)``; it can be shared across evaluators because the key
+    includes the config fingerprint and evaluator settings. Entries are copied on the way in
+    and out, so callers may mutate returned decisions freely.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> MemoStats:
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        # Process-pool workers get their own (initially identical) copy; locks don't pickle.
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_entries"] = OrderedDict(self._entries)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class PolicyResultCache(DecisionMemo):
+    """LRU of individual policy results, keyed by ``policy_result_key()``.
+
+    Pass one to ``Evaluator(policy_cache=...)``. Each policy is keyed only on its own config
+    section and the record fields it declares in its module's ``INPUTS``, so e.g. a pricing
+    change reruns the cost policy while PII, red-team and drift results are reused.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        super().__init__(max_size=max_size)
+
+
+def policy_result_key(policy: str, config_fingerprint: str, input_digests: list[str]) -> str:
+    return decision_fingerprint(
+        {
+            "engine": engine_fingerprint(),
+            "policy": policy,
+            "config": config_fingerprint,
+            "inputs": input_digests,
+        }
+    )
+
+
+def input_digest(record: dict, field: str) -> str | None:
+    """Hash of one record field; None when the value is not JSON-serializable."""
+    if field not in record:
+        return "-"
+    try:
+        return decision_fingerprint({"value": record[field]})
+    except (TypeError, ValueError):
+        return None
+
+
+def memo_key(
+    baseline: dict,
+    candidate: dict,
+    config_fingerprint: str,
+    settings: dict,
+) -> str | None:
+    """Canonical hash of normalized records, effective config and engine fingerprint.
+
+    Returns None when the records are not JSON-serializable, in which case callers skip the memo.
+    When the candidate output is identical to the baseline output it is hashed only once.
+    """
+    payload = {
+        "engine": engine_fingerprint(),
+        "config": config_fingerprint,
+        "settings": settings,
+        "baseline": baseline,
+        "candidate": candidate,
+    }
+    output = candidate.get("output")
+    if isinstance(output, str) and output == baseline.get("output"):
+        payload["candidate"] = {name: value for name, value in candidate.items() if name != "output"}
+        payload["candidate_output"] = "baseline"
+    try:
+        return decision_fingerprint(payload)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def engine_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        return "0.0.0"
+    try:
+        return version("breakpoint-ai")
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+@lru_cache(maxsize=1)
+def engine_fingerprint() -> str:
+    """Hash of the package version and the engine and decision model sources.
+
+    Cached decisions, policy results and compiled configs are keyed on it, so a code change
+    invalidates them even without a version bump (source checkouts all report "0.0.0").
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.sha256(engine_version().encode("utf-8"))
+    for subpackage in ("engine", "models"):
+        root = os.path.join(package_dir, subpackage)
+        for directory, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                path = os.path.join(directory, filename)
+                digest.update(os.path.relpath(path, package_dir).replace(os.sep, "/").encode("utf-8") + b"\0")
+                with open(path, "rb") as handle:
+                    digest.update(handle.read())
+    return digest.hexdigest()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Callable, Protocol, runtime_checkable
 
 
 @dataclass
@@ -8,3 +9,28 @@ class PolicyResult:
     reasons: list[str] = field(default_factory=list)
     codes: list[str] = field(default_factory=list)
     details: dict = field(default_factory=dict)
+
+
+@runtime_checkable
+class Policy(Protocol):
+    """A policy the engine can run, built in or registered under the ``breakpoint.policies``
+    entry-point group.
+
+    ``modes`` lists the modes it runs in (``"lite"``, ``"full"``), ``inputs`` the
+    ``(side, field)`` record fields it reads (used for per-policy caching), and ``cost`` a
+    relative run-time estimate (built-ins range from 1 for metadata checks to 8 for drift);
+    cheaper policies run first. ``policy_config()`` picks the policy's section out of the
+    effective config, and ``bind()`` compiles it once into a ``(baseline, candidate) ->
+    PolicyResult`` callable. The callable must be picklable to work with process executors.
+    Reason codes should start with the upper-cased name and ``_`` (``JSON_SIZE_BLOCK`` for
+    ``json_size``) so the CLI can attribute them to the policy.
+    """
+
+    name: str
+    modes: tuple[str, ...]
+    inputs: tuple[tuple[str, str], ...]
+    cost: float
+
+    def policy_config(self, config: dict, mode: str) -> object: ...
+
+    def bind(self, policy_config: object) -> Callable[[dict, dict], PolicyResult]: ...
@@ -0,0 +1,274 @@
+import os
+import signal
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from breakpoint.engine.instrumentation import count
+from breakpoint.engine.policies.base import PolicyResult
+
+BUDGET_ACTIONS = ("WARN", "BLOCK")
+
+_CODE_PREFIXES = {"pii": "PII", "red_team": "RED_TEAM"}
+_REASON_PREFIXES = {"pii": "PII", "red_team": "Red Team"}
+_MAX_IDLE_WORKERS = 4
+_WORKER_POLICY_CACHE = 16
+
+# Progress a worker shares with its parent: when the current scan started, when the pattern it is
+# running started, and that pattern's index in pattern_sources().
+_SCAN_STARTED, _PATTERN_STARTED, _PATTERN_INDEX = range(3)
+
+_IDLE_WORKERS: list = []
+_WORKERS_LOCK = threading.Lock()
+# A forked child inherits the parent's forkserver handle but cannot use it.
+_FORKSERVER_USABLE = True
+
+
+@dataclass(frozen=True)
+class RegexBudget:
+    pattern_ms: float | None = None
+    policy_ms: float | None = None
+    action: str = "BLOCK"
+
+
+def regex_budget_from_config(config: dict | None) -> RegexBudget | None:
+    """The ``regex_budget`` object of a ``pii_policy``/``red_team_policy`` section, or None."""
+    if not config:
+        return None
+    return RegexBudget(
+        pattern_ms=config.get("pattern_ms"),
+        policy_ms=config.get("policy_ms"),
+        action=config.get("action", "BLOCK"),
+    )
+
+
+def with_regex_budget(policy, config: dict | None):
+    """Wrap a compiled PII or red-team policy in ``BudgetedPolicy`` when its section sets
+    ``regex_budget``; otherwise return it unchanged."""
+    budget = regex_budget_from_config(config)
+    if budget is None or not getattr(policy, "enabled", True):
+        return policy
+    return BudgetedPolicy(policy=policy, budget=budget)
+
+
+@dataclass(frozen=True)
+class BudgetedPolicy:
+    """Runs a compiled PII or red-team policy in a worker process under a ``RegexBudget``.
+
+    The worker scans one pattern at a time and publishes which one it is running. When a pattern
+    runs past ``pattern_ms`` or the whole scan past ``policy_ms``, the worker is killed (Python
+    cannot interrupt a regex in another thread) and the result gets a ``*_REGEX_BUDGET`` code with
+    ``budget.action`` as its status, naming the pattern. Matches reported before that still count.
+    Idle workers are reused, so only an overrun pays for starting a new one.
+
+    There is no ``iter_findings()``: ``StreamGuard`` leaves budgeted policies to ``finalize()`` and
+    warns when it is built for an evaluator that has any.
+    """
+
+    policy: object
+    budget: RegexBudget
+    # Workers keep compiled policies between calls, keyed by this token.
+    token: str = field(default_factory=lambda: os.urandom(16).hex())
+
+    def __call__(self, baseline: dict, candidate: dict) -> PolicyResult:
+        return self.evaluate(candidate)
+
+    def evaluate(self, candidate: dict) -> PolicyResult:
+        text = candidate.get("output", "")
+        if not isinstance(text, str):
+            text = str(text)
+
+        counts, overrun = _scan(self, text)
+        count("chars_scanned", len(text))
+        count("regex_matches", sum(counts.values()))
+        result = self.policy.result_from_counts(counts)
+        if overrun is None:
+            return result
+        return _overrun_result(result, self.budget, self.policy.pattern_sources(), *overrun)
+
+
+class _Worker:
+    def __init__(self) -> None:
+        import multiprocessing
+
+        # Not fork: workers are started from threaded processes (thread executors, aevaluate,
+        # serve), and a forked child can deadlock on a lock another thread held at fork time.
+        usable = _FORKSERVER_USABLE and "forkserver" in multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if usable else "spawn")
+        # Locked so the parent never pairs one pattern's index with another's start time.
+        self.progress = context.Array("d", 3)
+        self.connection, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child, self.progress),
+            name="breakpoint-regex",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        # Mirrors the worker's policy cache, so each policy is sent once per worker.
+        self.policies: OrderedDict = OrderedDict()
+
+    def close(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def _scan(policy: BudgetedPolicy, text: str) -> tuple[dict[str, int], tuple | None]:
+    worker = _acquire_worker()
+    try:
+        counts, overrun = _run_in_worker(worker, policy, text)
+    except EOFError:
+        worker.close()
+        raise RuntimeError("Regex worker process exited unexpectedly.") from None
+    except BaseException:
+        worker.close()
+        raise
+    if overrun is None:
+        _release_worker(worker)
+    else:
+        worker.close()
+    return counts, overrun
+
+
+def _run_in_worker(worker: _Worker, policy: BudgetedPolicy, text: str) -> tuple[dict[str, int], tuple | None]:
+    worker.progress[_SCAN_STARTED] = 0.0
+    payload = None if policy.token in worker.policies else policy.policy
+    _remember(worker.policies, policy.token, True)
+    worker.connection.send((policy.token, payload, text))
+
+    budget = policy.budget
+    limits = [limit for limit in (budget.pattern_ms, budget.policy_ms) if limit is not None]
+    interval = min(max(min(limits) / 10_000, 0.001), 0.05)
+    counts: dict[str, int] = {}
+    while True:
+        if worker.connection.poll(interval):
+            message = worker.connection.recv()
+            if message is None:
+                return counts, None
+            _merge(counts, message)
+            continue
+        overrun = _overrun(budget, worker.progress, time.monotonic())
+        if overrun is None:
+            continue
+        # Keep what the worker reported before it is killed; it may also have just finished.
+        while worker.connection.poll(0):
+            message = worker.connection.recv()
+            if message is None:
+                return counts, None
+            _merge(counts, message)
+        return counts, overrun
+
+
+def _overrun(budget: RegexBudget, progress, now: float) -> tuple[int, str, float] | None:
+    with progress.get_lock():
+        scan_started, pattern_started, index = progress[:]
+    if not scan_started:
+        return None  # the worker is still loading the policy
+    index = int(index)
+    if budget.pattern_ms is not None and (now - pattern_started) * 1000 > budget.pattern_ms:
+        return index, "pattern", budget.pattern_ms
+    if budget.policy_ms is not None and (now - scan_started) * 1000 > budget.policy_ms:
+        return index, "policy", budget.policy_ms
+    return None
+
+
+def _overrun_result(
+    result: PolicyResult,
+    budget: RegexBudget,
+    sources: tuple[tuple[str, str], ...],
+    index: int,
+    kind: str,
+    limit_ms: float,
+) -> PolicyResult:
+    label, pattern = sources[index] if 0 <= index < len(sources) else ("", "")
+    name = _REASON_PREFIXES.get(result.policy, result.policy)
+    if kind == "pattern":
+        reason = f"{name} regex budget exceeded: {label} pattern {pattern!r} ran longer than {limit_ms:g} ms."
+    else:
+        reason = f"{name} regex budget exceeded: scan ran longer than {limit_ms:g} ms, in {label} pattern {pattern!r}."
+    prefix = _CODE_PREFIXES.get(result.policy, result.policy.upper())
+    return PolicyResult(
+        policy=result.policy,
+        status="BLOCK" if result.status == "BLOCK" else budget.action,
+        reasons=[*result.reasons, reason + " Later patterns were not scanned."],
+        codes=[*result.codes, f"{prefix}_{budget.action}_REGEX_BUDGET"],
+        details={
+            **result.details,
+            "regex_budget_exceeded": {"budget": kind, "budget_ms": limit_ms, "label": label, "pattern": pattern},
+        },
+    )
+
+
+def _acquire_worker() -> _Worker:
+    with _WORKERS_LOCK:
+        while _IDLE_WORKERS:
+            worker = _IDLE_WORKERS.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.close()
+    return _Worker()
+
+
+def _release_worker(worker: _Worker) -> None:
+    with _WORKERS_LOCK:
+        if len(_IDLE_WORKERS) < _MAX_IDLE_WORKERS:
+            _IDLE_WORKERS.append(worker)
+            return
+    worker.close()
+
+
+def _forget_inherited_workers() -> None:
+    # A forked child (a process executor, or a worker itself) must not reuse its parent's workers,
+    # nor its forkserver, which is not the child's own child process.
+    global _WORKERS_LOCK, _FORKSERVER_USABLE
+    _IDLE_WORKERS.clear()
+    _WORKERS_LOCK = threading.Lock()
+    _FORKSERVER_USABLE = False
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited_workers)
+
+
+def _remember(cache: OrderedDict, token: str, value=None) -> None:
+    # Parent and worker apply the same updates, so their caches hold the same tokens.
+    if value is not None:
+        cache[token] = value
+    cache.move_to_end(token)
+    while len(cache) > _WORKER_POLICY_CACHE:
+        cache.popitem(last=False)
+
+
+def _merge(counts: dict[str, int], found: dict[str, int]) -> None:
+    for label, amount in found.items():
+        counts[label] = counts.get(label, 0) + amount
+
+
+def _worker_main(connection, progress) -> None:
+    # Ctrl-C goes to the whole process group; the parent decides what happens to the worker.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    policies: OrderedDict = OrderedDict()
+    while True:
+        try:
+            token, payload, text = connection.recv()
+        except EOFError:
+            return
+        _remember(policies, token, payload)
+        policy = policies[token]
+
+        started = time.monotonic()
+        with progress.get_lock():
+            progress[:] = [started, started, 0]
+        for index, findings in enumerate(policy.iter_pattern_scans(text)):
+            with progress.get_lock():
+                progress[_PATTERN_INDEX] = index
+                progress[_PATTERN_STARTED] = time.monotonic()
+            counts: dict[str, int] = {}
+            for label, _start, _end in findings:
+                counts[label] = counts.get(label, 0) + 1
+            if counts:
+                connection.send(counts)
+        connection.send(None)
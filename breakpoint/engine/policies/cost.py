@@ -2,6 +2,13 @@ from breakpoint.engine.policies.base import PolicyResult
 
 _EPSILON = 1e-9
 
+# Record fields this policy reads, as (side, field); used to key per-policy result caching.
+INPUTS = tuple(
+    (side, field)
+    for side in ("baseline", "candidate")
+    for field in ("cost_usd", "model", "tokens_in", "tokens_out", "tokens_total")
+)
+
 
 def evaluate_cost_policy(
     baseline: dict, candidate: dict, thresholds: dict, pricing: dict
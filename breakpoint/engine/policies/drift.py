@@ -1,101 +1,134 @@
 import re
+from dataclasses import dataclass
 
+from breakpoint.engine.instrumentation import count
 from breakpoint.engine.policies.base import PolicyResult
 
-
-def evaluate_drift_policy(baseline: dict, candidate: dict, thresholds: dict) -> PolicyResult:
-    baseline_text = _as_text(baseline.get("output", ""))
-    candidate_text = _as_text(candidate.get("output", ""))
-
-    if not candidate_text.strip():
-        return PolicyResult(
-            policy="drift",
-            status="BLOCK",
-            reasons=["Candidate output is empty."],
-            codes=["DRIFT_BLOCK_EMPTY"],
-        )
-
-    reasons = []
-    codes = []
-    details = {}
-
-    baseline_len = max(1, len(baseline_text))
-    candidate_len = len(candidate_text)
-    delta_pct = abs(candidate_len - baseline_len) / baseline_len * 100
-    short_ratio = candidate_len / baseline_len
-
-    warn_expansion = float(thresholds.get("warn_expansion_pct", 60))
-    block_expansion = float(thresholds.get("block_expansion_pct", 70))
-    warn_compression = float(thresholds.get("warn_compression_pct", 60))
-    block_compression = float(thresholds.get("block_compression_pct", 70))
-    warn_short_ratio = float(thresholds.get("warn_short_ratio", 0.35))
-    min_similarity = float(thresholds.get("warn_min_similarity", 0.15))
-    semantic_enabled = bool(thresholds.get("semantic_check_enabled", True))
-    similarity_method = str(thresholds.get("similarity_method", "max(token_jaccard,char_3gram_jaccard)"))
-
-    if candidate_len > baseline_len:
-        if delta_pct >= block_expansion:
-            reasons.append(
-                f"Response length expanded: baseline {baseline_len} chars vs candidate {candidate_len} chars "
-                f"({delta_pct:.1f}%, block threshold {block_expansion:.0f}%)."
-            )
-            codes.append("DRIFT_BLOCK_EXPANSION")
-            details["expansion_pct"] = delta_pct
-        elif delta_pct >= warn_expansion:
-            reasons.append(
-                f"Response length expanded: baseline {baseline_len} chars vs candidate {candidate_len} chars "
-                f"({delta_pct:.1f}%, threshold {warn_expansion:.0f}%)."
-            )
-            codes.append("DRIFT_WARN_EXPANSION")
-            details["expansion_pct"] = delta_pct
-    elif candidate_len < baseline_len:
-        if delta_pct >= block_compression:
-            reasons.append(
-                f"Response length compressed: baseline {baseline_len} chars vs candidate {candidate_len} chars "
-                f"({delta_pct:.1f}%, block threshold {block_compression:.0f}%)."
-            )
-            codes.append("DRIFT_BLOCK_COMPRESSION")
-            details["compression_pct"] = delta_pct
-        elif delta_pct >= warn_compression:
-            reasons.append(
-                f"Response length compressed: baseline {baseline_len} chars vs candidate {candidate_len} chars "
-                f"({delta_pct:.1f}%, threshold {warn_compression:.0f}%)."
+INPUTS = (("baseline", "output"), ("candidate", "output"))
+
+_WORD_RE = re.compile(r"[a-zA-Z0-9_]+")
+
+
+@dataclass(frozen=True)
+class CompiledDriftPolicy:
+    warn_expansion: float
+    block_expansion: float
+    warn_compression: float
+    block_compression: float
+    warn_short_ratio: float
+    min_similarity: float
+    semantic_enabled: bool
+    similarity_method: str
+    similarity_plan: tuple[str | None, ...]
+
+    def __call__(self, baseline: dict, candidate: dict) -> PolicyResult:
+        return self.evaluate(baseline, candidate)
+
+    def evaluate(self, baseline: dict, candidate: dict) -> PolicyResult:
+        baseline_text = _as_text(baseline.get("output", ""))
+        candidate_text = _as_text(candidate.get("output", ""))
+        count("chars_scanned", len(baseline_text) + len(candidate_text))
+
+        if not candidate_text.strip():
+            return PolicyResult(
+                policy="drift",
+                status="BLOCK",
+                reasons=["Candidate output is empty."],
+                codes=["DRIFT_BLOCK_EMPTY"],
             )
-            codes.append("DRIFT_WARN_COMPRESSION")
-            details["compression_pct"] = delta_pct
-
-    if short_ratio < warn_short_ratio:
-        shrink_pct = (1 - short_ratio) * 100
-        reasons.append(
-            f"Candidate likely dropped detail: {shrink_pct:.1f}% shorter than baseline "
-            f"({candidate_len}/{baseline_len} chars, ratio {short_ratio:.2f}, threshold {warn_short_ratio:.2f})."
-        )
-        codes.append("DRIFT_WARN_SHORT_OUTPUT")
-        details["short_ratio"] = short_ratio
-
-    if semantic_enabled:
-        similarity = _similarity(baseline_text, candidate_text, method=similarity_method)
-        details["similarity"] = similarity
-        details["similarity_method"] = similarity_method
-        if similarity < min_similarity:
-            missing_terms = _top_missing_terms(baseline_text, candidate_text, limit=3)
-            missing_suffix = f" Missing baseline terms: {', '.join(missing_terms)}." if missing_terms else ""
+
+        reasons = []
+        codes = []
+        details = {}
+
+        baseline_len = max(1, len(baseline_text))
+        candidate_len = len(candidate_text)
+        delta_pct = abs(candidate_len - baseline_len) / baseline_len * 100
+        short_ratio = candidate_len / baseline_len
+
+        if candidate_len > baseline_len:
+            if delta_pct >= self.block_expansion:
+                reasons.append(
+                    f"Response length expanded: baseline {baseline_len} chars vs candidate {candidate_len} chars "
+                    f"({delta_pct:.1f}%, block threshold {self.block_expansion:.0f}%)."
+                )
+                codes.append("DRIFT_BLOCK_EXPANSION")
+                details["expansion_pct"] = delta_pct
+            elif delta_pct >= self.warn_expansion:
+                reasons.append(
+                    f"Response length expanded: baseline {baseline_len} chars vs candidate {candidate_len} chars "
+                    f"({delta_pct:.1f}%, threshold {self.warn_expansion:.0f}%)."
+                )
+                codes.append("DRIFT_WARN_EXPANSION")
+                details["expansion_pct"] = delta_pct
+        elif candidate_len < baseline_len:
+            if delta_pct >= self.block_compression:
+                reasons.append(
+                    f"Response length compressed: baseline {baseline_len} chars vs candidate {candidate_len} chars "
+                    f"({delta_pct:.1f}%, block threshold {self.block_compression:.0f}%)."
+                )
+                codes.append("DRIFT_BLOCK_COMPRESSION")
+                details["compression_pct"] = delta_pct
+            elif delta_pct >= self.warn_compression:
+                reasons.append(
+                    f"Response length compressed: baseline {baseline_len} chars vs candidate {candidate_len} chars "
+                    f"({delta_pct:.1f}%, threshold {self.warn_compression:.0f}%)."
+                )
+                codes.append("DRIFT_WARN_COMPRESSION")
+                details["compression_pct"] = delta_pct
+
+        if short_ratio < self.warn_short_ratio:
+            shrink_pct = (1 - short_ratio) * 100
             reasons.append(
-                f"Response content overlap is low (similarity {similarity:.2f}, threshold {min_similarity:.2f})."
-                f"{missing_suffix}"
+                f"Candidate likely dropped detail: {shrink_pct:.1f}% shorter than baseline "
+                f"({candidate_len}/{baseline_len} chars, ratio {short_ratio:.2f}, threshold {self.warn_short_ratio:.2f})."
             )
-            codes.append("DRIFT_WARN_LOW_SIMILARITY")
+            codes.append("DRIFT_WARN_SHORT_OUTPUT")
+            details["short_ratio"] = short_ratio
+
+        if self.semantic_enabled:
+            similarity = _similarity_from_plan(baseline_text, candidate_text, self.similarity_plan)
+            details["similarity"] = similarity
+            details["similarity_method"] = self.similarity_method
+            if similarity < self.min_similarity:
+                missing_terms = _top_missing_terms(baseline_text, candidate_text, limit=3)
+                missing_suffix = f" Missing baseline terms: {', '.join(missing_terms)}." if missing_terms else ""
+                reasons.append(
+                    f"Response content overlap is low (similarity {similarity:.2f}, threshold {self.min_similarity:.2f})."
+                    f"{missing_suffix}"
+                )
+                codes.append("DRIFT_WARN_LOW_SIMILARITY")
+
+        if reasons:
+            status = "BLOCK" if any(code.startswith("DRIFT_BLOCK_") for code in codes) else "WARN"
+            return PolicyResult(policy="drift", status=status, reasons=reasons, codes=codes, details=details)
+        return PolicyResult(policy="drift", status="ALLOW", details=details)
+
+
+def compile_drift_policy(thresholds: dict) -> CompiledDriftPolicy:
+    similarity_method = str(thresholds.get("similarity_method", "max(token_jaccard,char_3gram_jaccard)"))
+    return CompiledDriftPolicy(
+        warn_expansion=float(thresholds.get("warn_expansion_pct", 60)),
+        block_expansion=float(thresholds.get("block_expansion_pct", 70)),
+        warn_compression=float(thresholds.get("warn_compression_pct", 60)),
+        block_compression=float(thresholds.get("block_compression_pct", 70)),
+        warn_short_ratio=float(thresholds.get("warn_short_ratio", 0.35)),
+        min_similarity=float(thresholds.get("warn_min_similarity", 0.15)),
+        semantic_enabled=bool(thresholds.get("semantic_check_enabled", True)),
+        similarity_method=similarity_method,
+        similarity_plan=_similarity_plan(similarity_method),
+    )
+
 
-    if reasons:
-        status = "BLOCK" if any(code.startswith("DRIFT_BLOCK_") for code in codes) else "WARN"
-        return PolicyResult(policy="drift", status=status, reasons=reasons, codes=codes, details=details)
-    return PolicyResult(policy="drift", status="ALLOW", details=details)
+def evaluate_drift_policy(baseline: dict, candidate: dict, thresholds: dict) -> PolicyResult:
+    return compile_drift_policy(thresholds).evaluate(baseline, candidate)
 
 
 def _token_overlap_similarity(left: str, right: str) -> float:
     left_tokens = set(_tokenize(left))
     right_tokens = set(_tokenize(right))
     union = left_tokens | right_tokens
+    count("token_set_size", len(union))
     if not union:
         return 1.0
     intersection = left_tokens & right_tokens
@@ -106,6 +139,7 @@ def _char_ngram_jaccard(left: str, right: str, n: int) -> float:
     left_grams = set(_char_ngrams(_normalize_for_ngrams(left), n))
     right_grams = set(_char_ngrams(_normalize_for_ngrams(right), n))
     union = left_grams | right_grams
+    count("ngram_set_size", len(union))
     if not union:
         return 1.0
     return len(left_grams & right_grams) / len(union)
@@ -113,7 +147,7 @@ def _char_ngram_jaccard(left: str, right: str, n: int) -> float:
 
 def _normalize_for_ngrams(value: str) -> str:
     # Keep it deterministic and cheap: lowercase and keep basic word chars/spaces.
-    return " ".join(re.findall(r"[a-zA-Z0-9_]+", value.lower()))
+    return " ".join(_WORD_RE.findall(value.lower()))
 
 
 def _char_ngrams(value: str, n: int) -> list[str]:
@@ -124,20 +158,41 @@ def _char_ngrams(value: str, n: int) -> list[str]:
     return [value[i : i + n] for i in range(0, len(value) - n + 1)]
 
 
-def _similarity(left: str, right: str, method: str) -> float:
-    if method == "token_jaccard":
-        return _token_overlap_similarity(left, right)
-    if method == "char_3gram_jaccard":
-        return _char_ngram_jaccard(left, right, 3)
+def _similarity_plan(method: str) -> tuple[str | None, ...]:
+    # Flatten a similarity method string into the leaf measures whose max is the score.
+    # None stands for a constant 1.0 (an empty "max()").
+    if method in ("token_jaccard", "char_3gram_jaccard"):
+        return (method,)
     if method.startswith("max(") and method.endswith(")"):
         items = [item.strip() for item in method[4:-1].split(",") if item.strip()]
-        scores = [_similarity(left, right, item) for item in items] if items else [1.0]
-        return max(scores)
-    return _token_overlap_similarity(left, right)
+        if not items:
+            return (None,)
+        plan: list[str | None] = []
+        for item in items:
+            for leaf in _similarity_plan(item):
+                if leaf not in plan:
+                    plan.append(leaf)
+        return tuple(plan)
+    return ("token_jaccard",)
+
+
+def _similarity_from_plan(left: str, right: str, plan: tuple[str | None, ...]) -> float:
+    if left == right:
+        # Every supported measure scores identical text as 1.0; skip tokenizing.
+        return 1.0
+    scores = []
+    for leaf in plan:
+        if leaf is None:
+            scores.append(1.0)
+        elif leaf == "char_3gram_jaccard":
+            scores.append(_char_ngram_jaccard(left, right, 3))
+        else:
+            scores.append(_token_overlap_similarity(left, right))
+    return max(scores)
 
 
 def _tokenize(value: str) -> list[str]:
-    return re.findall(r"[a-zA-Z0-9_]+", value.lower())
+    return _WORD_RE.findall(value.lower())
 
 
 def _top_missing_terms(baseline_text: str, candidate_text: str, limit: int = 3) -> list[str]:
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+
+from breakpoint.engine.policies.patterns import fold_case
+
+_NO_OUTPUT: tuple = ()
+
+
+@dataclass(frozen=True)
+class KeywordSet:
+    """An Aho-Corasick automaton over literal keywords, matched case-insensitively as whole words.
+
+    ``iter_matches()`` reports what ``re.finditer(r"\\b" + re.escape(keyword) + r"\\b", text,
+    re.IGNORECASE)`` would for each keyword (matches of one keyword never overlap; different
+    keywords may), in one pass over the text whatever the number of keywords.
+    """
+
+    keywords: tuple[str, ...]
+    goto: tuple[dict[str, int], ...]
+    fail: tuple[int, ...]
+    output: tuple[tuple[tuple[int, int], ...], ...]
+
+    def iter_matches(self, text: str, pos: int = 0):
+        """Yield (keyword index, start, end) in order of ``end``."""
+        folded = fold_case(text)
+        goto, fail, output = self.goto, self.fail, self.output
+        last_end: dict[int, int] = {}
+        state = 0
+        for index in range(pos, len(folded)):
+            char = folded[index]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword, length in output[state]:
+                end = index + 1
+                start = end - length
+                if start < last_end.get(keyword, 0):
+                    continue
+                if _is_boundary(text, start) and _is_boundary(text, end):
+                    last_end[keyword] = end
+                    yield keyword, start, end
+
+
+def compile_keyword_set(keywords: tuple[str, ...]) -> KeywordSet:
+    goto: list[dict[str, int]] = [{}]
+    terminal: list[list[tuple[int, int]]] = [[]]
+    for keyword_index, keyword in enumerate(keywords):
+        folded = fold_case(keyword)
+        if not folded:
+            continue
+        state = 0
+        for char in folded:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                terminal.append([])
+            state = next_state
+        terminal[state].append((keyword_index, len(folded)))
+
+    # Breadth-first, so a state's failure target is final before its children need it.
+    fail = [0] * len(goto)
+    output: list[tuple[tuple[int, int], ...]] = [_NO_OUTPUT] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        output[state] = tuple(terminal[state]) or _NO_OUTPUT
+    for state in queue:
+        for char, child in goto[state].items():
+            target = fail[state]
+            while target and char not in goto[target]:
+                target = fail[target]
+            fail[child] = goto[target].get(char, 0)
+            output[child] = tuple(terminal[child]) + output[fail[child]] or _NO_OUTPUT
+            queue.append(child)
+    return KeywordSet(keywords=tuple(keywords), goto=tuple(goto), fail=tuple(fail), output=tuple(output))
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    # Same rule as re's \b for str patterns: \w is alphanumeric or "_".
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+    after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+    return before != after
@@ -1,5 +1,7 @@
 from breakpoint.engine.policies.base import PolicyResult
 
+INPUTS = (("baseline", "latency_ms"), ("candidate", "latency_ms"))
+
 
 def evaluate_latency_policy(baseline: dict, candidate: dict, thresholds: dict) -> PolicyResult:
     baseline_latency = _resolve_latency_ms(baseline)
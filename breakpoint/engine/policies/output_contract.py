@@ -1,7 +1,10 @@
 import json
 
+from breakpoint.engine.instrumentation import count
 from breakpoint.engine.policies.base import PolicyResult
 
+INPUTS = (("baseline", "output"), ("candidate", "output"))
+
 
 def evaluate_output_contract_policy(baseline: dict, candidate: dict, config: dict) -> PolicyResult:
     if not bool(config.get("enabled", True)):
@@ -11,6 +14,9 @@ def evaluate_output_contract_policy(baseline: dict, candidate: dict, config: dic
     candidate_raw = candidate.get("output", "")
     baseline_text = baseline_raw if isinstance(baseline_raw, str) else str(baseline_raw)
     candidate_text = candidate_raw if isinstance(candidate_raw, str) else str(candidate_raw)
+    if baseline_text == candidate_text:
+        # Identical output cannot break the contract; skip parsing it twice.
+        return PolicyResult(policy="output_contract", status="ALLOW")
 
     baseline_payload, baseline_error = _parse_json(baseline_text)
     if baseline_error is not None:
@@ -112,6 +118,7 @@ def evaluate_output_contract_policy(baseline: dict, candidate: dict, config: dic
 
 
 def _parse_json(value: str) -> tuple[object | None, str | None]:
+    count("json_chars_parsed", len(value))
     try:
         return json.loads(value), None
     except json.JSONDecodeError as exc:
@@ -0,0 +1,353 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
+# Flags that change matching; re.UNICODE is implied for str patterns.
+_MATCHING_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE | re.ASCII
+_BACKREFERENCE_OPS = (_sre_parse.GROUPREF, _sre_parse.GROUPREF_EXISTS)
+_REPEAT_OPS = (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT, _sre_parse.POSSESSIVE_REPEAT)
+# Flags that change what a literal or character class probe matches.
+_PROBE_FLAGS = re.IGNORECASE | re.ASCII
+# Classes worth probing for; \w, \s and negated classes are in nearly every text.
+_PROBE_CATEGORIES = {_sre_parse.CATEGORY_DIGIT: "\\d"}
+# Fewer probe-positive patterns than this are cheaper to rescan one by one than to scan combined.
+_MIN_COMBINED_SCAN = 8
+# Beyond this a pattern's maximum width is treated as unbounded.
+_MAX_REACH = 4096
+# Characters IGNORECASE treats as equal although their lower-case forms differ (re._casefix);
+# fold_case() maps each group to its first member.
+_CASE_GROUPS = (
+    "i\u0131", "s\u017f", "\u00b5\u03bc", "\u0345\u03b9\u1fbe", "\u0390\u1fd3", "\u03b0\u1fe3",
+    "\u03b2\u03d0", "\u03b5\u03f5", "\u03b8\u03d1", "\u03ba\u03f0", "\u03c0\u03d6", "\u03c1\u03f1",
+    "\u03c2\u03c3", "\u03c6\u03d5", "\u0432\u1c80", "\u0434\u1c81", "\u043e\u1c82", "\u0441\u1c83",
+    "\u0442\u1c84\u1c85", "\u044a\u1c86", "\u0463\u1c87", "\u1c88\ua64b", "\u1e61\u1e9b", "\ufb05\ufb06",
+)
+_CASE_FOLDS = str.maketrans({char: group[0] for group in _CASE_GROUPS for char in group[1:]})
+
+
+@dataclass(frozen=True)
+class PrefilteredPattern:
+    """A regex plus a cheap probe for text that every match must contain.
+
+    The probe is the longest literal the pattern requires (``"@"``, ``"system prompt"``), a
+    required digit class, or an alternation of one of those per branch. When the probe is absent
+    the regex never runs. When the pattern's width is bounded, the regex is only tried at start
+    positions within ``reach`` characters before a probe hit; otherwise it scans from ``pos``.
+    ``finditer()`` returns the same matches as ``regex.finditer()``.
+
+    Literal probes are found with ``str.find``; with ``fold`` the literal is lower-case ASCII and
+    is looked up in a lower-cased copy of the text, since case-insensitive sre searches are slow.
+    A one-character class probe lists its ASCII members in ``ascii_chars``, so ASCII text
+    without any of them is ruled out by a few ``str.find`` calls.
+    """
+
+    regex: re.Pattern
+    probe: re.Pattern | None = None
+    reach: int | None = None
+    literal: str | None = None
+    fold: bool = False
+    ascii_chars: str | None = None
+
+    @property
+    def pattern(self) -> str:
+        return self.regex.pattern
+
+    def finditer(self, text: str, pos: int = 0):
+        if self.probe is None:
+            yield from self.regex.finditer(text, pos)
+            return
+        haystack = fold_case(text) if self.fold else text
+        hit = self._find(haystack, pos)
+        if hit < 0:
+            return
+        if self.reach is None:
+            yield from self.regex.finditer(text, pos)
+            return
+        # Every match starts at most `reach` characters before a probe hit inside it, so start
+        # positions outside those windows cannot match. Starts below `cursor` are done.
+        cursor = pos
+        attempts_left = 64 + (len(text) - pos) // 64
+        while hit >= 0:
+            attempts_left -= 1
+            for start in range(max(cursor, hit - self.reach), hit + 1):
+                attempts_left -= 1
+                match = self.regex.match(text, start)
+                if match:
+                    yield match
+                    cursor = match.end()
+                    break
+            else:
+                cursor = max(cursor, hit + 1)
+            if attempts_left <= 0:
+                # Probe hits are dense here; a plain scan is cheaper than one match() per start.
+                yield from self.regex.finditer(text, cursor)
+                return
+            hit = self._find(haystack, cursor)
+
+    def search(self, text: str, pos: int = 0) -> re.Match | None:
+        return next(self.finditer(text, pos), None)
+
+    def has_probe_hit(self, text: str, pos: int = 0) -> bool:
+        """False only when no match is possible; True does not promise one."""
+        return self.probe is None or self._find(fold_case(text) if self.fold else text, pos) >= 0
+
+    def _find(self, haystack: str, pos: int) -> int:
+        if self.literal is not None:
+            return haystack.find(self.literal, pos)
+        if self.ascii_chars is not None and haystack.isascii():
+            if all(haystack.find(char, pos) < 0 for char in self.ascii_chars):
+                return -1
+        hit = self.probe.search(haystack, pos)
+        return -1 if hit is None else hit.start()
+
+
+@dataclass(frozen=True)
+class PatternSet:
+    """Finds which of several regexes (compiled with the same flags) match a text.
+
+    Combinable patterns are scanned together as one alternation and the rest one by one. The
+    scan uses a group-free alternation, since capture groups make sre save state on every branch
+    it tries (about 20x slower); each hit is attributed to a pattern by re-matching the named-group
+    form at its start. An alternation reports one pattern per position, so a pattern whose
+    matches all overlap another's can be hidden; ``matching()`` rescans the patterns not seen yet
+    until a pass finds none, which keeps the answer exact.
+    """
+
+    sources: tuple[str, ...]
+    flags: int
+    combined: tuple[int, ...]
+    separate: tuple[re.Pattern, ...]
+    separate_indices: tuple[int, ...]
+    prefilters: tuple[PrefilteredPattern, ...] = ()
+
+    def matching(self, text: str, pos: int = 0) -> set[int]:
+        """Indices of the patterns with at least one match in ``text[pos:]`` (before any filtering)."""
+        return self._matching(text, pos, self._probed(text, pos))
+
+    def candidates(self, text: str, pos: int = 0) -> set[int]:
+        """A superset of ``matching()``: patterns whose probe is absent are dropped, and the
+        combined scan only runs when enough patterns are left for it to beat scanning them."""
+        possible = self._probed(text, pos)
+        if sum(index in self.combined for index in possible) < _MIN_COMBINED_SCAN:
+            return set(possible)
+        return self._matching(text, pos, possible)
+
+    def _probed(self, text: str, pos: int) -> tuple[int, ...]:
+        # Patterns whose required literal is missing cannot match.
+        if not self.prefilters:
+            return tuple(range(len(self.sources)))
+        return tuple(index for index, pattern in enumerate(self.prefilters) if pattern.has_probe_hit(text, pos))
+
+    def _matching(self, text: str, pos: int, possible: tuple[int, ...]) -> set[int]:
+        found: set[int] = set()
+        remaining = tuple(index for index in self.combined if index in possible)
+        while remaining:
+            sources = tuple(self.sources[index] for index in remaining)
+            scanner = alternation(sources, self.flags, remaining, named=False)
+            labeller = alternation(sources, self.flags, remaining)
+            seen = {int(labeller.match(text, match.start()).lastgroup[2:]) for match in scanner.finditer(text, pos)}
+            if not seen:
+                break
+            found |= seen
+            remaining = tuple(index for index in remaining if index not in seen)
+        for index, regex in zip(self.separate_indices, self.separate):
+            if index in possible and (self.prefilters[index] if self.prefilters else regex).search(text, pos):
+                found.add(index)
+        return found
+
+
+def compile_pattern_set(regexes: tuple[re.Pattern, ...]) -> PatternSet:
+    flags = regexes[0].flags & _MATCHING_FLAGS if regexes else 0
+    combined = [index for index, regex in enumerate(regexes) if _fits(regex, flags)]
+    sources = tuple(regex.pattern for regex in regexes)
+    try:
+        if len(combined) > 1:
+            alternation(tuple(sources[index] for index in combined), flags, tuple(combined))
+        else:
+            combined = []
+    except re.error:
+        combined = []
+    separate = [index for index in range(len(regexes)) if index not in combined]
+    return PatternSet(
+        sources=sources,
+        flags=flags,
+        combined=tuple(combined),
+        separate=tuple(regexes[index] for index in separate),
+        separate_indices=tuple(separate),
+        prefilters=tuple(prefilter(regex) for regex in regexes),
+    )
+
+
+def prefilter(regex: re.Pattern) -> PrefilteredPattern:
+    """Wrap ``regex`` with the most selective probe that every match must contain, if any."""
+    return _prefilter(regex.pattern, regex.flags)
+
+
+@lru_cache(maxsize=1024)
+def _prefilter(pattern: str, flags: int) -> PrefilteredPattern:
+    # Memoized on the source: every Evaluator compiles the same default patterns again.
+    regex = re.compile(pattern, flags)
+    try:
+        parsed = _sre_parse.parse(regex.pattern, regex.flags)
+    except re.error:
+        return PrefilteredPattern(regex)
+    min_width, max_width = parsed.getwidth()
+    requirement = _best(_requirements(parsed)) if min_width > 0 else None
+    if requirement is None:
+        return PrefilteredPattern(regex)
+    source, probe_width, score, literal = requirement
+    try:
+        probe = re.compile(source, regex.flags & _PROBE_FLAGS)
+    except re.error:
+        return PrefilteredPattern(regex)
+    reach = max_width - probe_width if max_width <= _MAX_REACH else None
+    fold = bool(regex.flags & re.IGNORECASE)
+    if literal is not None and fold:
+        literal = literal.lower() if literal.isascii() else None
+    ascii_chars = None
+    if literal is None and probe_width == 1 and score == 1:
+        members = "".join(char for char in map(chr, range(128)) if probe.fullmatch(char))
+        ascii_chars = members if len(members) <= 16 else None
+    return PrefilteredPattern(regex, probe, reach, literal, fold and literal is not None, ascii_chars)
+
+
+def combine_any(regexes: tuple[re.Pattern, ...]) -> tuple[re.Pattern, ...]:
+    """Regexes equivalent to ``regexes`` for an any-of search: combinable ones merged into one."""
+    if len(regexes) < 2:
+        return regexes
+    flags = regexes[0].flags & _MATCHING_FLAGS
+    combinable = [regex for regex in regexes if _fits(regex, flags)]
+    if len(combinable) < 2:
+        return regexes
+    try:
+        merged = re.compile("|".join(f"(?:{regex.pattern})" for regex in combinable), flags)
+    except re.error:
+        return regexes
+    return (merged,) + tuple(regex for regex in regexes if regex not in combinable)
+
+
+@lru_cache(maxsize=1024)
+def is_combinable(pattern: str) -> bool:
+    """True when ``pattern`` means the same inside an alternation: no global inline flags, no
+    named groups or backreferences (group names and numbers would clash), and no empty match."""
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except re.error:
+        return False
+    if parsed.state.flags & _MATCHING_FLAGS or parsed.state.groupdict or parsed.getwidth()[0] == 0:
+        return False
+    return not any(op in _BACKREFERENCE_OPS for op in _walk(parsed))
+
+
+@lru_cache(maxsize=256)
+def alternation(sources: tuple[str, ...], flags: int, indices: tuple[int, ...], named: bool = True) -> re.Pattern:
+    """One regex matching any of ``sources``; when ``named``, ``match.lastgroup`` is ``_p<index>``.
+
+    A ``\\b`` that starts every alternative is hoisted in front of the group, so positions that
+    are not word boundaries are rejected once instead of once per pattern.
+    """
+    hoist = all(source.startswith("\\b") and _starts_with_boundary(source) for source in sources)
+    bodies = [source[2:] if hoist else source for source in sources]
+    branches = "|".join(
+        f"(?P<_p{index}>{body})" if named else f"(?:{body})" for index, body in zip(indices, bodies)
+    )
+    return re.compile(f"\\b(?:{branches})" if hoist else branches, flags)
+
+
+def _fits(regex: re.Pattern, flags: int) -> bool:
+    # Verbose patterns are left alone: a trailing "# comment" would swallow the closing group.
+    return regex.flags & _MATCHING_FLAGS == flags and not flags & re.VERBOSE and is_combinable(regex.pattern)
+
+
+def _starts_with_boundary(pattern: str) -> bool:
+    # False for e.g. r"\bfoo|bar", where the \b belongs to one branch only.
+    parsed = _sre_parse.parse(pattern)
+    return len(parsed) > 0 and parsed[0] == (_sre_parse.AT, _sre_parse.AT_BOUNDARY)
+
+
+def _requirements(subpattern) -> list[tuple[str, int, int, str | None]]:
+    # (probe source, minimum probe width, score, literal or None) for pieces every match of
+    # `subpattern` contains.
+    found = []
+    run: list[str] = []
+    for op, argument in list(subpattern) + [(None, None)]:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(argument))
+            continue
+        if run:
+            literal = "".join(run)
+            found.append((re.escape(literal), len(literal), len(literal) + 1, literal))
+            run = []
+        if op is _sre_parse.IN:
+            probe = _class_source(argument)
+            if probe is not None:
+                found.append((probe, 1, 1, None))
+        elif op is _sre_parse.SUBPATTERN:
+            _group, add_flags, del_flags, child = argument
+            if not add_flags and not del_flags:
+                found.extend(_requirements(child))
+        elif op in _REPEAT_OPS:
+            low, _high, child = argument
+            if low >= 1:
+                found.extend(_requirements(child))
+        elif op is _sre_parse.ATOMIC_GROUP:
+            found.extend(_requirements(argument))
+        elif op is _sre_parse.BRANCH:
+            branches = [_best(_requirements(child)) for child in argument[1]]
+            if branches and all(branch is not None for branch in branches):
+                source = "|".join(f"(?:{branch[0]})" for branch in branches)
+                width = min(branch[1] for branch in branches)
+                found.append((source, width, min(branch[2] for branch in branches), None))
+    return found
+
+
+def _best(requirements: list[tuple[str, int, int, str | None]]) -> tuple[str, int, int, str | None] | None:
+    return max(requirements, key=lambda requirement: requirement[2], default=None)
+
+
+def _class_source(items) -> str | None:
+    parts = []
+    for op, argument in items:
+        if op is _sre_parse.LITERAL:
+            parts.append(re.escape(chr(argument)))
+        elif op is _sre_parse.RANGE:
+            parts.append(f"{re.escape(chr(argument[0]))}-{re.escape(chr(argument[1]))}")
+        elif op is _sre_parse.CATEGORY and argument in _PROBE_CATEGORIES:
+            parts.append(_PROBE_CATEGORIES[argument])
+        else:
+            return None
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 and len(items) == 1 and items[0][0] is _sre_parse.CATEGORY else f"[{''.join(parts)}]"
+
+
+def fold_case(text: str) -> str:
+    """Fold ``text`` so two strings are equal exactly when ``re.IGNORECASE`` matches them character
+    by character. Offsets are preserved: every character folds to exactly one character."""
+    if text.isascii():
+        return text.lower()
+    folded = text.lower()
+    if len(folded) != len(text):
+        # "İ" lower-cases to "i" plus a combining dot; re uses the one-character mapping, "i".
+        folded = "".join(char.lower()[0] for char in text)
+    return folded.translate(_CASE_FOLDS)
+
+
+def _walk(subpattern):
+    for op, argument in subpattern:
+        yield op
+        for child in _children(argument):
+            yield from _walk(child)
+
+
+def _children(argument):
+    if isinstance(argument, _sre_parse.SubPattern):
+        yield argument
+    elif isinstance(argument, (tuple, list)):
+        for item in argument:
+            yield from _children(item)
@@ -1,28 +1,136 @@
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 
+from breakpoint.engine.instrumentation import count
 from breakpoint.engine.policies.base import PolicyResult
+from breakpoint.engine.policies.detectors import CreditCardDetector, compile_detector
+from breakpoint.engine.policies.patterns import PatternSet, combine_any, compile_pattern_set
 
+INPUTS = (("candidate", "output"),)
 
-def evaluate_pii_policy(candidate: dict, patterns: dict, allowlist: list[str]) -> PolicyResult:
-    text = candidate.get("output", "")
-    if not isinstance(text, str):
-        text = str(text)
-
-    blocked_type_counts: dict[str, int] = {}
-    compiled_allowlist = [re.compile(item) for item in allowlist]
-    for label, pattern in patterns.items():
-        regex = re.compile(pattern)
-        count = 0
-        for match in regex.finditer(text):
+
+@dataclass(frozen=True)
+class CompiledPiiPolicy:
+    patterns: tuple[tuple[str, re.Pattern | CreditCardDetector], ...]
+    allowlist: tuple[re.Pattern, ...]
+    pattern_set: PatternSet | None = None
+    # Index in `patterns` of each regex in `pattern_set`; detectors are not part of it.
+    pattern_set_indices: tuple[int, ...] = ()
+
+    def iter_findings(self, text: str, pos: int = 0):
+        """Yield (label, start, end) for every match that survives the allowlist and validators."""
+        scanners = None
+        if self.pattern_set is not None:
+            # Prefilter probes and (for many candidates) one combined pass rule out types that
+            # cannot occur; the rest are scanned on their own, so counts match a finditer() per
+            # pattern.
+            scanners = {
+                self.pattern_set_indices[index]: self.pattern_set.prefilters[index]
+                for index in self.pattern_set.candidates(text, pos)
+            }
+        for index, (label, pattern) in enumerate(self.patterns):
+            if scanners is not None and not isinstance(pattern, CreditCardDetector):
+                if index not in scanners:
+                    continue
+                pattern = scanners[index]
+            yield from self._findings(label, pattern, text, pos)
+
+    def pattern_sources(self) -> tuple[tuple[str, str], ...]:
+        """(label, pattern) of each scan ``iter_pattern_scans()`` yields, in the same order."""
+        return tuple((label, pattern.pattern) for label, pattern in self.patterns)
+
+    def iter_pattern_scans(self, text: str, pos: int = 0):
+        """Yield one lazy iterator of findings per pattern, with no combined pass in between, so a
+        caller can time (and abandon) each pattern on its own."""
+        prefilters = {}
+        if self.pattern_set is not None:
+            prefilters = dict(zip(self.pattern_set_indices, self.pattern_set.prefilters))
+        for index, (label, pattern) in enumerate(self.patterns):
+            yield self._findings(label, prefilters.get(index, pattern), text, pos)
+
+    def _findings(self, label: str, pattern, text: str, pos: int):
+        if isinstance(pattern, CreditCardDetector):
+            for start, end in pattern.iter_spans(text, pos):
+                if not _is_allowlisted_value(text[start:end], self.allowlist):
+                    yield label, start, end
+            return
+        is_credit_card = label.lower() == "credit_card"
+        for match in pattern.finditer(text, pos):
             value = match.group(0)
-            if _is_allowlisted_value(value, compiled_allowlist):
+            if _is_allowlisted_value(value, self.allowlist):
                 continue
-            if label.lower() == "credit_card" and not _is_luhn_valid(value):
+            if is_credit_card and not _is_luhn_valid(value):
+                count("luhn_rejected")
                 continue
-            count += 1
-        if count > 0:
-            blocked_type_counts[label.upper()] = count
+            yield label, match.start(), match.end()
+
+    def __call__(self, baseline: dict, candidate: dict) -> PolicyResult:
+        return self.evaluate(candidate)
+
+    def evaluate(self, candidate: dict) -> PolicyResult:
+        text = candidate.get("output", "")
+        if not isinstance(text, str):
+            text = str(text)
+
+        counts: dict[str, int] = {}
+        for label, _start, _end in self.iter_findings(text):
+            counts[label] = counts.get(label, 0) + 1
+        count("chars_scanned", len(text))
+        count("regex_matches", sum(counts.values()))
+        return self.result_from_counts(counts)
+
+    def result_from_counts(self, counts: dict[str, int]) -> PolicyResult:
+        blocked_type_counts: dict[str, int] = {}
+        for label, _pattern in self.patterns:
+            if counts.get(label, 0) > 0:
+                blocked_type_counts[label.upper()] = counts[label]
+        return _pii_result(blocked_type_counts)
+
+
+def compile_pii_policy(patterns: dict, allowlist: list[str]) -> CompiledPiiPolicy:
+    """``patterns`` maps each label to a regex or to a built-in detector, ``{"detector": name}``."""
+    # Allowlist entries are only ever checked as "does any match", so they collapse into one regex.
+    compiled_allowlist = combine_any(tuple(re.compile(item) for item in allowlist))
+    compiled_patterns = tuple(
+        (label, compile_detector(pattern["detector"]) if isinstance(pattern, dict) else re.compile(pattern))
+        for label, pattern in patterns.items()
+    )
+    regex_indices = tuple(
+        index for index, (_label, pattern) in enumerate(compiled_patterns) if isinstance(pattern, re.Pattern)
+    )
+    return CompiledPiiPolicy(
+        patterns=compiled_patterns,
+        allowlist=compiled_allowlist,
+        pattern_set=compile_pattern_set(tuple(compiled_patterns[index][1] for index in regex_indices)),
+        pattern_set_indices=regex_indices,
+    )
+
+
+def cached_pii_policy(patterns: dict, allowlist: list[str]) -> CompiledPiiPolicy:
+    """``compile_pii_policy()`` memoized on the pattern and allowlist values."""
+    key = tuple((label, _hashable(pattern)) for label, pattern in patterns.items())
+    return _cached_pii_policy(key, tuple(allowlist))
+
+
+def evaluate_pii_policy(candidate: dict, patterns: dict, allowlist: list[str]) -> PolicyResult:
+    return cached_pii_policy(patterns, allowlist).evaluate(candidate)
+
+
+@lru_cache(maxsize=32)
+def _cached_pii_policy(patterns: tuple, allowlist: tuple) -> CompiledPiiPolicy:
+    return compile_pii_policy({label: _unhashable(pattern) for label, pattern in patterns}, list(allowlist))
+
+
+def _hashable(pattern):
+    return tuple(sorted(pattern.items())) if isinstance(pattern, dict) else pattern
+
+
+def _unhashable(pattern):
+    return dict(pattern) if isinstance(pattern, tuple) else pattern
+
 
+def _pii_result(blocked_type_counts: dict[str, int]) -> PolicyResult:
     if blocked_type_counts:
         blocked_patterns = sorted(blocked_type_counts.keys())
         total = sum(blocked_type_counts.values())
@@ -41,7 +149,7 @@ def evaluate_pii_policy(candidate: dict, patterns: dict, allowlist: list[str]) -
     return PolicyResult(policy="pii", status="ALLOW")
 
 
-def _is_allowlisted_value(value: str, allowlist: list[re.Pattern]) -> bool:
+def _is_allowlisted_value(value: str, allowlist: tuple[re.Pattern, ...]) -> bool:
     for allowed in allowlist:
         if allowed.search(value):
             return True
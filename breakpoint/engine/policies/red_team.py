@@ -1,36 +1,153 @@
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 
+from breakpoint.engine.instrumentation import count
 from breakpoint.engine.policies.base import PolicyResult
+from breakpoint.engine.policies.keywords import KeywordSet, compile_keyword_set
+from breakpoint.engine.policies.patterns import PrefilteredPattern, prefilter
 
+INPUTS = (("candidate", "output"),)
 
-def evaluate_red_team_policy(candidate: dict, config: dict) -> PolicyResult:
-    if not bool(config.get("enabled", True)):
-        return PolicyResult(policy="red_team", status="ALLOW")
 
-    text = candidate.get("output", "")
-    if not isinstance(text, str):
-        text = str(text)
+@dataclass(frozen=True)
+class CompiledRedTeamPolicy:
+    enabled: bool
+    categories: tuple[tuple[str, tuple[PrefilteredPattern, ...]], ...]
+    # Keywords of every category share one automaton; keyword_categories[i] owns keyword i.
+    keywords: KeywordSet | None = None
+    keyword_categories: tuple[str, ...] = ()
+
+    def iter_findings(self, text: str, pos: int = 0):
+        """Yield (category, start, end) for every pattern and keyword match in text."""
+        for category_name, regexes in self.categories:
+            for regex in regexes:
+                for match in regex.finditer(text, pos):
+                    yield category_name, match.start(), match.end()
+        if self.keywords is not None:
+            for keyword, start, end in self.keywords.iter_matches(text, pos):
+                yield self.keyword_categories[keyword], start, end
+
+    def pattern_sources(self) -> tuple[tuple[str, str], ...]:
+        """(category, pattern) of each scan ``iter_pattern_scans()`` yields, in the same order;
+        all keywords are one scan."""
+        sources = tuple(
+            (category_name, regex.pattern) for category_name, regexes in self.categories for regex in regexes
+        )
+        if self.keywords is not None:
+            sources += (("keywords", f"<{len(self.keywords.keywords)} keywords>"),)
+        return sources
+
+    def iter_pattern_scans(self, text: str, pos: int = 0):
+        """Yield one lazy iterator of findings per regex, then one for the keywords."""
+        for category_name, regexes in self.categories:
+            for regex in regexes:
+                yield ((category_name, match.start(), match.end()) for match in regex.finditer(text, pos))
+        if self.keywords is not None:
+            yield (
+                (self.keyword_categories[keyword], start, end)
+                for keyword, start, end in self.keywords.iter_matches(text, pos)
+            )
 
-    blocked_type_counts: dict[str, int] = {}
-    categories = config.get("categories", {})
-    
-    for category_name, patterns in categories.items():
+    def __call__(self, baseline: dict, candidate: dict) -> PolicyResult:
+        return self.evaluate(candidate)
+
+    def evaluate(self, candidate: dict) -> PolicyResult:
+        if not self.enabled:
+            return PolicyResult(policy="red_team", status="ALLOW")
+
+        text = candidate.get("output", "")
+        if not isinstance(text, str):
+            text = str(text)
+
+        counts: dict[str, int] = {}
+        for category_name, _start, _end in self.iter_findings(text):
+            counts[category_name] = counts.get(category_name, 0) + 1
+        count("chars_scanned", len(text))
+        count("regex_matches", sum(counts.values()))
+        return self.result_from_counts(counts)
+
+    def result_from_counts(self, counts: dict[str, int]) -> PolicyResult:
+        blocked_type_counts: dict[str, int] = {}
+        for category_name, _regexes in self.categories:
+            if counts.get(category_name, 0) > 0:
+                blocked_type_counts[category_name.upper()] = counts[category_name]
+        return _red_team_result(blocked_type_counts)
+
+
+def compile_red_team_policy(config: dict) -> CompiledRedTeamPolicy:
+    """Categories are a list of regexes or ``{"patterns": [...], "keywords": [...]}``; keywords are
+    literal terms matched case-insensitively as whole words."""
+    enabled = bool(config.get("enabled", True))
+    categories = []
+    keywords: list[str] = []
+    keyword_categories: list[str] = []
+    for category_name, entry in config.get("categories", {}).items():
+        if isinstance(entry, dict):
+            patterns = entry.get("patterns", [])
+            for keyword in entry.get("keywords", []):
+                if isinstance(keyword, str) and keyword:
+                    keywords.append(keyword)
+                    keyword_categories.append(category_name)
+        else:
+            patterns = entry
         if not isinstance(patterns, list):
             continue
-            
-        count = 0
+        regexes = []
         for pattern in patterns:
             try:
                 # Use case-insensitive matching by default for red team patterns
-                regex = re.compile(pattern, re.IGNORECASE)
-                matches = list(regex.finditer(text))
-                count += len(matches)
+                regexes.append(prefilter(re.compile(pattern, re.IGNORECASE)))
             except re.error:
                 continue
-                
-        if count > 0:
-            blocked_type_counts[category_name.upper()] = count
+        categories.append((category_name, tuple(regexes)))
+    return CompiledRedTeamPolicy(
+        enabled=enabled,
+        categories=tuple(categories),
+        keywords=compile_keyword_set(tuple(keywords)) if keywords else None,
+        keyword_categories=tuple(keyword_categories),
+    )
+
+
+def cached_red_team_policy(config: dict) -> CompiledRedTeamPolicy:
+    """``compile_red_team_policy()`` memoized on the config's contents, so the keyword automaton
+    and pattern prefilters are built once per distinct config."""
+    try:
+        return _cached_red_team_policy(_hashable(config))
+    except TypeError:  # a value that cannot be a cache key
+        return compile_red_team_policy(config)
+
+
+def evaluate_red_team_policy(candidate: dict, config: dict) -> PolicyResult:
+    if not bool(config.get("enabled", True)):
+        return PolicyResult(policy="red_team", status="ALLOW")
+    return cached_red_team_policy(config).evaluate(candidate)
+
+
+@lru_cache(maxsize=32)
+def _cached_red_team_policy(config: tuple) -> CompiledRedTeamPolicy:
+    return compile_red_team_policy(_unhashable(config))
+
+
+def _hashable(value):
+    # Tagged so _unhashable() rebuilds the same types; compile_red_team_policy() checks them.
+    if isinstance(value, dict):
+        return (dict, tuple((key, _hashable(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_hashable(item) for item in value))
+    hash(value)
+    return value
+
+
+def _unhashable(value):
+    if isinstance(value, tuple) and value and value[0] is dict:
+        return {key: _unhashable(item) for key, item in value[1]}
+    if isinstance(value, tuple) and value and value[0] is list:
+        return [_unhashable(item) for item in value[1]]
+    return value
+
 
+def _red_team_result(blocked_type_counts: dict[str, int]) -> PolicyResult:
     if blocked_type_counts:
         blocked_categories = sorted(blocked_type_counts.keys())
         total = sum(blocked_type_counts.values())
@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable
+
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.policies.base import Policy, PolicyResult
+from breakpoint.engine.policies.budget import with_regex_budget
+from breakpoint.engine.policies.cost import INPUTS as COST_INPUTS
+from breakpoint.engine.policies.cost import evaluate_cost_policy
+from breakpoint.engine.policies.drift import INPUTS as DRIFT_INPUTS
+from breakpoint.engine.policies.drift import compile_drift_policy
+from breakpoint.engine.policies.latency import INPUTS as LATENCY_INPUTS
+from breakpoint.engine.policies.latency import evaluate_latency_policy
+from breakpoint.engine.policies.output_contract import INPUTS as OUTPUT_CONTRACT_INPUTS
+from breakpoint.engine.policies.output_contract import evaluate_output_contract_policy
+from breakpoint.engine.policies.pii import INPUTS as PII_INPUTS
+from breakpoint.engine.policies.pii import cached_pii_policy
+from breakpoint.engine.policies.red_team import INPUTS as RED_TEAM_INPUTS
+from breakpoint.engine.policies.red_team import cached_red_team_policy
+
+ENTRY_POINT_GROUP = "breakpoint.policies"
+
+_MODES = ("lite", "full")
+_SIDES = ("baseline", "candidate")
+
+
+@dataclass(frozen=True)
+class BuiltinPolicy:
+    name: str
+    modes: tuple[str, ...]
+    inputs: tuple[tuple[str, str], ...]
+    cost: int
+    select_config: Callable[[dict, str], object]
+    compile: Callable[[object], Callable[[dict, dict], PolicyResult]]
+
+    def policy_config(self, config: dict, mode: str) -> object:
+        return self.select_config(config, mode)
+
+    def bind(self, policy_config: object) -> Callable[[dict, dict], PolicyResult]:
+        return self.compile(policy_config)
+
+
+def _cost_config(config: dict, mode: str) -> tuple[dict, dict]:
+    return config["cost_policy"], config.get("model_pricing", {})
+
+
+def _bind_cost(policy_config: tuple[dict, dict]):
+    thresholds, pricing = policy_config
+    return partial(_run_cost_policy, thresholds, pricing)
+
+
+def _run_cost_policy(thresholds: dict, pricing: dict, baseline: dict, candidate: dict) -> PolicyResult:
+    return evaluate_cost_policy(baseline=baseline, candidate=candidate, thresholds=thresholds, pricing=pricing)
+
+
+def _bind_latency(thresholds: dict):
+    return partial(_run_latency_policy, thresholds)
+
+
+def _run_latency_policy(thresholds: dict, baseline: dict, candidate: dict) -> PolicyResult:
+    return evaluate_latency_policy(baseline=baseline, candidate=candidate, thresholds=thresholds)
+
+
+def _bind_output_contract(config: dict):
+    return partial(_run_output_contract_policy, config)
+
+
+def _run_output_contract_policy(config: dict, baseline: dict, candidate: dict) -> PolicyResult:
+    return evaluate_output_contract_policy(baseline=baseline, candidate=candidate, config=config)
+
+
+def _bind_pii(policy_config: dict):
+    policy = cached_pii_policy(patterns=policy_config["patterns"], allowlist=policy_config.get("allowlist", []))
+    return with_regex_budget(policy, policy_config.get("regex_budget"))
+
+
+def _bind_red_team(policy_config: dict):
+    return with_regex_budget(cached_red_team_policy(policy_config), policy_config.get("regex_budget"))
+
+
+def _drift_config(config: dict, mode: str) -> dict:
+    thresholds = config.get("drift_policy", {})
+    if not isinstance(thresholds, dict):
+        return {"semantic_check_enabled": False} if mode == "lite" else {}
+    result = dict(thresholds)
+    if mode == "lite":
+        result["semantic_check_enabled"] = False
+    return result
+
+
+def _section(name: str):
+    return partial(_config_section, name)
+
+
+def _config_section(name: str, config: dict, mode: str) -> dict:
+    return config.get(name, {})
+
+
+# Canonical order: this is the order of policy results, reasons and reason codes in every decision.
+BUILTIN_POLICIES: tuple[BuiltinPolicy, ...] = (
+    BuiltinPolicy("cost", _MODES, COST_INPUTS, 1, _cost_config, _bind_cost),
+    BuiltinPolicy("latency", ("full",), LATENCY_INPUTS, 1, _section("latency_policy"), _bind_latency),
+    BuiltinPolicy("pii", _MODES, PII_INPUTS, 5, _section("pii_policy"), _bind_pii),
+    BuiltinPolicy(
+        "output_contract",
+        ("full",),
+        OUTPUT_CONTRACT_INPUTS,
+        2,
+        _section("output_contract_policy"),
+        _bind_output_contract,
+    ),
+    BuiltinPolicy("drift", _MODES, DRIFT_INPUTS, 8, _drift_config, compile_drift_policy),
+    BuiltinPolicy("red_team", ("full",), RED_TEAM_INPUTS, 5, _section("red_team_policy"), _bind_red_team),
+)
+
+
+def registered_policies() -> tuple[Policy, ...]:
+    """Built-in policies in canonical order, then plugin policies sorted by name."""
+    return BUILTIN_POLICIES + _plugin_policies()
+
+
+def policies_for_mode(mode: str) -> tuple[Policy, ...]:
+    return tuple(policy for policy in registered_policies() if mode in policy.modes)
+
+
+def policy_for_reason_code(code: str) -> str | None:
+    """The registered policy a decision reason code belongs to: the one whose upper-cased name,
+    followed by ``_``, starts the code (the longest such name wins), or None."""
+    names = [policy.name for policy in registered_policies() if code.startswith(f"{policy.name.upper()}_")]
+    return max(names, key=len, default=None)
+
+
+def reload_plugin_policies() -> None:
+    """Forget loaded plugins so the next Evaluator rescans the entry-point group."""
+    _plugin_policies.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _plugin_policies() -> tuple[Policy, ...]:
+    reserved = {policy.name for policy in BUILTIN_POLICIES}
+    loaded: dict[str, Policy] = {}
+    for entry_point in _entry_points():
+        try:
+            target = entry_point.load()
+            policy = target() if isinstance(target, type) else target
+        except Exception as exc:
+            raise ConfigValidationError(f"Failed to load policy plugin '{entry_point.name}': {exc}") from exc
+        _validate_plugin(policy, entry_point.name)
+        if policy.name in reserved or policy.name in loaded:
+            raise ConfigValidationError(
+                f"Policy plugin '{entry_point.name}' uses a name that is already registered: {policy.name!r}."
+            )
+        loaded[policy.name] = policy
+    return tuple(loaded[name] for name in sorted(loaded))
+
+
+def _entry_points():
+    from importlib.metadata import entry_points
+
+    return entry_points(group=ENTRY_POINT_GROUP)
+
+
+def _validate_plugin(policy: object, source: str) -> None:
+    name = getattr(policy, "name", None)
+    if not isinstance(name, str) or not name.strip():
+        raise ConfigValidationError(f"Policy plugin '{source}' must define a non-empty string name.")
+    modes = getattr(policy, "modes", None)
+    if not isinstance(modes, (tuple, list)) or not modes or any(mode not in _MODES for mode in modes):
+        raise ConfigValidationError(f"Policy plugin '{source}' modes must be a non-empty subset of {_MODES}.")
+    inputs = getattr(policy, "inputs", None)
+    if not isinstance(inputs, (tuple, list)) or any(
+        not isinstance(item, (tuple, list))
+        or len(item) != 2
+        or item[0] not in _SIDES
+        or not isinstance(item[1], str)
+        for item in inputs
+    ):
+        raise ConfigValidationError(f"Policy plugin '{source}' inputs must be (side, field) pairs.")
+    cost = getattr(policy, "cost", None)
+    if isinstance(cost, bool) or not isinstance(cost, (int, float)) or cost < 0:
+        raise ConfigValidationError(f"Policy plugin '{source}' cost must be a non-negative number.")
+    for method in ("policy_config", "bind"):
+        if not callable(getattr(policy, method, None)):
+            raise ConfigValidationError(f"Policy plugin '{source}' must define {method}().")
@@ -7,6 +7,8 @@ INTERNAL_TO_DECISION = {
     "PII_BLOCK_PHONE": "PII_PHONE_BLOCK",
     "PII_BLOCK_CREDIT_CARD": "PII_CREDIT_CARD_BLOCK",
     "PII_BLOCK_SSN": "PII_SSN_BLOCK",
+    "PII_WARN_REGEX_BUDGET": "PII_REGEX_BUDGET_WARN",
+    "PII_BLOCK_REGEX_BUDGET": "PII_REGEX_BUDGET_BLOCK",
     "DRIFT_BLOCK_EMPTY": "DRIFT_EMPTY_OUTPUT_BLOCK",
     "DRIFT_WARN_SHORT_OUTPUT": "DRIFT_TOO_SHORT_WARN",
     "DRIFT_WARN_EXPANSION": "DRIFT_EXPANSION_WARN",
@@ -17,6 +19,8 @@ INTERNAL_TO_DECISION = {
     "RED_TEAM_BLOCK_INJECTION": "RED_TEAM_INJECTION_BLOCK",
     "RED_TEAM_BLOCK_TOXICITY": "RED_TEAM_TOXICITY_BLOCK",
     "RED_TEAM_BLOCK_COMPETITORS": "RED_TEAM_COMPETITORS_BLOCK",
+    "RED_TEAM_WARN_REGEX_BUDGET": "RED_TEAM_REGEX_BUDGET_WARN",
+    "RED_TEAM_BLOCK_REGEX_BUDGET": "RED_TEAM_REGEX_BUDGET_BLOCK",
     "CONTRACT_BLOCK_INVALID_JSON": "OUTPUT_CONTRACT_INVALID_JSON_BLOCK",
     "CONTRACT_WARN_INVALID_JSON": "OUTPUT_CONTRACT_INVALID_JSON_WARN",
     "CONTRACT_BLOCK_TYPE_CHANGE": "OUTPUT_CONTRACT_TYPE_CHANGE_BLOCK",
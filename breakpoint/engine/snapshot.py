@@ -0,0 +1,195 @@
+import copy
+import hashlib
+import json
+import os
+import re
+import tempfile
+from functools import lru_cache
+from importlib import resources
+
+from breakpoint.engine.config import _freeze, load_config, resolve_config_sources
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.memo import engine_fingerprint, engine_version
+from breakpoint.engine.telemetry import record_config_load
+
+SNAPSHOT_FORMAT = 1
+
+# A snapshot is a one-line JSON header ({"format", "integrity"}) followed by the JSON body;
+# the integrity hash covers the body bytes, so loading verifies it without re-serializing.
+
+
+def compile_snapshot(
+    config_path: str | None = None,
+    environment: str | None = None,
+    preset: str | None = None,
+    snapshot_dir: str = ".",
+) -> dict:
+    """Build a snapshot document: the merged, validated config plus what it was built from.
+
+    Regex patterns are checked here: invalid PII patterns are rejected, and red-team patterns
+    that fail to compile (which the policy would skip at run time) are dropped and listed under
+    ``dropped_patterns``. Config file paths are stored relative to ``snapshot_dir``.
+    """
+    chosen_preset, chosen_path, chosen_environment = resolve_config_sources(config_path, environment, preset)
+    config = copy.deepcopy(load_config(chosen_path, environment=chosen_environment, preset=chosen_preset))
+    dropped = _preprocess_patterns(config)
+
+    sources = [{"kind": "default", "name": "default_policies.json", "sha256": _sha256(_default_bytes())}]
+    if chosen_preset:
+        sources.append({"kind": "preset", "name": chosen_preset.strip(), "sha256": _sha256(_preset_bytes(chosen_preset))})
+    if chosen_path:
+        with open(chosen_path, "rb") as handle:
+            digest = _sha256(handle.read())
+        relative = os.path.relpath(os.path.abspath(chosen_path), os.path.abspath(snapshot_dir))
+        sources.append({"kind": "config", "path": relative.replace(os.sep, "/"), "sha256": digest})
+
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "engine_version": engine_version(),
+        "engine": engine_fingerprint(),
+        "environment": chosen_environment,
+        "sources": sources,
+        "dropped_patterns": dropped,
+        "config": config,
+    }
+
+
+def write_snapshot(
+    path: str,
+    config_path: str | None = None,
+    environment: str | None = None,
+    preset: str | None = None,
+) -> dict:
+    snapshot = compile_snapshot(
+        config_path,
+        environment=environment,
+        preset=preset,
+        snapshot_dir=os.path.dirname(os.path.abspath(path)),
+    )
+    body = json.dumps(snapshot, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    snapshot["integrity"] = _sha256(body)
+    header = json.dumps({"format": SNAPSHOT_FORMAT, "integrity": snapshot["integrity"]}).encode("utf-8")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".bpc")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(header + b"\n" + body)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return snapshot
+
+
+def load_snapshot(path: str) -> dict:
+    """Return the frozen config stored in a snapshot, without re-running validation.
+
+    Raises ConfigValidationError if the file is corrupt or was edited, if it was compiled by a
+    different engine version or build, or if any default, preset or config source has changed since.
+    """
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+    except OSError as exc:
+        raise ConfigValidationError(f"Cannot read compiled config '{path}': {exc}") from exc
+    header_raw, _newline, body = raw.partition(b"\n")
+    try:
+        header = json.loads(header_raw)
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+        raise ConfigValidationError(f"'{path}' is not a compiled config (format {SNAPSHOT_FORMAT}).")
+    if header.get("integrity") != _sha256(body):
+        raise ConfigValidationError(f"Compiled config '{path}' failed its integrity check; recompile it.")
+    snapshot = json.loads(body)
+    if snapshot.get("engine_version") != engine_version():
+        raise ConfigValidationError(
+            f"Compiled config '{path}' was built by engine {snapshot.get('engine_version')}, "
+            f"but this is {engine_version()}; recompile it."
+        )
+    if snapshot.get("engine") != engine_fingerprint():
+        raise ConfigValidationError(
+            f"Compiled config '{path}' was built by a different build of engine {engine_version()}; recompile it."
+        )
+
+    snapshot_dir = os.path.dirname(os.path.abspath(path))
+    for source in snapshot.get("sources", []):
+        if _current_digest(source, snapshot_dir) != source.get("sha256"):
+            label = source.get("path") or source.get("name")
+            raise ConfigValidationError(
+                f"Compiled config '{path}' is stale: {source.get('kind')} source '{label}' changed; recompile it."
+            )
+
+    record_config_load()
+    return _freeze(snapshot["config"])
+
+
+def _preprocess_patterns(config: dict) -> list[str]:
+    pii = config.get("pii_policy", {})
+    for group in ("patterns", "allowlist"):
+        items = pii.get(group)
+        entries = items.items() if isinstance(items, dict) else enumerate(items if isinstance(items, list) else [])
+        for label, pattern in entries:
+            if isinstance(pattern, dict):
+                continue  # a built-in detector, checked by load_config()
+            try:
+                re.compile(pattern)
+            except (re.error, TypeError) as exc:
+                raise ConfigValidationError(f"Config key 'pii_policy.{group}.{label}' is not a valid regex: {exc}") from exc
+
+    dropped = []
+    categories = config.get("red_team_policy", {}).get("categories", {})
+    for name, entry in categories.items():
+        patterns = entry.get("patterns", []) if isinstance(entry, dict) else entry
+        valid = []
+        for pattern in patterns:
+            try:
+                re.compile(pattern, re.IGNORECASE)
+                valid.append(pattern)
+            except re.error:
+                dropped.append(f"red_team_policy.categories.{name}: {pattern}")
+        if isinstance(entry, dict):
+            if "patterns" in entry:
+                entry["patterns"] = valid
+        else:
+            categories[name] = valid
+    return dropped
+
+
+def _current_digest(source: dict, snapshot_dir: str) -> str | None:
+    try:
+        kind = source.get("kind")
+        if kind == "default":
+            return _sha256(_default_bytes())
+        if kind == "preset":
+            return _sha256(_preset_bytes(source["name"]))
+        if kind == "config":
+            with open(os.path.join(snapshot_dir, source["path"]), "rb") as handle:
+                return _sha256(handle.read())
+    except (OSError, KeyError, TypeError, ConfigValidationError):
+        return None
+    return None
+
+
+def _default_bytes() -> bytes:
+    return _package_files("breakpoint.config").joinpath("default_policies.json").read_bytes()
+
+
+def _preset_bytes(name: str) -> bytes:
+    resource = _package_files("breakpoint.config.presets").joinpath(f"{name.strip()}.json")
+    if not resource.is_file():
+        raise ConfigValidationError(f"Unknown preset '{name}'.")
+    return resource.read_bytes()
+
+
+@lru_cache(maxsize=None)
+def _package_files(package: str):
+    return resources.files(package)
+
+
+def _sha256(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
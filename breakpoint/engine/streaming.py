@@ -0,0 +1,123 @@
+import warnings
+
+from breakpoint.engine.aggregator import aggregate_policy_results
+from breakpoint.engine.evaluator import Evaluator
+from breakpoint.engine.policies.budget import BudgetedPolicy
+from breakpoint.models.decision import Decision
+
+_DEFAULT_OVERLAP = 256
+
+
+class StreamGuard:
+    """Scans a streamed candidate output chunk by chunk and reports BLOCK as soon as PII or a
+    red-team pattern appears.
+
+    Each ``feed()`` rescans only the new chunk plus an ``overlap`` window of preceding text, so
+    matches that straddle a chunk boundary are still caught. A match is only trusted once at
+    least one character follows it, since more text could still extend or cancel it. Matches
+    longer than the overlap window are not guaranteed to be seen early. A match found again from
+    the same start with a longer span (an optional tail that arrived in the next chunk) counts
+    once. ``finalize()`` always runs the full evaluation on the complete output and returns
+    exactly what ``Evaluator.evaluate()`` would.
+    """
+
+    def __init__(
+        self,
+        evaluator: Evaluator,
+        baseline: dict,
+        candidate: dict | None = None,
+        metadata: dict | None = None,
+        overlap: int = _DEFAULT_OVERLAP,
+    ) -> None:
+        if not isinstance(overlap, int) or overlap < 1:
+            raise ValueError("overlap must be a positive integer.")
+        self._evaluator = evaluator
+        self._baseline = baseline
+        self._candidate = dict(candidate or {})
+        self._metadata = metadata or {}
+        self._overlap = overlap
+        # Fail now rather than on the first match if waivers need an evaluation time.
+        evaluator._evaluation_time(self._metadata)
+
+        self._policies = evaluator._incremental_policies()
+        budgeted = [policy.name for policy in evaluator._policies if isinstance(policy.run, BudgetedPolicy)]
+        if budgeted:
+            warnings.warn(
+                f"StreamGuard cannot scan {', '.join(budgeted)} chunk by chunk because regex_budget is set; "
+                "those policies only block at finalize().",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        # Per policy, the end of the longest match seen for each (label, absolute start).
+        self._findings: list[dict[tuple[str, int], int]] = [{} for _ in self._policies]
+        self._chunks: list[str] = []
+        self._length = 0
+        self._tail = ""
+        self._decision = self._partial_decision()
+        self._finalized = False
+
+    @property
+    def blocked(self) -> bool:
+        return self._decision.status == "BLOCK"
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> Decision:
+        """Add a chunk and return the provisional decision for the text seen so far."""
+        if self._finalized:
+            raise RuntimeError("StreamGuard has already been finalized.")
+        if not isinstance(chunk, str):
+            raise TypeError("chunk must be a string.")
+
+        self._chunks.append(chunk)
+        window_offset = self._length - len(self._tail)
+        window = self._tail + chunk
+        self._length += len(chunk)
+        # Keep one extra character so word-boundary checks at the window start see real context.
+        self._tail = window[-(self._overlap + 1) :]
+
+        if self.blocked:
+            return self._decision
+
+        scan_from = 1 if window_offset > 0 else 0
+        found_new = False
+        for findings, policy in zip(self._findings, self._policies):
+            for label, start, end in policy.iter_findings(window, scan_from):
+                if end >= len(window):
+                    continue
+                key = (label, window_offset + start)
+                if key not in findings:
+                    found_new = True
+                findings[key] = max(findings.get(key, 0), window_offset + end)
+        if found_new:
+            self._decision = self._partial_decision()
+        return self._decision
+
+    def finalize(self, candidate: dict | None = None) -> Decision:
+        """Run the full evaluation on the complete output.
+
+        ``candidate`` may carry fields only known once the stream ends (tokens, latency, cost).
+        """
+        self._finalized = True
+        record = {**self._candidate, **(candidate or {}), "output": self.text}
+        return self._evaluator.evaluate(baseline=self._baseline, candidate=record, metadata=self._metadata)
+
+    def _partial_decision(self) -> Decision:
+        results = []
+        for findings, policy in zip(self._findings, self._policies):
+            counts: dict[str, int] = {}
+            for label, _start in findings:
+                counts[label] = counts.get(label, 0) + 1
+            results.append(policy.result_from_counts(counts))
+        results, _applied = self._evaluator._apply_overrides(results, self._metadata)
+        aggregated = aggregate_policy_results(results, strict=self._evaluator.strict)
+        return Decision(
+            status=aggregated.status,
+            reasons=aggregated.reasons,
+            reason_codes=aggregated.reason_codes,
+            metrics=aggregated.metrics,
+            metadata={"mode": self._evaluator.mode, "partial": True, "chars_seen": self._length},
+            details=aggregated.details,
+        )
@@ -0,0 +1,185 @@
+import threading
+import weakref
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import accumulate
+
+# Upper bounds (ms) of the per-policy latency histogram buckets; a final +Inf bucket follows.
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 1000.0)
+
+_CACHE_NAMES = ("config", "memo", "policy_cache")
+
+# Per-policy shard entries are flat lists: one count per bucket, total seconds, then statuses.
+_TOTAL_SLOT = len(LATENCY_BUCKETS_MS) + 1
+_STATUS_SLOTS = {"ALLOW": _TOTAL_SLOT + 1, "WARN": _TOTAL_SLOT + 2, "BLOCK": _TOTAL_SLOT + 3}
+
+# Each thread increments its own shard without locking; the lock only guards the shard list,
+# which changes when a thread registers a shard (dead threads' shards are folded into _retired
+# then and in stats()) and on reset_stats(). A reset bumps _generation instead of clearing live
+# shards under their writers, and each thread starts a fresh shard on its next event.
+_local = threading.local()
+_shards: list[tuple[weakref.ref, dict]] = []
+_retired: dict = {}
+_shards_lock = threading.Lock()
+_generation = 0
+
+
+@dataclass(frozen=True)
+class EngineStats:
+    decisions: int
+    by_status: dict[str, int]
+    by_reason_code: dict[str, int]
+    policies: dict[str, dict]
+    caches: dict[str, dict]
+    config_loads: int
+
+    def to_dict(self) -> dict:
+        return {
+            "decisions": self.decisions,
+            "by_status": self.by_status,
+            "by_reason_code": self.by_reason_code,
+            "policies": self.policies,
+            "caches": self.caches,
+            "config_loads": self.config_loads,
+        }
+
+
+def stats() -> EngineStats:
+    """Process-wide counters since start (or ``reset_stats()``), merged across threads.
+
+    Process-pool workers keep their own counters, which are not reflected here.
+    """
+    totals = _merged_counters()
+
+    by_status: dict[str, int] = {}
+    by_reason_code: dict[str, int] = {}
+    policies: dict[str, dict] = {}
+    caches = {name: {"hits": 0, "misses": 0} for name in _CACHE_NAMES}
+    labels = [f"le_{bound:g}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+    for key, value in totals.items():
+        if isinstance(key, str):
+            runs = sum(value[:_TOTAL_SLOT])
+            total_ms = value[_TOTAL_SLOT] * 1000
+            policies[key] = {
+                "count": runs,
+                "total_ms": round(total_ms, 4),
+                "mean_ms": round(total_ms / runs, 4) if runs else 0.0,
+                # Cumulative, Prometheus-style: le_X counts runs that took at most X ms.
+                "buckets": dict(zip(labels, accumulate(value[:_TOTAL_SLOT]))),
+                "by_status": {status: value[slot] for status, slot in _STATUS_SLOTS.items() if value[slot]},
+            }
+        elif key[0] == "status":
+            by_status[key[1]] = value
+        elif key[0] == "reason_code":
+            by_reason_code[key[1]] = value
+        elif key[0] == "cache":
+            caches[key[1]][key[2]] = value
+    for key, value in totals.items():
+        if isinstance(key, tuple) and key[0] == "policy_status" and key[1] in policies:
+            policies[key[1]]["by_status"][key[2]] = value
+    for entry in caches.values():
+        lookups = entry["hits"] + entry["misses"]
+        entry["hit_rate"] = round(entry["hits"] / lookups, 4) if lookups else 0.0
+
+    return EngineStats(
+        decisions=sum(by_status.values()),
+        by_status=dict(sorted(by_status.items())),
+        by_reason_code=dict(sorted(by_reason_code.items())),
+        policies=dict(sorted(policies.items())),
+        caches=caches,
+        config_loads=totals.get(("config_loads",), 0),
+    )
+
+
+def reset_stats() -> None:
+    """Zero every counter. An event recorded by another thread while this runs may be dropped."""
+    global _generation
+    with _shards_lock:
+        _generation += 1
+        _shards.clear()
+        _retired.clear()
+
+
+def record_policy(name: str, status: str, elapsed: float) -> None:
+    # Called for every policy run, so it avoids building keys: policy entries are keyed by
+    # the bare policy name (all other shard keys are tuples).
+    shard = _shard()
+    entry = shard.get(name)
+    if entry is None:
+        entry = shard[name] = [0] * _TOTAL_SLOT + [0.0] + [0] * len(_STATUS_SLOTS)
+    entry[bisect_left(LATENCY_BUCKETS_MS, elapsed * 1000)] += 1
+    entry[_TOTAL_SLOT] += elapsed
+    slot = _STATUS_SLOTS.get(status)
+    if slot is not None:
+        entry[slot] += 1
+    else:
+        key = ("policy_status", name, status)
+        shard[key] = shard.get(key, 0) + 1
+
+
+def record_decision(status: str, reason_codes: list[str]) -> None:
+    shard = _shard()
+    key = ("status", status)
+    shard[key] = shard.get(key, 0) + 1
+    for code in reason_codes:
+        key = ("reason_code", code)
+        shard[key] = shard.get(key, 0) + 1
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    shard = _shard()
+    key = ("cache", cache, "hits" if hit else "misses")
+    shard[key] = shard.get(key, 0) + 1
+
+
+def record_config_load() -> None:
+    shard = _shard()
+    shard[("config_loads",)] = shard.get(("config_loads",), 0) + 1
+
+
+def _shard() -> dict:
+    try:
+        if _local.generation == _generation:
+            return _local.shard
+    except AttributeError:
+        pass
+    shard: dict = {}
+    with _shards_lock:
+        # New threads are where shards come from, so this keeps the list at the live threads
+        # even when nobody calls stats() (a server starting a thread per request).
+        _retire_dead_shards()
+        _shards.append((weakref.ref(threading.current_thread()), shard))
+        _local.shard, _local.generation = shard, _generation
+    return shard
+
+
+def _retire_dead_shards() -> None:
+    # Dead threads never write again, so their counts move into _retired. Caller holds the lock.
+    live = []
+    for thread_ref, shard in _shards:
+        thread = thread_ref()
+        if thread is None or not thread.is_alive():
+            _add_into(_retired, shard)
+        else:
+            live.append((thread_ref, shard))
+    _shards[:] = live
+
+
+def _merged_counters() -> dict:
+    totals: dict = {}
+    with _shards_lock:
+        _retire_dead_shards()
+        _add_into(totals, _retired)
+        for _thread_ref, shard in _shards:
+            # dict.copy() is atomic under the GIL, so a concurrent increment is either in or out.
+            _add_into(totals, shard.copy())
+    return totals
+
+
+def _add_into(target: dict, source: dict) -> None:
+    for key, value in source.items():
+        if isinstance(value, list):
+            current = target.get(key)
+            target[key] = list(value) if current is None else [a + b for a, b in zip(current, value)]
+        else:
+            target[key] = target.get(key, 0) + value
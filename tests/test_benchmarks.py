@@ -0,0 +1,182 @@
+import json
+import subprocess
+import sys
+
+from breakpoint import evaluate
+from breakpoint.benchmarks import (
+    build_suite,
+    compare_results,
+    median_interval,
+    nested_json_pair,
+    run_suite,
+    scaling_curves,
+    synthetic_pair,
+)
+
+
+def test_synthetic_pair_is_seeded_and_sized():
+    first = synthetic_pair(7, 2_000, pii_density=0.05)
+    assert first == synthetic_pair(7, 2_000, pii_density=0.05)
+    assert first != synthetic_pair(8, 2_000, pii_density=0.05)
+    baseline, candidate = first
+    assert len(baseline["output"]) == 2_000
+    assert abs(len(candidate["output"]) - 2_000) < 400
+
+
+def test_synthetic_pii_is_detected_and_clean_text_is_not():
+    _baseline, candidate = synthetic_pair(1, 5_000, pii_density=0.05)
+    decision = evaluate(baseline={"output": "x"}, candidate=candidate)
+    assert "PII_CREDIT_CARD_BLOCK" in decision.reason_codes
+    assert "PII_EMAIL_BLOCK" in decision.reason_codes
+
+    baseline, candidate = synthetic_pair(1, 5_000)
+    decision = evaluate(baseline=baseline, candidate=candidate, mode="full")
+    assert not any(code.startswith(("PII_", "RED_TEAM_")) for code in decision.reason_codes)
+
+
+def test_nested_json_pair_changes_innermost_leaf_type():
+    baseline, candidate = nested_json_pair(0, 6)
+    decision = evaluate(baseline=baseline, candidate=candidate, mode="full")
+    assert "OUTPUT_CONTRACT_TYPE_MISMATCH_WARN" in decision.reason_codes
+
+
+def test_suite_covers_every_builtin_policy_and_runs():
+    benchmarks = build_suite(sizes=(100, 1_000), json_depths=(2, 4), red_team_pattern_counts=(3, 30))
+    families = {benchmark.family for benchmark in benchmarks}
+    assert {
+        "policy.cost",
+        "policy.latency",
+        "policy.pii",
+        "policy.output_contract",
+        "policy.drift",
+        "policy.red_team",
+        "pii.density",
+        "output_contract.depth",
+        "red_team.patterns",
+        "red_team.keywords",
+        "evaluate.lite",
+        "evaluate.full",
+        "evaluate.lite.one_shot",
+        "evaluate.full.one_shot",
+    } == families
+
+    selected = [benchmark for benchmark in benchmarks if benchmark.family == "policy.drift"]
+    document = run_suite(selected, repeat=2, min_sample_seconds=0.0001)
+    assert [result["name"] for result in document["benchmarks"]] == [
+        "policy.drift[size_bytes=100]",
+        "policy.drift[size_bytes=1000]",
+    ]
+    assert all(len(result["samples_ms"]) == 2 for result in document["benchmarks"])
+    assert document["scaling"][0]["series"] == "policy.drift"
+    json.dumps(document)
+
+
+def test_scaling_curves_flag_quadratic_series():
+    def result(series: str, size: int, median_ms: float) -> dict:
+        return {"series": series, "family": series, "scale": "size_bytes", "params": {"size_bytes": size}, "median_ms": median_ms}
+
+    results = [result("linear", size, size / 1000) for size in (100, 1_000, 10_000, 100_000)]
+    results += [result("quadratic", size, (size / 1000) ** 2) for size in (100, 1_000, 10_000, 100_000)]
+    curves = {curve["series"]: curve for curve in scaling_curves(results)}
+    assert curves["linear"]["verdict"] == "linear"
+    assert curves["linear"]["slope"] == 1.0
+    assert curves["quadratic"]["verdict"] == "superlinear"
+    assert curves["quadratic"]["slope"] == 2.0
+
+
+def test_cli_bench_writes_results(tmp_path):
+    out_path = tmp_path / "bench.json"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "breakpoint.cli.main",
+            "bench",
+            "--filter",
+            "policy.pii",
+            "--max-size",
+            "1000",
+            "--repeat",
+            "2",
+            "--out",
+            str(out_path),
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "policy.pii[size_bytes=1000]" in result.stdout
+    assert "Scaling" in result.stdout
+    document = json.loads(out_path.read_text(encoding="utf-8"))
+    assert document["format"] == 1
+    assert [item["name"] for item in document["benchmarks"]] == ["policy.pii[size_bytes=100]", "policy.pii[size_bytes=1000]"]
+
+
+def _bench_document(samples_by_name: dict[str, list[float]]) -> dict:
+    return {
+        "format": 1,
+        "benchmarks": [{"name": name, "samples_ms": samples} for name, samples in samples_by_name.items()],
+    }
+
+
+def test_median_interval_uses_order_statistics():
+    samples = [float(value) for value in range(1, 11)]
+    assert median_interval(samples, 0.95) == (2.0, 9.0)
+    assert median_interval([3.0, 1.0, 2.0], 0.95) == (1.0, 3.0)
+
+
+def test_compare_results_gates_regressions_with_latency_thresholds():
+    baseline = _bench_document({"fast": [1.0, 1.01, 0.99, 1.0, 1.02], "steady": [2.0, 2.01, 1.99, 2.0, 2.02]})
+    candidate = _bench_document({"fast": [2.0, 2.01, 1.99, 2.0, 2.02], "steady": [2.1, 2.11, 2.09, 2.1, 2.12]})
+    thresholds = {"warn_increase_pct": 25, "block_increase_pct": 60}
+
+    decision = compare_results(baseline, candidate, thresholds)
+    assert decision.status == "BLOCK"
+    assert decision.reason_codes == ["LATENCY_INCREASE_BLOCK"]
+    assert decision.reasons[0].startswith("fast: Latency increased by 100.0%")
+    assert decision.details["steady"]["status"] == "ALLOW"
+    assert decision.metrics["benchmarks_compared"] == 2
+    assert decision.metrics["benchmarks_flagged"] == 1
+    assert decision.metadata["thresholds"]["min_baseline_latency_ms"] == 0
+
+
+def test_compare_results_treats_overlapping_intervals_as_noise():
+    baseline = _bench_document({"noisy": [1.0, 1.0, 1.0, 1.0, 3.0]})
+    candidate = _bench_document({"noisy": [1.5, 1.5, 1.5, 1.5, 1.5]})
+    decision = compare_results(baseline, candidate, {"warn_increase_pct": 25, "block_increase_pct": 60})
+    assert decision.status == "ALLOW"
+    assert decision.details["noisy"]["within_noise"] is True
+
+
+def test_compare_results_warns_on_missing_benchmarks():
+    decision = compare_results(_bench_document({"a": [1.0]}), _bench_document({"b": [1.0]}), {})
+    assert decision.status == "WARN"
+    assert decision.reason_codes == ["LATENCY_WARN_MISSING_DATA", "LATENCY_WARN_MISSING_DATA"]
+
+
+def test_cli_bench_compare_exit_codes(tmp_path):
+    baseline_path = tmp_path / "main.json"
+    candidate_path = tmp_path / "pr.json"
+    baseline_path.write_text(json.dumps(_bench_document({"case": [1.0, 1.0, 1.01, 0.99, 1.0]})), encoding="utf-8")
+    candidate_path.write_text(json.dumps(_bench_document({"case": [1.4, 1.4, 1.41, 1.39, 1.4]})), encoding="utf-8")
+    base_command = [sys.executable, "-m", "breakpoint.cli.main", "bench", "compare", str(baseline_path), str(candidate_path)]
+
+    result = subprocess.run([*base_command, "--exit-codes"], check=False, capture_output=True, text=True)
+    assert result.returncode == 1
+    assert "Benchmark comparison:" in result.stdout
+    assert "+40.0%" in result.stdout
+
+    result = subprocess.run(
+        [*base_command, "--json", "--block-increase-pct", "30", "--fail-on", "block"],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    payload = json.loads(result.stdout)
+    assert result.returncode == 2
+    assert payload["status"] == "BLOCK"
+    assert payload["details"]["case"]["baseline_median_ms"] == 1.0
+
+    invalid = subprocess.run([*base_command[:-1], str(tmp_path / "missing.json")], check=False, capture_output=True, text=True)
+    assert invalid.returncode == 1
@@ -816,3 +816,157 @@ def test_cli_config_print_with_env_applies_overrides(tmp_path):
     payload = json.loads(result.stdout)
     assert payload["cost_policy"]["warn_increase_pct"] == 5
     assert "environments" not in payload
+
+
+def test_cli_evaluate_pairs_streams_ndjson(tmp_path):
+    pairs_path = tmp_path / "cases.jsonl"
+    lines = [
+        json.dumps({"id": "allow", "baseline": {"output": "hello", "cost_usd": 1.0}, "candidate": {"output": "hello", "cost_usd": 1.0}}),
+        "",
+        json.dumps({"id": "warn", "baseline": {"output": "hello", "cost_usd": 1.0}, "candidate": {"output": "hello", "cost_usd": 1.25}}),
+        "not json",
+        json.dumps({"baseline": {"output": "hello"}, "candidate": {"output": "mail hi@example.com", "cost_usd": 1.0}}),
+    ]
+    pairs_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = _run_evaluate_text("--pairs", str(pairs_path))
+
+    assert result.returncode == 1
+    payloads = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [p["case_id"] for p in payloads] == ["allow", "warn", 4, 5]
+    assert [p["status"] for p in payloads] == ["ALLOW", "WARN", "BLOCK", "BLOCK"]
+    assert payloads[2]["reason_codes"] == ["INPUT_VALIDATION_ERROR"]
+    assert "PII_EMAIL_BLOCK" in payloads[3]["reason_codes"]
+
+
+def test_cli_evaluate_pairs_exit_code_follows_fail_on(tmp_path):
+    pairs_path = tmp_path / "cases.jsonl"
+    pairs_path.write_text(
+        json.dumps({"id": 1, "baseline": {"output": "hello", "cost_usd": 1.0}, "candidate": {"output": "hello", "cost_usd": 1.25}})
+        + "\n",
+        encoding="utf-8",
+    )
+
+    assert _run_evaluate_text("--pairs", str(pairs_path), "--fail-on", "warn").returncode == 1
+    assert _run_evaluate_text("--pairs", str(pairs_path), "--fail-on", "block").returncode == 0
+
+
+def test_cli_evaluate_pairs_rejects_positional_paths(tmp_path):
+    pairs_path = tmp_path / "cases.jsonl"
+    pairs_path.write_text("", encoding="utf-8")
+
+    result = _run_evaluate_text(str(pairs_path), "--pairs", str(pairs_path))
+
+    assert result.returncode == 1
+    assert json.loads(result.stdout)["reason_codes"] == ["INPUT_VALIDATION_ERROR"]
+
+
+def test_cli_evaluate_fail_fast_reports_skipped_policies(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    baseline_path.write_text(json.dumps({"output": "hello", "cost_usd": 1.0}), encoding="utf-8")
+    candidate_path.write_text(json.dumps({"output": "hello", "cost_usd": 5.0}), encoding="utf-8")
+
+    result = _run_evaluate_text(str(baseline_path), str(candidate_path), "--fail-fast", "--json")
+    payload = json.loads(result.stdout)
+    assert payload["status"] == "BLOCK"
+    assert payload["metadata"]["fail_fast"] is True
+    assert payload["metadata"]["skipped_policies"] == ["pii", "drift"]
+
+    text = _run_evaluate_text(str(baseline_path), str(candidate_path), "--fail-fast", "--verbose")
+    assert "Skipped (fail-fast)" in text.stdout
+
+
+def test_cli_evaluate_cache_dir_reuses_decisions(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    cache_dir = tmp_path / "cache"
+    baseline_path.write_text(json.dumps({"output": "hello", "cost_usd": 1.0}), encoding="utf-8")
+    candidate_path.write_text(json.dumps({"output": "hello", "cost_usd": 1.25}), encoding="utf-8")
+
+    first = _run_evaluate_text(str(baseline_path), str(candidate_path), "--json", "--cache-dir", str(cache_dir))
+    second = _run_evaluate_text(str(baseline_path), str(candidate_path), "--json", "--cache-dir", str(cache_dir))
+    uncached = _run_evaluate_text(str(baseline_path), str(candidate_path), "--json")
+    assert first.stdout == second.stdout == uncached.stdout
+    assert len(list(cache_dir.glob("*/*.json"))) == 1
+
+
+def test_cli_evaluate_timings(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    baseline_path.write_text(json.dumps({"output": "hello", "cost_usd": 1.0}), encoding="utf-8")
+    candidate_path.write_text(json.dumps({"output": "hello there", "cost_usd": 1.0}), encoding="utf-8")
+
+    result = _run_evaluate_text(str(baseline_path), str(candidate_path), "--json", "--timings")
+    timings = json.loads(result.stdout)["metadata"]["timings"]
+    assert list(timings["policies"]) == ["cost", "pii", "drift"]
+    assert timings["policies"]["drift"]["input_chars"] == len("hello") + len("hello there")
+
+    text = _run_evaluate_text(str(baseline_path), str(candidate_path), "--timings")
+    assert "Timings (ms):" in text.stdout
+
+
+def test_cli_profile_reports_hot_functions_and_policy_memory(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    pstats_path = tmp_path / "run.pstats"
+    collapsed_path = tmp_path / "run.folded"
+    baseline_path.write_text(json.dumps({"output": "hello world", "cost_usd": 1.0}), encoding="utf-8")
+    candidate_path.write_text(json.dumps({"output": "hello there world", "cost_usd": 1.0}), encoding="utf-8")
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "breakpoint.cli.main",
+            "profile",
+            "--top",
+            "5",
+            "--pstats",
+            str(pstats_path),
+            "--collapsed",
+            str(collapsed_path),
+            "--repeat",
+            "3",
+            "evaluate",
+            str(baseline_path),
+            str(candidate_path),
+            "--mode",
+            "full",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "Hottest functions (by tottime):" in result.stdout
+    assert "Peak memory per policy" in result.stdout
+    assert "red_team:" in result.stdout and "(3 runs)" in result.stdout
+    assert "Top allocation sites" in result.stdout
+    assert "Final decision" not in result.stdout
+    assert pstats_path.stat().st_size > 0
+    assert collapsed_path.exists()
+
+
+def test_cli_profile_json_and_requires_evaluate(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    baseline_path.write_text(json.dumps({"output": "hello", "cost_usd": 1.0}), encoding="utf-8")
+    candidate_path.write_text(json.dumps({"output": "hello", "cost_usd": 5.0}), encoding="utf-8")
+
+    base_command = [sys.executable, "-m", "breakpoint.cli.main", "profile"]
+    result = subprocess.run(
+        [*base_command, "--json", "--no-memory", "evaluate", str(baseline_path), str(candidate_path), "--exit-codes"],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    payload = json.loads(result.stdout)
+    assert result.returncode == payload["evaluate_exit_code"] == 2
+    assert payload["hottest"]
+    assert payload["policy_calls"] == {"cost": 1, "drift": 1, "pii": 1}
+    assert payload["policy_peak_kib"] == {}
+
+    missing = subprocess.run([*base_command, "config", "print"], check=False, capture_output=True, text=True)
+    assert missing.returncode == 1
+    assert "evaluate" in missing.stderr
@@ -0,0 +1,83 @@
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from breakpoint import Evaluator
+from breakpoint.engine import FrozenDict, FrozenList, invalidate_config_cache, load_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    invalidate_config_cache()
+    yield
+    invalidate_config_cache()
+
+
+def _write_config(path, warn_pct: int) -> None:
+    path.write_text(json.dumps({"cost_policy": {"warn_increase_pct": warn_pct, "block_increase_pct": 90}}), encoding="utf-8")
+
+
+def test_load_config_is_memoized_and_read_only(tmp_path):
+    config_path = tmp_path / "policy.json"
+    _write_config(config_path, 10)
+
+    first = load_config(str(config_path))
+    assert load_config(str(config_path)) is first
+    assert isinstance(first, FrozenDict) and isinstance(first, dict)
+    assert isinstance(first["red_team_policy"]["categories"]["injection"], FrozenList)
+    with pytest.raises(TypeError):
+        first["cost_policy"]["warn_increase_pct"] = 50
+    with pytest.raises(TypeError):
+        first["red_team_policy"]["categories"]["injection"].append("x")
+    json.dumps(first)
+
+
+def test_load_config_reloads_when_file_changes(tmp_path):
+    config_path = tmp_path / "policy.json"
+    _write_config(config_path, 10)
+    first = load_config(str(config_path))
+
+    _write_config(config_path, 200)
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    with pytest.raises(Exception, match="block_increase_pct"):
+        load_config(str(config_path))
+
+    _write_config(config_path, 20)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+    second = load_config(str(config_path))
+    assert second is not first
+    assert second["cost_policy"]["warn_increase_pct"] == 20
+
+
+def test_load_config_key_includes_environment_variables(monkeypatch):
+    default = load_config()
+    monkeypatch.setenv("BREAKPOINT_PRESET", "chatbot")
+    assert load_config() is not default
+    monkeypatch.delenv("BREAKPOINT_PRESET")
+    assert load_config() is default
+
+
+def test_invalidate_config_cache_forces_reparse():
+    first = load_config()
+    invalidate_config_cache()
+    assert load_config() is not first
+    assert load_config() == first
+
+
+def test_frozen_config_copies_and_pickles():
+    config = load_config()
+    mutable = copy.deepcopy(config)
+    assert type(mutable) is dict
+    assert type(mutable["red_team_policy"]["categories"]["injection"]) is list
+    mutable["cost_policy"]["warn_increase_pct"] = 1
+    assert config["cost_policy"]["warn_increase_pct"] != 1
+
+    restored = pickle.loads(pickle.dumps(config))
+    assert isinstance(restored, FrozenDict) and restored == config
+
+    evaluator = pickle.loads(pickle.dumps(Evaluator(mode="full")))
+    assert evaluator.evaluate("hello", "hello").status in {"ALLOW", "WARN"}
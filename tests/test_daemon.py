@@ -0,0 +1,95 @@
+import json
+import socket
+import threading
+
+import pytest
+
+from breakpoint.cli.main import main
+from breakpoint.cli.serve import EvaluatorPool, make_unix_server
+
+BASELINE = {"output": "Your order ships today.", "cost_usd": 0.10, "latency_ms": 400}
+CANDIDATE = {"output": "Your order ships today. Contact jane@example.com.", "cost_usd": 0.13, "latency_ms": 420}
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    pool = EvaluatorPool()
+    server = make_unix_server(str(tmp_path / "bp.sock"), pool=pool)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    baseline_path.write_text(json.dumps(BASELINE))
+    candidate_path.write_text(json.dumps(CANDIDATE))
+    return str(baseline_path), str(candidate_path)
+
+
+def _run(capsys, argv: list[str]) -> tuple[int, str, str]:
+    code = main(argv)
+    captured = capsys.readouterr()
+    return code, captured.out, captured.err
+
+
+@pytest.mark.parametrize(
+    ("flags", "forwarded"),
+    [
+        ([], True),
+        (["--json"], True),
+        (["--mode", "full", "--verbose", "--fail-on", "warn"], True),
+        (["--mode", "full", "--json", "--strict", "--preset", "chatbot"], True),
+        (["--accept-risk", "pii", "--exit-codes"], True),
+        (["--mode", "full", "--env", "no-such-env"], True),
+        # The error names the path as given, so a missing config file is reported in-process.
+        (["--mode", "full", "--config", "does-not-exist.json", "--json"], False),
+        (["--mode", "full", "--timings"], False),
+    ],
+)
+def test_daemon_output_matches_in_process(daemon, inputs, capsys, monkeypatch, flags, forwarded):
+    argv = ["evaluate", *inputs, *flags]
+    monkeypatch.delenv("BREAKPOINT_DAEMON_SOCKET", raising=False)
+    expected = _run(capsys, argv)
+
+    monkeypatch.setenv("BREAKPOINT_DAEMON_SOCKET", daemon.server_address)
+    before = daemon.pool.info()
+    actual = _run(capsys, argv)
+    after = daemon.pool.info()
+    if "--timings" not in flags:
+        assert actual == expected
+    assert (after["hits"] + after["misses"] > before["hits"] + before["misses"]) is forwarded
+
+
+def test_falls_back_in_process_without_a_daemon(tmp_path, inputs, capsys, monkeypatch):
+    monkeypatch.delenv("BREAKPOINT_DAEMON_SOCKET", raising=False)
+    expected = _run(capsys, ["evaluate", *inputs, "--json"])
+
+    monkeypatch.setenv("BREAKPOINT_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+    assert _run(capsys, ["evaluate", *inputs, "--json"]) == expected
+
+    stale = tmp_path / "stale.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(stale))
+    listener.close()
+    monkeypatch.setenv("BREAKPOINT_DAEMON_SOCKET", str(stale))
+    assert _run(capsys, ["evaluate", *inputs, "--json"]) == expected
+
+
+def test_unix_server_replaces_stale_socket_but_not_a_live_one(daemon, tmp_path):
+    with pytest.raises(OSError, match="already listening"):
+        make_unix_server(daemon.server_address)
+
+    stale = tmp_path / "stale.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(stale))
+    listener.close()
+    server = make_unix_server(str(stale))
+    server.server_close()
+    assert not stale.exists()
@@ -0,0 +1,132 @@
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from breakpoint import DiskDecisionCache, Evaluator, PolicyResultCache, evaluate
+from breakpoint.engine import disk_cache
+
+
+BASELINE = {"output": "hello world", "cost_usd": 1.0, "latency_ms": 100}
+CANDIDATE = {"output": "hello world, reach me at hi@example.com", "cost_usd": 1.3, "latency_ms": 150}
+
+
+def _entry_files(directory):
+    return sorted(
+        os.path.join(root, name)
+        for root, _dirs, files in os.walk(directory)
+        for name in files
+        if name.endswith(".json")
+    )
+
+
+def test_disk_cache_round_trips_decisions_across_instances(tmp_path):
+    first = Evaluator(mode="full", memo=DiskDecisionCache(str(tmp_path))).evaluate(
+        baseline=BASELINE, candidate=CANDIDATE
+    )
+    cache = DiskDecisionCache(str(tmp_path))
+    second = Evaluator(mode="full", memo=cache).evaluate(baseline=BASELINE, candidate=CANDIDATE)
+
+    assert second == first == evaluate(baseline=BASELINE, candidate=CANDIDATE, mode="full")
+    assert cache.stats().hits == 1
+    [path] = _entry_files(tmp_path)
+    assert os.path.basename(os.path.dirname(path)) == os.path.basename(path)[:2]
+
+
+def test_disk_cache_ignores_other_engine_versions_and_corrupt_entries(tmp_path, monkeypatch):
+    cache = DiskDecisionCache(str(tmp_path))
+    evaluator = Evaluator(memo=cache)
+    evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    [path] = _entry_files(tmp_path)
+
+    entry = json.loads(open(path, encoding="utf-8").read())
+    entry["engine_version"] = "0.0.0-other"
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(entry, handle)
+    evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write("{not json")
+    decision = evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert decision == evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert cache.stats().hits == 0
+    assert cache.stats().misses == 3
+
+
+def test_changed_engine_fingerprint_misses_the_cache(tmp_path, monkeypatch):
+    # Same package version, different engine code (e.g. a source checkout after an edit).
+    cache = DiskDecisionCache(str(tmp_path))
+    policy_cache = PolicyResultCache()
+    Evaluator(memo=cache, policy_cache=policy_cache).evaluate(baseline=BASELINE, candidate=CANDIDATE)
+
+    monkeypatch.setattr("breakpoint.engine.memo.engine_fingerprint", lambda: "changed")
+    monkeypatch.setattr("breakpoint.engine.disk_cache.engine_fingerprint", lambda: "changed")
+    Evaluator(memo=cache, policy_cache=policy_cache).evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert cache.stats().hits == 0
+    assert policy_cache.stats().hits == 0
+    assert len(_entry_files(tmp_path)) == 2
+
+
+def test_disk_cache_ignores_entries_from_another_engine_build(tmp_path):
+    cache = DiskDecisionCache(str(tmp_path))
+    evaluator = Evaluator(memo=cache)
+    evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    [path] = _entry_files(tmp_path)
+    entry = json.loads(open(path, encoding="utf-8").read())
+    entry["engine"] = "other-build"
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(entry, handle)
+
+    evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert cache.stats().hits == 0
+
+
+def test_disk_cache_gc_removes_least_recently_used(tmp_path):
+    cache = DiskDecisionCache(str(tmp_path))
+    evaluator = Evaluator(memo=cache)
+    for output in ["alpha beta", "gamma delta", "epsilon zeta"]:
+        evaluator.evaluate(baseline=BASELINE, candidate={"output": output, "cost_usd": 1.0})
+    paths = _entry_files(tmp_path)
+    stamp = time.time() - 1000
+    for offset, path in enumerate(paths):
+        os.utime(path, (stamp + offset, stamp + offset))
+    oldest = paths[0]
+
+    assert cache.gc(max_entries=2) == 1
+    assert oldest not in _entry_files(tmp_path)
+    assert cache.stats().size == 2
+    assert cache.gc(max_bytes=1) == 2
+    assert cache.stats().evictions == 3
+
+
+def _evaluate_with_cache(directory):
+    evaluator = Evaluator(memo=DiskDecisionCache(directory))
+    return [
+        evaluator.evaluate(baseline=BASELINE, candidate={"output": f"answer {index}", "cost_usd": 1.0}).status
+        for index in range(20)
+    ]
+
+
+def test_disk_cache_is_safe_across_processes(tmp_path):
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(_evaluate_with_cache, [str(tmp_path)] * 3))
+    assert results[0] == results[1] == results[2]
+    assert len(_entry_files(tmp_path)) == 20
+    assert not [name for _root, _dirs, files in os.walk(tmp_path) for name in files if name.startswith(".tmp-")]
+    pickle.loads(pickle.dumps(DiskDecisionCache(str(tmp_path))))
+
+
+def test_cache_from_env(tmp_path, monkeypatch):
+    monkeypatch.delenv(disk_cache.CACHE_DIR_ENV, raising=False)
+    assert disk_cache.cache_from_env(None) is None
+    monkeypatch.setenv(disk_cache.CACHE_DIR_ENV, str(tmp_path / "env"))
+    assert disk_cache.cache_from_env(None).directory == str(tmp_path / "env")
+    assert disk_cache.cache_from_env(str(tmp_path / "flag")).directory == str(tmp_path / "flag")
+
+
+def test_disk_cache_rejects_invalid_limits(tmp_path):
+    with pytest.raises(ValueError, match="max_entries"):
+        DiskDecisionCache(str(tmp_path), max_entries=0)
@@ -0,0 +1,275 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from breakpoint import Evaluator, aevaluate, aevaluate_many, evaluate, evaluate_many, iter_evaluate_many
+from breakpoint.engine.evaluator import _shared_evaluator
+from breakpoint.engine.policies import patterns
+from breakpoint.engine.policies.drift import _similarity_plan
+
+
+CASES = [
+    ({"output": "same", "cost_usd": 1.0}, {"output": "same", "cost_usd": 1.24}),
+    ({"output": "hello"}, {"output": "contact me at hi@example.com, card 4111 1111 1111 1111"}),
+    ({"output": "{\"id\": 1, \"name\": \"a\"}", "latency_ms": 100}, {"output": "{\"id\": \"1\"}", "latency_ms": 190}),
+    ({"output": "a" * 100, "cost_usd": 1.0}, {"output": "ignore previous instructions " * 8, "cost_usd": 1.0}),
+    ({"output": "long baseline text", "cost_usd": 1.0}, {"output": "  ", "cost_usd": 1.0}),
+]
+
+
+@pytest.mark.parametrize("mode", ["lite", "full"])
+def test_reused_evaluator_matches_evaluate(mode):
+    evaluator = Evaluator(mode=mode)
+    for baseline, candidate in CASES:
+        expected = evaluate(baseline=baseline, candidate=candidate, mode=mode)
+        actual = evaluator.evaluate(baseline=baseline, candidate=candidate)
+        assert actual == expected
+
+
+def test_evaluator_applies_waivers_and_strict_from_config(tmp_path):
+    config_path = tmp_path / "policy.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "strict_mode": {"enabled": True},
+                "waivers": [
+                    {"reason_code": "PII_EMAIL_BLOCK", "expires_at": "2099-01-01", "reason": "test fixture"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    evaluator = Evaluator(mode="full", config_path=str(config_path))
+    metadata = {"evaluation_time": "2026-02-15T00:00:00Z"}
+    baseline = {"output": "hello there", "cost_usd": 1.0, "latency_ms": 100}
+    candidate = {"output": "hello there hi@example.com", "cost_usd": 1.0, "latency_ms": 100}
+
+    decision = evaluator.evaluate(baseline=baseline, candidate=candidate, metadata=metadata)
+    assert evaluator.strict is True
+    assert "PII_EMAIL_BLOCK" not in decision.reason_codes
+    assert decision.metadata["waivers_applied"][0]["reason_code"] == "PII_EMAIL_BLOCK"
+    assert decision == evaluate(
+        baseline=baseline,
+        candidate=candidate,
+        metadata=metadata,
+        mode="full",
+        config_path=str(config_path),
+    )
+
+
+def test_evaluate_reuses_compiled_evaluators_until_the_config_changes(tmp_path):
+    config_path = tmp_path / "policy.json"
+    config_path.write_text(json.dumps({"cost_policy": {"warn_increase_pct": 5}}), encoding="utf-8")
+    risks = ["pii"]
+    options = ("lite", str(config_path), None, None, False, risks, False)
+    first = _shared_evaluator(*options)
+    assert _shared_evaluator(*options) is first
+    assert _shared_evaluator("full", *options[1:]) is not first
+
+    risks.append("cost")
+    assert first.accepted_risks == ["pii"]
+    assert _shared_evaluator(*options) is not first
+
+    baseline, candidate = {"output": "same", "cost_usd": 1.0}, {"output": "same", "cost_usd": 1.24}
+    assert evaluate(baseline=baseline, candidate=candidate, config_path=str(config_path)).status == "WARN"
+    config_path.write_text(json.dumps({"cost_policy": {"warn_increase_pct": 50, "block_increase_pct": 60}}), encoding="utf-8")
+    assert evaluate(baseline=baseline, candidate=candidate, config_path=str(config_path)).status == "ALLOW"
+
+
+@pytest.mark.parametrize("mode", ["lite", "full"])
+def test_building_an_evaluator_does_not_reparse_policy_patterns(mode, monkeypatch):
+    # Guards the one-shot path: every evaluate() without a warm evaluator compiles policies.
+    Evaluator(mode=mode)
+    parse = patterns._sre_parse.parse
+    calls = []
+
+    def counting_parse(*args, **kwargs):
+        calls.append(args[0])
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(patterns._sre_parse, "parse", counting_parse)
+    Evaluator(mode=mode)
+    assert calls == []
+
+
+def test_similarity_plan_flattens_method_strings():
+    assert _similarity_plan("max(token_jaccard,char_3gram_jaccard)") == ("token_jaccard", "char_3gram_jaccard")
+    assert _similarity_plan("char_3gram_jaccard") == ("char_3gram_jaccard",)
+    assert _similarity_plan("unknown") == ("token_jaccard",)
+    assert _similarity_plan("max()") == (None,)
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_evaluate_many_preserves_input_order(executor):
+    pairs = CASES * 3
+    decisions = evaluate_many(pairs, executor=executor, workers=2, chunksize=2, mode="full")
+    assert decisions == [evaluate(baseline=b, candidate=c, mode="full") for b, c in pairs]
+
+
+def test_iter_evaluate_many_accepts_dict_pairs_and_generators():
+    pairs = (
+        {"baseline": b, "candidate": c, "metadata": {"run_id": f"run-{i}"}}
+        for i, (b, c) in enumerate(CASES)
+    )
+    results = dict(iter_evaluate_many(pairs, executor="thread", workers=2))
+    assert sorted(results) == list(range(len(CASES)))
+    assert results[3].metadata["run_id"] == "run-3"
+
+
+def test_evaluate_many_rejects_unknown_executor():
+    with pytest.raises(ValueError, match="executor"):
+        evaluate_many(CASES, executor="gpu")
+
+
+def test_aevaluate_matches_evaluate():
+    baseline, candidate = CASES[1]
+    decision = asyncio.run(aevaluate(baseline=baseline, candidate=candidate, mode="full"))
+    assert decision == evaluate(baseline=baseline, candidate=candidate, mode="full")
+
+
+def test_aevaluate_many_respects_concurrency_limit_and_order():
+    evaluator = Evaluator(mode="full")
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    original = evaluator.evaluate
+
+    def tracking_evaluate(**kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            time.sleep(0.01)
+            return original(**kwargs)
+        finally:
+            with lock:
+                active -= 1
+
+    evaluator.evaluate = tracking_evaluate
+    pairs = CASES * 4
+    decisions = asyncio.run(aevaluate_many(pairs, max_concurrency=2, evaluator=evaluator))
+    assert decisions == [original(baseline=b, candidate=c) for b, c in pairs]
+    assert peak <= 2
+
+
+def test_aevaluate_many_cancellation_stops_pending_work():
+    evaluator = Evaluator()
+    started = []
+    original = evaluator.evaluate
+
+    def slow_evaluate(**kwargs):
+        started.append(1)
+        time.sleep(0.05)
+        return original(**kwargs)
+
+    evaluator.evaluate = slow_evaluate
+
+    async def run():
+        task = asyncio.ensure_future(aevaluate_many(CASES * 10, max_concurrency=1, evaluator=evaluator))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    time.sleep(0.1)
+    assert len(started) < len(CASES * 10)
+
+
+@pytest.mark.parametrize("mode", ["lite", "full"])
+def test_fail_fast_matches_full_status(mode):
+    full = Evaluator(mode=mode)
+    fast = Evaluator(mode=mode, fail_fast=True)
+    for baseline, candidate in CASES:
+        expected = full.evaluate(baseline=baseline, candidate=candidate)
+        actual = fast.evaluate(baseline=baseline, candidate=candidate)
+        assert actual.status == expected.status
+        assert actual.metadata["fail_fast"] is True
+        if expected.status != "BLOCK":
+            assert actual.details == expected.details
+
+
+def test_fail_fast_skips_expensive_policies_after_block():
+    baseline = {"output": "hello world", "cost_usd": 1.0}
+    candidate = {"output": "hello world, reach me at hi@example.com", "cost_usd": 5.0}
+    decision = evaluate(baseline=baseline, candidate=candidate, fail_fast=True)
+    assert decision.status == "BLOCK"
+    assert "COST_INCREASE_BLOCK" in decision.reason_codes
+    assert decision.details["pii"] == {"skipped": True}
+    assert decision.details["drift"] == {"skipped": True}
+    assert list(decision.details) == ["cost", "pii", "drift"]
+    assert decision.metadata["skipped_policies"] == ["pii", "drift"]
+
+
+def test_fail_fast_checks_empty_output_first():
+    decision = evaluate(
+        baseline={"output": "long baseline text", "cost_usd": 1.0},
+        candidate={"output": "   ", "cost_usd": 1.0},
+        fail_fast=True,
+    )
+    assert decision.status == "BLOCK"
+    assert decision.details["cost"] == {"skipped": True}
+    assert decision.details["pii"] == {"skipped": True}
+
+
+def test_fail_fast_respects_strict_and_accepted_risks():
+    baseline = {"output": "hello world", "cost_usd": 1.0}
+    candidate = {"output": "hello world, reach me at hi@example.com", "cost_usd": 5.0}
+    accepted = evaluate(baseline=baseline, candidate=candidate, fail_fast=True, accepted_risks=["cost"])
+    assert accepted.details["cost"].get("skipped") is None
+    assert "PII_EMAIL_BLOCK" in accepted.reason_codes
+    assert accepted.details["drift"] == {"skipped": True}
+
+    warn_candidate = {"output": "hello world", "cost_usd": 1.25}
+    strict = evaluate(baseline=baseline, candidate=warn_candidate, fail_fast=True, strict=True)
+    assert strict.status == "BLOCK"
+    assert strict.details["pii"] == {"skipped": True}
+
+
+def test_timings_record_per_policy_costs_and_counters():
+    baseline, candidate = CASES[1]
+    decision = evaluate(baseline=baseline, candidate=candidate, mode="full", timings=True)
+    timings = decision.metadata["timings"]
+    assert set(timings["policies"]) == {"cost", "latency", "pii", "output_contract", "drift", "red_team"}
+    pii = timings["policies"]["pii"]
+    assert pii["chars_scanned"] == len(candidate["output"])
+    assert pii["regex_matches"] == 2
+    assert pii["wall_ms"] >= 0 and pii["cpu_ms"] >= 0
+    assert timings["policies"]["drift"]["ngram_set_size"] > 0
+    assert {"load_config_ms", "overrides_ms", "total_ms"} <= set(timings)
+
+    plain = evaluate(baseline=baseline, candidate=candidate, mode="full")
+    assert "timings" not in plain.metadata
+    decision.metadata.pop("timings")
+    assert decision == plain
+
+
+def test_timings_report_cache_hits():
+    from breakpoint import DecisionMemo, PolicyResultCache
+
+    baseline, candidate = CASES[0]
+    evaluator = Evaluator(policy_cache=PolicyResultCache(), timings=True)
+    evaluator.evaluate(baseline=baseline, candidate=candidate)
+    second = evaluator.evaluate(baseline=baseline, candidate=candidate)
+    assert second.metadata["timings"]["policies"]["pii"]["policy_cache_hits"] == 1
+
+    memoized = Evaluator(memo=DecisionMemo(), timings=True)
+    memoized.evaluate(baseline=baseline, candidate=candidate)
+    assert memoized.evaluate(baseline=baseline, candidate=candidate).metadata["timings"]["memo_hit"] is True
+
+
+def test_observe_policies_reports_each_policy_run():
+    from breakpoint.engine.instrumentation import observe_policies
+
+    started, ended = [], []
+    evaluator = Evaluator()
+    with observe_policies(started.append, lambda name, result, elapsed: ended.append((name, elapsed >= 0))):
+        evaluator.evaluate({"output": "hello", "cost_usd": 1.0}, {"output": "hello", "cost_usd": 1.0})
+    evaluator.evaluate({"output": "hello", "cost_usd": 1.0}, {"output": "hello", "cost_usd": 1.0})
+
+    assert sorted(started) == ["cost", "drift", "pii"]
+    assert sorted(ended) == [("cost", True), ("drift", True), ("pii", True)]
@@ -0,0 +1,124 @@
+import json
+import pickle
+
+import pytest
+
+from breakpoint import DecisionMemo, Evaluator, PolicyResultCache, evaluate
+from breakpoint.engine.memo import memo_key
+
+
+BASELINE = {"output": "hello world", "cost_usd": 1.0}
+CANDIDATE = {"output": "hello world, reach me at hi@example.com", "cost_usd": 1.3}
+
+
+def test_memo_hit_matches_uncached_decision():
+    memo = DecisionMemo(max_size=8)
+    evaluator = Evaluator(mode="full", memo=memo)
+    first = evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE, metadata={"run_id": "a"})
+    second = evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE, metadata={"run_id": "b"})
+
+    assert first == evaluate(baseline=BASELINE, candidate=CANDIDATE, metadata={"run_id": "a"}, mode="full")
+    assert second.metadata["run_id"] == "b"
+    assert second.reason_codes == first.reason_codes
+    stats = memo.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_memo_returns_copies():
+    memo = DecisionMemo()
+    evaluator = Evaluator(memo=memo)
+    first = evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    first.reasons.append("mutated")
+    first.details["pii"]["blocked_total"] = 99
+    second = evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert "mutated" not in second.reasons
+    assert second.details["pii"]["blocked_total"] == 1
+
+
+def test_memo_key_includes_settings_and_config(tmp_path):
+    memo = DecisionMemo()
+    lite = Evaluator(memo=memo).evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    strict = Evaluator(memo=memo, strict=True).evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert memo.stats().misses == 2
+    assert lite.metadata["strict"] is False
+    assert strict.metadata["strict"] is True
+
+    config_path = tmp_path / "policy.json"
+    config_path.write_text('{"cost_policy": {"warn_increase_pct": 50, "block_increase_pct": 80}}', encoding="utf-8")
+    custom = Evaluator(mode="full", config_path=str(config_path), memo=memo)
+    decision = custom.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert "COST_INCREASE_WARN" not in decision.reason_codes
+    assert memo.stats().misses == 3
+
+
+def test_memo_evicts_least_recently_used():
+    memo = DecisionMemo(max_size=2)
+    evaluator = Evaluator(memo=memo)
+    outputs = ["alpha beta", "gamma delta", "epsilon zeta"]
+    for output in outputs:
+        evaluator.evaluate(baseline=BASELINE, candidate={"output": output, "cost_usd": 1.0})
+    evaluator.evaluate(baseline=BASELINE, candidate={"output": outputs[0], "cost_usd": 1.0})
+    stats = memo.stats()
+    assert stats.evictions == 2
+    assert stats.hits == 0
+    assert len(memo) == 2
+
+
+def test_memo_is_picklable_for_process_workers():
+    memo = DecisionMemo(max_size=4)
+    evaluator = Evaluator(memo=memo)
+    evaluator.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    restored = pickle.loads(pickle.dumps(evaluator))
+    restored.evaluate(baseline=BASELINE, candidate=CANDIDATE)
+    assert restored.memo.stats().hits == 1
+
+
+def test_memo_rejects_invalid_size():
+    with pytest.raises(ValueError, match="max_size"):
+        DecisionMemo(max_size=0)
+
+
+@pytest.mark.parametrize("output", ["{\"id\": 1}", "plain text answer", "x"])
+def test_identical_outputs_take_fast_path(output):
+    baseline = {"output": output, "cost_usd": 1.0, "latency_ms": 100}
+    decision = evaluate(baseline=baseline, candidate=dict(baseline), mode="full")
+    assert decision.status == "ALLOW"
+    assert decision.metrics["similarity"] == 1.0
+    assert decision.details["output_contract"] == {}
+
+
+def test_memo_key_hashes_identical_outputs_once():
+    baseline = {"output": "same text " * 1000, "cost_usd": 1.0}
+    identical = memo_key(baseline, dict(baseline), "config", {})
+    assert identical is not None
+    assert identical != memo_key(baseline, {"cost_usd": 1.0}, "config", {})
+    assert identical != memo_key(baseline, {"output": "other", "cost_usd": 1.0}, "config", {})
+
+    memo = DecisionMemo()
+    evaluator = Evaluator(mode="full", memo=memo)
+    first = evaluator.evaluate(baseline=baseline, candidate=dict(baseline))
+    second = evaluator.evaluate(baseline=baseline, candidate=dict(baseline))
+    assert second.reason_codes == first.reason_codes
+    assert (memo.stats().hits, memo.stats().misses) == (1, 1)
+
+
+def test_policy_cache_reruns_only_policies_whose_inputs_changed(tmp_path):
+    cache = PolicyResultCache()
+    baseline = {"output": "hello world", "model": "gpt-4.1-mini", "tokens_total": 1000, "latency_ms": 100}
+    candidate = {"output": "hello world again", "model": "gpt-4.1-mini", "tokens_total": 1300, "latency_ms": 100}
+    evaluator = Evaluator(mode="full", policy_cache=cache)
+    first = evaluator.evaluate(baseline=baseline, candidate=candidate)
+    assert cache.stats().misses == 6
+    assert first == evaluate(baseline=baseline, candidate=candidate, mode="full")
+
+    config_path = tmp_path / "pricing.json"
+    config_path.write_text(json.dumps({"model_pricing": {"gpt-4.1-mini": {"per_1k": 0.5}}}), encoding="utf-8")
+    repriced = Evaluator(mode="full", config_path=str(config_path), policy_cache=cache)
+    repriced.evaluate(baseline=baseline, candidate=candidate)
+    assert (cache.stats().hits, cache.stats().misses) == (5, 7)
+
+    edited = dict(candidate, output="a different answer")
+    decision = evaluator.evaluate(baseline=baseline, candidate=edited)
+    # cost and latency are reused; the four output-reading policies rerun.
+    assert (cache.stats().hits, cache.stats().misses) == (7, 11)
+    assert decision == evaluate(baseline=baseline, candidate=edited, mode="full")
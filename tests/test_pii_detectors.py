@@ -0,0 +1,128 @@
+import random
+import re
+
+import pytest
+
+from breakpoint.engine.config import ConfigValidationError, load_config
+from breakpoint.engine.policies.detectors import CreditCardDetector, compile_detector
+from breakpoint.engine.policies.pii import _is_luhn_valid, compile_pii_policy
+
+DEFAULT_CARD_REGEX = r"\b(?:\d[ -]*?){13,16}\b"
+
+
+def _cards(text: str) -> list[str]:
+    return [text[start:end] for start, end in CreditCardDetector().iter_spans(text)]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("test 4111 1111 1111 1111", ["4111 1111 1111 1111"]),
+        ("card: 4111-1111-1111-1111.", ["4111-1111-1111-1111"]),
+        ("4111111111111111", ["4111111111111111"]),
+        ("amex 3782 822463 10005 and discover 6011111111111117", ["3782 822463 10005", "6011111111111117"]),
+        # 19 digits, which the old 13-16 digit pattern missed.
+        ("6011 0000 0000 0000 001", ["6011 0000 0000 0000 001"]),
+        # A card inside a longer run of numbers, and two cards back to back.
+        ("row 12 4111 1111 1111 1111 7", ["4111 1111 1111 1111"]),
+        ("4111 1111 1111 1111 4242 4242 4242 4242", ["4111 1111 1111 1111", "4242 4242 4242 4242"]),
+        ("test 4111 1111 1111 1112", []),
+        ("x4111111111111111", []),
+        ("4111111111111111_", []),
+        # Runs of spaces and hyphens between groups, as the regex default allows.
+        ("4111  1111  1111  1111", ["4111  1111  1111  1111"]),
+        ("card 4111 - 1111 - 1111 - 1111.", ["4111 - 1111 - 1111 - 1111"]),
+        ("4111--1111 -1111- 1111", ["4111--1111 -1111- 1111"]),
+        ("41111111111111110000", []),
+        ("call 555-123-4567", []),
+    ],
+)
+def test_credit_card_detector_spans(text, expected):
+    assert _cards(text) == expected
+
+
+def test_credit_card_detector_respects_pos():
+    text = "4111111111111111 and 4242424242424242"
+    assert [text[s:e] for s, e in CreditCardDetector().iter_spans(text, 5)] == ["4242424242424242"]
+
+
+def test_default_config_keeps_the_regex_and_detector_is_opt_in():
+    patterns = dict(load_config()["pii_policy"]["patterns"])
+    assert patterns["credit_card"] == DEFAULT_CARD_REGEX
+    patterns["credit_card"] = {"detector": "credit_card"}
+    policy = compile_pii_policy(patterns, [])
+    result = policy.evaluate({"output": "Cards 4111 1111 1111 1111 and 4111 1111 1111 1112"})
+    assert result.details["blocked_type_counts"] == {"CREDIT_CARD": 1}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "test 4111 1111 1111 1111",
+        "4111  1111  1111  1111",
+        "4111 - 1111 - 1111 - 1111",
+        "4111--1111--1111--1111 and 3782 822463 10005",
+        "no card 4111 1111 1111 1112",
+    ],
+)
+def test_detector_blocks_what_the_regex_default_blocks(text):
+    regex = compile_pii_policy({"credit_card": DEFAULT_CARD_REGEX}, []).evaluate({"output": text})
+    detector = compile_pii_policy({"credit_card": {"detector": "credit_card"}}, []).evaluate({"output": text})
+    assert detector.status == regex.status
+    assert detector.codes == regex.codes
+
+
+def test_detector_finds_cards_the_regex_default_misses():
+    # The regex consumes "12 4242 4242 4242" and rejects it on Luhn; the detector tries each group start.
+    text = "ref 12 4242 4242 4242 4242 end"
+    assert compile_pii_policy({"credit_card": DEFAULT_CARD_REGEX}, []).evaluate({"output": text}).status == "ALLOW"
+    assert _cards(text) == ["4242 4242 4242 4242"]
+
+
+def test_detector_finds_every_regex_default_match_fuzz():
+    cards = ["4111111111111111", "378282246310005", "6011111111111117", "5555555555554444"]
+    rng = random.Random(3)
+    regex = re.compile(DEFAULT_CARD_REGEX)
+    for _case in range(3000):
+        parts = []
+        for _part in range(rng.randint(1, 5)):
+            roll = rng.random()
+            if roll < 0.4:
+                card, width = rng.choice(cards), rng.choice([1, 2, 4, 5])
+                separator = rng.choice([" ", "-", "  ", " - ", "--", ""])
+                parts.append(separator.join(card[index : index + width] for index in range(0, len(card), width)))
+            elif roll < 0.7:
+                parts.append("".join(rng.choice("0123456789") for _ in range(rng.randint(1, 6))))
+            else:
+                parts.append(rng.choice(["a", "x1", "_", "é", ".", "-"]))
+        text = "".join(rng.choice([" ", "-", "", "  "]) + part for part in parts)
+        spans = list(CreditCardDetector().iter_spans(text))
+        for match in regex.finditer(text):
+            if _is_luhn_valid(match.group(0)):
+                assert any(start < match.end() and match.start() < end for start, end in spans), text
+
+
+def test_detector_and_regex_patterns_mix_with_allowlist():
+    patterns = {"email": r"\b\S+@\S+\.com\b", "card": {"detector": "credit_card"}}
+    policy = compile_pii_policy(patterns, [r"^4242"])
+    result = policy.evaluate({"output": "jane@example.com 4111111111111111 4242424242424242"})
+    assert result.details["blocked_type_counts"] == {"EMAIL": 1, "CARD": 1}
+
+
+def test_regex_credit_card_pattern_still_checks_luhn():
+    policy = compile_pii_policy({"credit_card": r"\b(?:\d[ -]*?){13,16}\b"}, [])
+    assert policy.evaluate({"output": "4111 1111 1111 1112"}).status == "ALLOW"
+    assert policy.evaluate({"output": "4111 1111 1111 1111"}).status == "BLOCK"
+
+
+def test_unknown_detector_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Available: credit_card"):
+        compile_detector("iban")
+
+    config = tmp_path / "config.json"
+    config.write_text('{"pii_policy": {"patterns": {"iban": {"detector": "iban"}}}}')
+    with pytest.raises(ConfigValidationError, match="credit_card"):
+        load_config(config_path=str(config))
+    config.write_text('{"pii_policy": {"patterns": {"iban": 42}}}')
+    with pytest.raises(ConfigValidationError):
+        load_config(config_path=str(config))
@@ -0,0 +1,130 @@
+import re
+
+import pytest
+
+from breakpoint.engine.policies.patterns import combine_any, compile_pattern_set, is_combinable, prefilter
+from breakpoint.engine.policies.pii import CompiledPiiPolicy, cached_pii_policy, compile_pii_policy, evaluate_pii_policy
+
+DEFAULT_PATTERNS = {
+    "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",
+    "phone": r"\b(?:\+?1[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)\d{3}[-.\s]?\d{4}\b",
+    "credit_card": r"\b(?:\d[ -]*?){13,16}\b",
+    "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
+}
+TEXTS = [
+    "",
+    "Nothing to see here.",
+    "Mail jane@example.com or call 555-123-4567.",
+    "Card 4111 1111 1111 1111, bad card 4111 1111 1111 1112, ssn 123-45-6789.",
+    # The phone number is a prefix of a longer card-like run, and the SSN sits inside it.
+    "Ref 5551234567123 and 555-12-3456 and 555-123-4567",
+    "support@example.com, noreply@example.com, 4242424242424242",
+]
+
+
+def _per_pattern(policy: CompiledPiiPolicy, text: str):
+    # The previous engine: one independent scan per pattern.
+    return CompiledPiiPolicy(policy.patterns, policy.allowlist).evaluate({"output": text})
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("allowlist", [[], [r"@example\.com$"], [r"^support@", r"4242", r"(?i)NOREPLY"]])
+def test_counts_and_reasons_match_per_pattern_scan(text, allowlist):
+    policy = compile_pii_policy(DEFAULT_PATTERNS, allowlist)
+    expected = _per_pattern(policy, text)
+    actual = policy.evaluate({"output": text})
+    assert actual.status == expected.status
+    assert actual.reasons == expected.reasons
+    assert actual.codes == expected.codes
+    assert actual.details == expected.details
+    assert evaluate_pii_policy({"output": text}, DEFAULT_PATTERNS, allowlist).details == expected.details
+
+
+def test_pattern_hidden_behind_an_earlier_branch_is_still_found():
+    patterns = {"word": r"\b\w+\b", "digits": r"\d+", "year": r"\b20\d\d\b"}
+    pattern_set = compile_pattern_set(tuple(re.compile(pattern) for pattern in patterns.values()))
+    assert pattern_set.combined == (0, 1, 2)
+    # Every "20xx" is consumed by "word" first, but "year" and "digits" still count.
+    assert pattern_set.matching("in 2024") == {0, 1, 2}
+    assert pattern_set.matching("in may") == {0}
+    policy = compile_pii_policy(patterns, [])
+    assert policy.evaluate({"output": "in 2024"}).details == _per_pattern(policy, "in 2024").details
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"(?i)secret", r"(?P<word>\w+)", r"(\w)\1", r"x*", r"a|\b"],
+)
+def test_patterns_that_change_meaning_in_an_alternation_stay_separate(pattern):
+    assert not is_combinable(pattern)
+    regexes = (re.compile(r"\bfoo\b"), re.compile(r"\bbar\b"), re.compile(pattern))
+    pattern_set = compile_pattern_set(regexes)
+    assert pattern_set.combined == (0, 1)
+    assert pattern_set.separate_indices == (2,)
+
+
+def test_verbose_and_mixed_flag_patterns_are_not_combined():
+    verbose = (re.compile(r"foo # comment", re.VERBOSE), re.compile(r"bar", re.VERBOSE))
+    assert compile_pattern_set(verbose).combined == ()
+    mixed = (re.compile("foo"), re.compile("bar"), re.compile("baz", re.IGNORECASE))
+    assert compile_pattern_set(mixed).combined == (0, 1)
+    assert compile_pattern_set(mixed).matching("BAZ") == {2}
+
+
+def test_allowlist_is_combined_into_one_regex():
+    allowlist = combine_any(tuple(re.compile(item) for item in [r"^support@", r"4242", r"(\d)\1{5}"]))
+    assert len(allowlist) == 2
+    assert allowlist[0].search("support@example.com")
+    assert allowlist[0].search("4242 4242")
+    assert allowlist[1].search("111111")
+
+
+@pytest.mark.parametrize(
+    ("pattern", "flags", "literal", "reach"),
+    [
+        (DEFAULT_PATTERNS["email"], 0, "@", None),
+        (DEFAULT_PATTERNS["ssn"], 0, "-", 10),
+        (r"\bignore previous instructions\b", re.IGNORECASE, "ignore previous instructions", 0),
+        (r"\bswearword(?:s)?\b", re.IGNORECASE, "swearword", 1),
+    ],
+)
+def test_prefilter_probes_for_required_literals(pattern, flags, literal, reach):
+    prefiltered = prefilter(re.compile(pattern, flags))
+    assert prefiltered.literal == literal
+    assert prefiltered.reach == reach
+    assert not prefiltered.has_probe_hit("Nothing to see here.")
+
+
+def test_prefilter_without_requirements_scans_normally():
+    assert prefilter(re.compile(r"\w+")).probe is None
+    assert prefilter(re.compile(r"a*")).probe is None
+    assert prefilter(re.compile(DEFAULT_PATTERNS["phone"])).ascii_chars == "0123456789"
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [*DEFAULT_PATTERNS.values(), r"\bsis\b", r"a(?:b|c)d", r"(ab|cd)y", r"x+y", r"(?<=a)bb", r"\d-\d", r"[ab]{2,3}c"],
+)
+@pytest.mark.parametrize("flags", [0, re.IGNORECASE])
+def test_prefiltered_matches_equal_plain_finditer(pattern, flags):
+    regex = re.compile(pattern, flags)
+    prefiltered = prefilter(regex)
+    texts = TEXTS + [
+        "SIS sıs ſis İS abd acd ABD cdy xxxy abb a-1-2 aabc",
+        "1-2 " * 300 + "123-45-6789",
+    ]
+    for text in texts:
+        for pos in (0, 3):
+            assert [match.span() for match in prefiltered.finditer(text, pos)] == [
+                match.span() for match in regex.finditer(text, pos)
+            ]
+
+
+def test_pattern_analysis_and_compiled_policies_are_memoized():
+    assert prefilter(re.compile(r"\b\S+@\S+\.com\b")) is prefilter(re.compile(r"\b\S+@\S+\.com\b"))
+    assert prefilter(re.compile("abc")) is not prefilter(re.compile("abc", re.IGNORECASE))
+    patterns = {"email": r"\b\S+@\S+\.com\b", "card": {"detector": "credit_card"}}
+    first = cached_pii_policy(patterns, ["example"])
+    assert cached_pii_policy(dict(patterns), ["example"]) is first
+    assert cached_pii_policy(patterns, []) is not first
+    assert first == compile_pii_policy(patterns, ["example"])
@@ -0,0 +1,159 @@
+import json
+import pickle
+from dataclasses import dataclass
+from functools import partial
+
+import pytest
+
+from breakpoint import Evaluator, evaluate
+from breakpoint.cli.main import main
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.policies import registry
+from breakpoint.engine.policies.base import Policy, PolicyResult
+
+
+def _check_json_size(max_chars: int, baseline: dict, candidate: dict) -> PolicyResult:
+    output = str(candidate.get("output", ""))
+    if len(output) > max_chars:
+        return PolicyResult(
+            policy="json_size",
+            status="BLOCK",
+            reasons=[f"Candidate output exceeds {max_chars} chars."],
+            codes=["JSON_SIZE_BLOCK"],
+            details={"chars": len(output)},
+        )
+    return PolicyResult(policy="json_size", status="ALLOW", details={"chars": len(output)})
+
+
+@dataclass(frozen=True)
+class JsonSizeGuard:
+    name: str = "json_size"
+    modes: tuple = ("lite", "full")
+    inputs: tuple = (("candidate", "output"),)
+    cost: float = 0.5
+
+    def policy_config(self, config: dict, mode: str) -> dict:
+        return config.get("json_size_policy", {"max_chars": 20})
+
+    def bind(self, policy_config: dict):
+        return partial(_check_json_size, policy_config["max_chars"])
+
+
+@dataclass(frozen=True)
+class FakeEntryPoint:
+    name: str
+    target: object
+
+    def load(self):
+        return self.target
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    def install(*entry_points):
+        monkeypatch.setattr(registry, "_entry_points", lambda: list(entry_points))
+        registry.reload_plugin_policies()
+
+    yield install
+    registry.reload_plugin_policies()
+
+
+def test_builtin_policies_satisfy_protocol_in_canonical_order():
+    assert all(isinstance(policy, Policy) for policy in registry.BUILTIN_POLICIES)
+    assert [p.name for p in registry.policies_for_mode("lite")] == ["cost", "pii", "drift"]
+    assert [p.name for p in registry.policies_for_mode("full")] == [
+        "cost",
+        "latency",
+        "pii",
+        "output_contract",
+        "drift",
+        "red_team",
+    ]
+
+
+def test_plugin_policy_runs_after_builtins_in_output_order(plugins):
+    plugins(FakeEntryPoint("json_size", JsonSizeGuard))
+    baseline = {"output": "short answer", "cost_usd": 1.0}
+    candidate = {"output": "a considerably longer answer", "cost_usd": 1.0}
+    decision = evaluate(baseline=baseline, candidate=candidate)
+    assert list(decision.details) == ["cost", "pii", "drift", "json_size"]
+    assert decision.reason_codes[-1] == "JSON_SIZE_BLOCK"
+    assert decision.status == "BLOCK"
+
+
+def test_plugin_policy_is_cheapest_under_fail_fast_and_pickles(plugins):
+    plugins(FakeEntryPoint("json_size", JsonSizeGuard()))
+    evaluator = Evaluator(fail_fast=True)
+    decision = evaluator.evaluate(
+        baseline={"output": "short answer", "cost_usd": 1.0},
+        candidate={"output": "a considerably longer answer", "cost_usd": 1.0},
+    )
+    assert decision.metadata["skipped_policies"] == ["cost", "pii", "drift"]
+    assert pickle.loads(pickle.dumps(evaluator)).evaluate(
+        baseline={"output": "short answer", "cost_usd": 1.0},
+        candidate={"output": "a considerably longer answer", "cost_usd": 1.0},
+    ) == decision
+
+
+def test_plugin_policy_reads_its_config_section(plugins, tmp_path):
+    plugins(FakeEntryPoint("json_size", JsonSizeGuard))
+    config_path = tmp_path / "policy.json"
+    config_path.write_text(json.dumps({"json_size_policy": {"max_chars": 1000}}), encoding="utf-8")
+    decision = evaluate(
+        baseline={"output": "short answer", "cost_usd": 1.0, "latency_ms": 100},
+        candidate={"output": "a considerably longer answer", "cost_usd": 1.0, "latency_ms": 100},
+        mode="full",
+        config_path=str(config_path),
+    )
+    assert decision.details["json_size"] == {"chars": 28}
+    assert "JSON_SIZE_BLOCK" not in decision.reason_codes
+
+
+@pytest.mark.parametrize(
+    "entry_point, message",
+    [
+        (FakeEntryPoint("pii", JsonSizeGuard(name="pii")), "already registered"),
+        (FakeEntryPoint("bad_modes", JsonSizeGuard(name="bad_modes", modes=("turbo",))), "modes"),
+        (FakeEntryPoint("bad_inputs", JsonSizeGuard(name="bad_inputs", inputs=(("both", "output"),))), "inputs"),
+        (FakeEntryPoint("bad_cost", JsonSizeGuard(name="bad_cost", cost=-1)), "cost"),
+    ],
+)
+def test_invalid_plugins_are_rejected(plugins, entry_point, message):
+    plugins(entry_point)
+    with pytest.raises(ConfigValidationError, match=message):
+        Evaluator()
+
+
+def test_plugin_load_errors_name_the_entry_point(plugins):
+    class Broken:
+        def __init__(self):
+            raise RuntimeError("boom")
+
+    plugins(FakeEntryPoint("broken", Broken))
+    with pytest.raises(ConfigValidationError, match="broken"):
+        Evaluator()
+
+
+def test_cli_lists_plugin_policies_after_builtins(plugins, tmp_path, capsys):
+    plugins(
+        FakeEntryPoint("json_size", JsonSizeGuard),
+        FakeEntryPoint("full_only", JsonSizeGuard(name="full_only", modes=("full",))),
+    )
+    baseline = tmp_path / "baseline.json"
+    candidate = tmp_path / "candidate.json"
+    baseline.write_text(json.dumps({"output": "short answer", "cost_usd": 1.0}), encoding="utf-8")
+    candidate.write_text(json.dumps({"output": "a considerably longer answer", "cost_usd": 1.0}), encoding="utf-8")
+
+    assert main(["evaluate", str(baseline), str(candidate), "--verbose"]) == 0
+    text = capsys.readouterr().out
+    policy_lines = text.split("Policy Results:\n", 1)[1].split("\n\n", 1)[0].splitlines()
+    assert [line.split(" ", 2)[2].split(":")[0] for line in policy_lines] == [
+        "No PII detected",
+        "Cost",
+        "Output drift",
+        "json_size",
+    ]
+    assert policy_lines[-1].endswith("✗ json_size: Policy violation detected.")
+    assert registry.policy_for_reason_code("JSON_SIZE_BLOCK") == "json_size"
+    assert registry.policy_for_reason_code("RED_TEAM_INJECTION_BLOCK") == "red_team"
+    assert registry.policy_for_reason_code("STRICT_MODE_PROMOTION_BLOCK") is None
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+
+from breakpoint import Evaluator, evaluate_many
+from breakpoint.engine.config import load_config
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.policies.budget import BudgetedPolicy, with_regex_budget
+from breakpoint.engine.policies.pii import compile_pii_policy
+from breakpoint.engine.policies.red_team import compile_red_team_policy
+from breakpoint.engine.streaming import StreamGuard
+
+# Exponential backtracking on a run of "a"s followed by anything else.
+CATASTROPHIC = r"(a+)+$"
+SLOW_TEXT = "jane@example.com " + "a" * 64 + "!"
+BASELINE = {"output": "hello"}
+
+
+def _config(tmp_path, config: dict) -> str:
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps(config))
+    return str(path)
+
+
+def test_pattern_budget_reports_offending_pattern_and_keeps_earlier_matches():
+    policy = with_regex_budget(
+        compile_pii_policy({"email": r"\b\S+@\S+\.com\b", "evil": CATASTROPHIC, "ssn": r"\d{3}-\d{2}-\d{4}"}, []),
+        {"pattern_ms": 100, "action": "WARN"},
+    )
+    assert isinstance(policy, BudgetedPolicy)
+
+    result = policy.evaluate({"output": SLOW_TEXT})
+    # The email match found before the overrun still blocks; the budget adds its own code.
+    assert result.status == "BLOCK"
+    assert result.codes == ["PII_BLOCK_EMAIL", "PII_WARN_REGEX_BUDGET"]
+    assert result.details["regex_budget_exceeded"] == {
+        "budget": "pattern",
+        "budget_ms": 100,
+        "label": "evil",
+        "pattern": CATASTROPHIC,
+    }
+    assert result.reasons[-1] == (
+        "PII regex budget exceeded: evil pattern '(a+)+$' ran longer than 100 ms. Later patterns were not scanned."
+    )
+
+    # The worker is replaced and the same policy keeps working.
+    clean = policy.evaluate({"output": "reach me at jane@example.com or 123-45-6789"})
+    assert clean.codes == ["PII_BLOCK_EMAIL", "PII_BLOCK_SSN"]
+    assert clean.details == compile_pii_policy(
+        {"email": r"\b\S+@\S+\.com\b", "evil": CATASTROPHIC, "ssn": r"\d{3}-\d{2}-\d{4}"}, []
+    ).evaluate({"output": "reach me at jane@example.com or 123-45-6789"}).details
+
+
+def test_policy_budget_on_red_team():
+    policy = with_regex_budget(
+        compile_red_team_policy({"categories": {"injection": ["system prompt"], "dos": [CATASTROPHIC]}}),
+        {"policy_ms": 100, "action": "WARN"},
+    )
+    result = policy.evaluate({"output": SLOW_TEXT})
+    assert result.status == "WARN"
+    assert result.codes == ["RED_TEAM_WARN_REGEX_BUDGET"]
+    assert result.details["regex_budget_exceeded"]["budget"] == "policy"
+    assert result.details["regex_budget_exceeded"]["label"] == "dos"
+    assert "scan ran longer than 100 ms, in dos pattern" in result.reasons[0]
+
+
+def test_overrun_blames_the_running_pattern_after_many_fast_ones():
+    fast = [f"\\bterm{index}\\b" for index in range(300)]
+    policy = with_regex_budget(
+        compile_red_team_policy({"categories": {"fast": fast, "dos": [CATASTROPHIC], "late": ["later"]}}),
+        {"pattern_ms": 100},
+    )
+    for _attempt in range(3):
+        exceeded = policy.evaluate({"output": SLOW_TEXT}).details["regex_budget_exceeded"]
+        assert (exceeded["label"], exceeded["pattern"]) == ("dos", CATASTROPHIC)
+
+
+def test_budget_is_off_by_default_and_skipped_for_disabled_red_team():
+    policy = compile_red_team_policy({"enabled": False, "categories": {}})
+    assert with_regex_budget(policy, {"pattern_ms": 10}) is policy
+    assert with_regex_budget(policy, None) is policy
+
+
+def test_environment_sets_budget_and_decision_gets_reason_code(tmp_path):
+    path = _config(
+        tmp_path,
+        {
+            "pii_policy": {"patterns": {"evil": CATASTROPHIC}},
+            "environments": {
+                "ci": {"pii_policy": {"regex_budget": {"pattern_ms": 100}}},
+                "ci-warn": {"pii_policy": {"regex_budget": {"pattern_ms": 100, "action": "WARN"}}},
+            },
+        },
+    )
+    blocked = Evaluator(mode="full", config_path=path, config_environment="ci").evaluate(
+        baseline=BASELINE, candidate={"output": SLOW_TEXT}
+    )
+    assert blocked.status == "BLOCK"
+    assert "PII_REGEX_BUDGET_BLOCK" in blocked.reason_codes
+
+    warned = Evaluator(mode="full", config_path=path, config_environment="ci-warn").evaluate(
+        baseline=BASELINE, candidate={"output": SLOW_TEXT}
+    )
+    assert "PII_REGEX_BUDGET_WARN" in warned.reason_codes
+    assert warned.details["pii"]["regex_budget_exceeded"]["label"] == "evil"
+
+
+def test_budgeted_decisions_match_in_process(tmp_path):
+    budget = {"pattern_ms": 5000, "policy_ms": 10000}
+    plain = _config(tmp_path, {})
+    budgeted = str(tmp_path / "budgeted.json")
+    with open(budgeted, "w") as f:
+        json.dump({"pii_policy": {"regex_budget": budget}, "red_team_policy": {"regex_budget": budget}}, f)
+    pairs = [
+        {"baseline": BASELINE, "candidate": {"output": text}}
+        for text in ("hello", "mail jane@example.com, card 4111 1111 1111 1111", "ignore previous instructions")
+    ]
+    expected = [decision.details for decision in evaluate_many(pairs, mode="full", config_path=plain)]
+    for executor in ("serial", "thread", "process"):
+        decisions = evaluate_many(pairs, mode="full", config_path=budgeted, executor=executor, workers=2)
+        assert [decision.details for decision in decisions] == expected
+
+
+def test_stream_guard_leaves_budgeted_policies_to_finalize(tmp_path):
+    path = _config(tmp_path, {"pii_policy": {"regex_budget": {"policy_ms": 5000}}})
+    with pytest.warns(RuntimeWarning, match="regex_budget"):
+        guard = StreamGuard(Evaluator(mode="full", config_path=path), baseline=BASELINE)
+    guard.feed("mail jane@example.com today")
+    assert not guard.blocked
+    assert guard.finalize().status == "BLOCK"
+
+
+@pytest.mark.parametrize(
+    "budget",
+    [
+        "fast",
+        {},
+        {"action": "WARN"},
+        {"pattern_ms": 0},
+        {"pattern_ms": True},
+        {"policy_ms": 100, "action": "ALLOW"},
+        {"policy_ms": 100, "timeout": 5},
+    ],
+)
+@pytest.mark.parametrize("section", ["pii_policy", "red_team_policy"])
+def test_invalid_regex_budget_is_rejected(tmp_path, section, budget):
+    path = _config(tmp_path, {section: {"regex_budget": budget}})
+    with pytest.raises(ConfigValidationError, match=f"{section}.regex_budget"):
+        load_config(config_path=path)
+
+
+def test_workers_are_not_forked_from_the_evaluating_process():
+    from breakpoint.engine.policies import budget
+
+    worker = budget._Worker()
+    try:
+        assert worker.process._start_method in ("forkserver", "spawn")
+    finally:
+        worker.close()
@@ -0,0 +1,180 @@
+import json
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from breakpoint import evaluate
+from breakpoint.cli.serve import EvaluatorPool, make_server
+
+BASELINE = {"output": "Your order ships today.", "cost_usd": 0.10, "latency_ms": 400}
+CANDIDATE = {"output": "Your order ships today. Contact jane@example.com.", "cost_usd": 0.11, "latency_ms": 420}
+
+
+@pytest.fixture
+def server_url(tmp_path):
+    config_path = tmp_path / "acme.json"
+    config_path.write_text(json.dumps({"cost_policy": {"warn_increase_pct": 5, "block_increase_pct": 8}}))
+    pool = EvaluatorPool(max_entries=2, projects={"acme": {"mode": "full", "config_path": str(config_path)}})
+    server = make_server(port=0, pool=pool)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _request(url: str, payload: dict | None = None) -> tuple[int, dict]:
+    data = None if payload is None else json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_evaluate_matches_library_decision(server_url):
+    status, payload = _request(f"{server_url}/v1/evaluate", {"baseline": BASELINE, "candidate": CANDIDATE})
+    expected = evaluate(baseline=BASELINE, candidate=CANDIDATE).to_dict()
+    assert status == 200
+    assert payload["status"] == expected["status"]
+    assert payload["reason_codes"] == expected["reason_codes"]
+    assert payload["reasons"] == expected["reasons"]
+    assert payload["metrics"] == expected["metrics"]
+
+    status, payload = _request(
+        f"{server_url}/v1/evaluate", {"baseline": BASELINE, "candidate": CANDIDATE, "mode": "full", "strict": True}
+    )
+    assert status == 200
+    assert payload["status"] == evaluate(baseline=BASELINE, candidate=CANDIDATE, mode="full", strict=True).status
+
+
+def test_project_key_selects_its_config(server_url):
+    request = {"baseline": BASELINE, "candidate": CANDIDATE, "metadata": {"project_key": "acme"}}
+    status, payload = _request(f"{server_url}/v1/evaluate", request)
+    assert status == 200
+    assert "COST_INCREASE_BLOCK" in payload["reason_codes"]
+    assert payload["metadata"]["project_key"] == "acme"
+
+    _status, default_payload = _request(f"{server_url}/v1/evaluate", {"baseline": BASELINE, "candidate": CANDIDATE})
+    assert "COST_INCREASE_BLOCK" not in default_payload["reason_codes"]
+
+
+def test_batch_returns_one_record_per_pair_in_order(server_url):
+    pairs = [
+        {"id": "a", "baseline": BASELINE, "candidate": BASELINE},
+        {"id": "b", "baseline": BASELINE, "candidate": CANDIDATE},
+        {"id": "c", "baseline": BASELINE},
+        "not an object",
+    ]
+    status, payload = _request(f"{server_url}/v1/evaluate/batch", {"pairs": pairs, "mode": "full"})
+    assert status == 200
+    decisions = payload["decisions"]
+    assert [item["case_id"] for item in decisions] == ["a", "b", "c", 4]
+    assert decisions[0]["status"] == "ALLOW"
+    assert decisions[1]["status"] == evaluate(baseline=BASELINE, candidate=CANDIDATE, mode="full").status
+    assert decisions[2]["reason_codes"] == ["INPUT_VALIDATION_ERROR"]
+    assert decisions[3]["reason_codes"] == ["INPUT_VALIDATION_ERROR"]
+
+
+def test_errors_health_and_stats(server_url):
+    status, payload = _request(f"{server_url}/v1/evaluate", {"baseline": BASELINE})
+    assert status == 400
+    assert payload["reason_codes"] == ["INPUT_VALIDATION_ERROR"]
+
+    status, payload = _request(
+        f"{server_url}/v1/evaluate",
+        {"baseline": BASELINE, "candidate": CANDIDATE, "config_environment": "no-such-env"},
+    )
+    assert status == 400
+    assert payload["reason_codes"] == ["CONFIG_VALIDATION_ERROR"]
+
+    status, _payload = _request(f"{server_url}/v1/nope")
+    assert status == 404
+
+    status, payload = _request(f"{server_url}/healthz")
+    assert status == 200
+    assert payload["status"] == "ok"
+
+    _request(f"{server_url}/v1/evaluate", {"baseline": BASELINE, "candidate": BASELINE})
+    status, payload = _request(f"{server_url}/v1/stats")
+    assert status == 200
+    assert payload["decisions"] >= 1
+    assert payload["evaluators"]["entries"] <= 2
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"config_path": "/etc/passwd"},
+        {"preset": "chatbot"},
+        {"accepted_risks": ["no_such_policy"]},
+        {"strict": "yes"},
+    ],
+)
+def test_requests_cannot_choose_config_sources_or_new_pool_entries(server_url, options):
+    status, payload = _request(f"{server_url}/v1/evaluate", {"baseline": BASELINE, "candidate": CANDIDATE, **options})
+    assert status == 400
+    assert payload["reason_codes"] == ["INPUT_VALIDATION_ERROR"]
+    assert "root:" not in payload["reasons"][0]
+    _status, stats = _request(f"{server_url}/v1/stats")
+    assert stats["evaluators"]["entries"] == 0
+
+
+def test_internal_errors_are_not_echoed_to_clients(tmp_path):
+    class FailingPool(EvaluatorPool):
+        def get(self, options=None, project_key=None):
+            raise RuntimeError(f"cannot parse {tmp_path}/secret.json")
+
+    server = make_server(port=0, pool=FailingPool())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        status, payload = _request(
+            f"http://127.0.0.1:{server.server_address[1]}/v1/evaluate", {"baseline": BASELINE, "candidate": CANDIDATE}
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert status == 500
+    assert payload["reasons"] == ["Internal server error."]
+    assert payload["reason_codes"] == ["INTERNAL_ERROR"]
+
+
+def test_pool_shares_entries_across_unknown_projects_and_risk_spellings():
+    pool = EvaluatorPool(projects={"acme": {"mode": "full"}})
+    default = pool.get()
+    assert pool.get(project_key="nope") is default
+    assert pool.get(project_key="acme") is not default
+    risks = pool.get({"accepted_risks": ["pii", "Cost "]})
+    assert pool.get({"accepted_risks": ["cost", "pii", "PII"]}) is risks
+    assert pool.info()["entries"] == 3
+
+
+def test_pool_reuses_and_evicts_evaluators():
+    pool = EvaluatorPool(max_entries=2, projects={"other": {}})
+    first = pool.get({"mode": "lite"})
+    assert pool.get({"mode": "lite"}) is first
+    pool.get({"mode": "full"})
+    pool.get({"mode": "full"}, project_key="other")
+    assert pool.get({"mode": "lite"}) is not first
+    assert pool.info()["evictions"] == 2
+    with pytest.raises(ValueError):
+        EvaluatorPool(defaults={"bogus": 1}).get()
+
+
+def test_cli_serve_rejects_bad_project_mapping():
+    completed = subprocess.run(
+        [sys.executable, "-m", "breakpoint.cli.main", "serve", "--port", "0", "--project", "acme"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed.returncode == 1
+    assert "KEY=CONFIG" in completed.stderr
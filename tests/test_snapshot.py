@@ -0,0 +1,111 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from breakpoint import Evaluator
+from breakpoint.engine import FrozenDict, invalidate_config_cache, load_config
+from breakpoint.engine.errors import ConfigValidationError
+from breakpoint.engine.snapshot import load_snapshot, write_snapshot
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    invalidate_config_cache()
+    yield
+    invalidate_config_cache()
+
+
+def _write_policy(tmp_path, payload: dict):
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_snapshot_round_trips_merged_config(tmp_path):
+    policy_path = _write_policy(tmp_path, {"cost_policy": {"warn_increase_pct": 5, "block_increase_pct": 90}})
+    snapshot_path = tmp_path / "policy.bpc"
+    snapshot = write_snapshot(str(snapshot_path), str(policy_path), preset="chatbot")
+
+    assert [source["kind"] for source in snapshot["sources"]] == ["default", "preset", "config"]
+    assert snapshot["sources"][2]["path"] == "policy.json"
+    config = load_snapshot(str(snapshot_path))
+    assert isinstance(config, FrozenDict)
+    assert config == load_config(str(policy_path), preset="chatbot")
+
+    compiled = Evaluator(mode="full", config=config)
+    direct = Evaluator(mode="full", config_path=str(policy_path), preset="chatbot")
+    pair = {"baseline": {"output": "hello", "cost_usd": 1.0}, "candidate": {"output": "hello", "cost_usd": 1.1}}
+    assert compiled.evaluate(**pair).to_dict() == direct.evaluate(**pair).to_dict()
+
+
+def test_snapshot_drops_invalid_red_team_patterns_and_rejects_invalid_pii(tmp_path):
+    policy_path = _write_policy(tmp_path, {"red_team_policy": {"categories": {"injection": ["(bad", "\\bok\\b"]}}})
+    snapshot = write_snapshot(str(tmp_path / "policy.bpc"), str(policy_path))
+    assert snapshot["config"]["red_team_policy"]["categories"]["injection"] == ["\\bok\\b"]
+    assert snapshot["dropped_patterns"] == ["red_team_policy.categories.injection: (bad"]
+
+    policy_path = _write_policy(tmp_path, {"pii_policy": {"patterns": {"broken": "[a-"}}})
+    with pytest.raises(ConfigValidationError, match="pii_policy.patterns.broken"):
+        write_snapshot(str(tmp_path / "other.bpc"), str(policy_path))
+
+
+def test_snapshot_rejects_stale_sources_tampering_and_other_engines(tmp_path, monkeypatch):
+    policy_path = _write_policy(tmp_path, {"cost_policy": {"warn_increase_pct": 5, "block_increase_pct": 90}})
+    snapshot_path = tmp_path / "policy.bpc"
+    write_snapshot(str(snapshot_path), str(policy_path))
+    original = snapshot_path.read_text(encoding="utf-8")
+
+    snapshot_path.write_text(original.replace('"warn_increase_pct":5', '"warn_increase_pct":50'), encoding="utf-8")
+    with pytest.raises(ConfigValidationError, match="integrity"):
+        load_snapshot(str(snapshot_path))
+
+    snapshot_path.write_text(original, encoding="utf-8")
+    monkeypatch.setattr("breakpoint.engine.snapshot.engine_version", lambda: "99.0.0")
+    with pytest.raises(ConfigValidationError, match="engine"):
+        load_snapshot(str(snapshot_path))
+    monkeypatch.undo()
+    monkeypatch.setattr("breakpoint.engine.snapshot.engine_fingerprint", lambda: "changed")
+    with pytest.raises(ConfigValidationError, match="different build"):
+        load_snapshot(str(snapshot_path))
+    monkeypatch.undo()
+
+    _write_policy(tmp_path, {"cost_policy": {"warn_increase_pct": 6, "block_increase_pct": 90}})
+    with pytest.raises(ConfigValidationError, match="stale"):
+        load_snapshot(str(snapshot_path))
+
+
+def test_evaluator_rejects_config_with_config_path(tmp_path):
+    with pytest.raises(ConfigValidationError):
+        Evaluator(config=load_config(), preset="chatbot")
+
+
+def test_cli_config_compile_and_evaluate_compiled(tmp_path):
+    policy_path = _write_policy(tmp_path, {"cost_policy": {"warn_increase_pct": 5, "block_increase_pct": 90}})
+    snapshot_path = tmp_path / "policy.bpc"
+    baseline_path = tmp_path / "baseline.json"
+    candidate_path = tmp_path / "candidate.json"
+    baseline_path.write_text(json.dumps({"output": "hello", "cost_usd": 1.0}), encoding="utf-8")
+    candidate_path.write_text(json.dumps({"output": "hello", "cost_usd": 1.1}), encoding="utf-8")
+    cli = [sys.executable, "-m", "breakpoint.cli.main"]
+
+    compiled = subprocess.run(
+        [*cli, "config", "compile", "--config", str(policy_path), "--out", str(snapshot_path)],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert compiled.returncode == 0, compiled.stderr
+    assert "Wrote" in compiled.stdout
+
+    evaluate_args = [*cli, "evaluate", str(baseline_path), str(candidate_path), "--mode", "full", "--json"]
+    with_snapshot = subprocess.run([*evaluate_args, "--compiled", str(snapshot_path)], check=False, capture_output=True, text=True)
+    with_config = subprocess.run([*evaluate_args, "--config", str(policy_path)], check=False, capture_output=True, text=True)
+    assert json.loads(with_snapshot.stdout)["status"] == "WARN"
+    assert with_snapshot.stdout == with_config.stdout
+
+    _write_policy(tmp_path, {})
+    stale = subprocess.run([*evaluate_args, "--compiled", str(snapshot_path)], check=False, capture_output=True, text=True)
+    assert stale.returncode != 0
+    assert json.loads(stale.stdout)["reason_codes"] == ["CONFIG_VALIDATION_ERROR"]
@@ -0,0 +1,79 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import breakpoint
+from breakpoint.benchmarks.startup import DEFERRED_MODULES, check_startup, import_times
+from breakpoint.engine.config import available_presets
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(completed.stdout))
+
+
+def test_import_breakpoint_defers_engine_modules():
+    loaded = _loaded_modules("import breakpoint")
+    assert not loaded & set(DEFERRED_MODULES)
+    assert "breakpoint.engine.config" not in loaded
+
+
+def test_cli_import_defers_subcommand_modules():
+    loaded = _loaded_modules("import breakpoint.cli.main")
+    assert not loaded & set(DEFERRED_MODULES)
+    assert "breakpoint.engine.metrics" not in loaded
+    assert "breakpoint.engine.disk_cache" not in loaded
+
+
+def test_lazy_exports_resolve_on_access():
+    assert "evaluate" in dir(breakpoint)
+    assert isinstance(breakpoint.evaluate(baseline={"output": "hello"}, candidate={"output": "hello"}), breakpoint.Decision)
+    from breakpoint.engine import stats
+
+    assert callable(stats)
+    with pytest.raises(AttributeError):
+        breakpoint.not_a_name
+
+
+def test_available_presets_is_cached_but_returns_a_copy():
+    presets = available_presets()
+    presets.clear()
+    assert available_presets()
+
+
+def test_import_times_and_budgets():
+    times = import_times("breakpoint")
+    self_us, cumulative_us = times["breakpoint"]
+    assert 0 < self_us <= cumulative_us
+    assert "site" not in times
+
+    # Timing budgets are too noisy for CI; a generous budget still checks the report shape.
+    [result] = check_startup({"breakpoint": 10_000_000}, repeat=1)
+    assert result["ok"] is True
+    assert result["deferred_loaded"] == []
+    assert len(result["samples_us"]) == 1
+
+
+def test_cli_version_and_bench_startup():
+    version = subprocess.run(
+        [sys.executable, "-m", "breakpoint.cli.main", "--version"], capture_output=True, text=True, check=False
+    )
+    assert version.returncode == 0
+    assert version.stdout.startswith("breakpoint ")
+
+    completed = subprocess.run(
+        [sys.executable, "-m", "breakpoint.cli.main", "bench", "startup", "--repeat", "1", "--json"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    payload = json.loads(completed.stdout)
+    assert [item["module"] for item in payload["results"]] == ["breakpoint", "breakpoint.cli.main"]
+    assert all(item["deferred_loaded"] == [] for item in payload["results"])
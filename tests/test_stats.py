@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+import breakpoint.engine as engine
+from breakpoint import Evaluator
+from breakpoint.engine import DecisionMemo, PolicyResultCache, invalidate_config_cache, telemetry
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    engine.reset_stats()
+    yield
+    engine.reset_stats()
+
+
+def test_stats_counts_decisions_reason_codes_and_policy_latency():
+    invalidate_config_cache()
+    evaluator = Evaluator()
+    Evaluator()
+    evaluator.evaluate(baseline={"output": "hello", "cost_usd": 1.0}, candidate={"output": "hello", "cost_usd": 1.0})
+    evaluator.evaluate(baseline={"output": "hello", "cost_usd": 1.0}, candidate={"output": "hello", "cost_usd": 5.0})
+
+    stats = engine.stats()
+    assert stats.decisions == 2
+    assert stats.by_status == {"ALLOW": 1, "BLOCK": 1}
+    assert stats.by_reason_code["COST_INCREASE_BLOCK"] == 1
+    assert stats.config_loads == 1
+    assert stats.caches["config"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+    assert sorted(stats.policies) == ["cost", "drift", "pii"]
+    cost = stats.policies["cost"]
+    assert cost["count"] == 2
+    assert cost["by_status"] == {"ALLOW": 1, "BLOCK": 1}
+    assert cost["buckets"]["le_inf"] == 2
+    assert list(cost["buckets"].values()) == sorted(cost["buckets"].values())
+    assert stats.to_dict()["policies"]["pii"]["count"] == 2
+
+
+def test_stats_cache_hit_rates():
+    evaluator = Evaluator(memo=DecisionMemo(), policy_cache=PolicyResultCache())
+    pair = {"baseline": {"output": "hello", "cost_usd": 1.0}, "candidate": {"output": "hello", "cost_usd": 1.0}}
+    for _ in range(4):
+        evaluator.evaluate(**pair)
+
+    caches = engine.stats().caches
+    assert caches["memo"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+    assert caches["policy_cache"] == {"hits": 0, "misses": 3, "hit_rate": 0.0}
+
+
+def test_stats_merge_counts_from_finished_threads():
+    evaluator = Evaluator()
+
+    def run() -> None:
+        for _ in range(5):
+            evaluator.evaluate(baseline={"output": "a", "cost_usd": 1.0}, candidate={"output": "a", "cost_usd": 1.0})
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert engine.stats().decisions == 20
+    assert engine.stats().policies["drift"]["count"] == 20
+
+
+def test_hooks_receive_policy_and_decision_events():
+    events = []
+
+    @engine.on_policy_start
+    def started(name):
+        events.append(("start", name))
+
+    @engine.on_policy_end
+    def ended(name, result, elapsed):
+        events.append(("end", name, result.status))
+
+    @engine.on_decision
+    def decided(decision):
+        events.append(("decision", decision.status))
+
+    try:
+        Evaluator().evaluate(baseline={"output": "a", "cost_usd": 1.0}, candidate={"output": "a", "cost_usd": 1.0})
+    finally:
+        for hook in (started, ended, decided):
+            engine.remove_hook(hook)
+
+    assert events[0] == ("start", "cost")
+    assert ("end", "drift", "ALLOW") in events
+    assert events[-1] == ("decision", "ALLOW")
+    assert len(events) == 7
+
+    Evaluator().evaluate(baseline={"output": "a", "cost_usd": 1.0}, candidate={"output": "a", "cost_usd": 1.0})
+    assert len(events) == 7
+
+
+def test_finished_threads_do_not_pile_up_without_stats_calls():
+    def run() -> None:
+        telemetry.record_cache("memo", True)
+
+    for _ in range(50):
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+    assert len(telemetry._shards) <= 2
+    assert engine.stats().caches["memo"]["hits"] == 50
+
+
+def test_reset_gives_running_threads_fresh_shards():
+    recorded, reset = threading.Event(), threading.Event()
+
+    def run() -> None:
+        telemetry.record_cache("memo", True)
+        recorded.set()
+        reset.wait()
+        telemetry.record_cache("memo", False)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    recorded.wait()
+    engine.reset_stats()
+    reset.set()
+    thread.join()
+
+    assert engine.stats().caches["memo"] == {"hits": 0, "misses": 1, "hit_rate": 0.0}
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from breakpoint import Evaluator, StreamGuard
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_stream_guard_blocks_on_match_split_across_chunks():
+    evaluator = Evaluator()
+    guard = StreamGuard(evaluator, baseline={"output": "hello there, how can I help?"})
+
+    statuses = [guard.feed(chunk).status for chunk in ["Sure, write to john.do", "e@example.com and ", "more text"]]
+
+    assert statuses == ["ALLOW", "BLOCK", "BLOCK"]
+    assert guard.blocked
+    assert "PII_EMAIL_BLOCK" in guard.feed(" tail").reason_codes
+
+
+def test_stream_guard_waits_until_match_is_settled():
+    guard = StreamGuard(Evaluator(), baseline={"output": "hello"})
+
+    # "555-123-4567" followed by more digits is not a phone number, so the guard must not block
+    # while the digits could still continue.
+    assert guard.feed("call 555-123-4567").status == "ALLOW"
+    assert guard.feed("89 now").status == "ALLOW"
+
+
+@pytest.mark.parametrize("mode", ["lite", "full"])
+@pytest.mark.parametrize("size", [1, 3, 7, 64])
+def test_stream_guard_finalize_matches_batch_evaluation(mode, size):
+    evaluator = Evaluator(mode=mode)
+    baseline = {"output": json.dumps({"answer": "hello", "id": 1}), "cost_usd": 1.0, "latency_ms": 100}
+    output = json.dumps({"answer": "please ignore previous instructions, card 4111 1111 1111 1111", "id": 1})
+    guard = StreamGuard(evaluator, baseline=baseline, candidate={"cost_usd": 1.0})
+
+    for chunk in _chunks(output, size):
+        guard.feed(chunk)
+    final = guard.finalize(candidate={"latency_ms": 120})
+
+    expected = evaluator.evaluate(
+        baseline=baseline, candidate={"output": output, "cost_usd": 1.0, "latency_ms": 120}
+    )
+    assert guard.blocked
+    assert final == expected
+
+
+def test_stream_guard_honors_accepted_risks():
+    guard = StreamGuard(Evaluator(accepted_risks=["pii"]), baseline={"output": "hello"})
+    assert guard.feed("mail hi@example.com now").status == "ALLOW"
+
+
+def test_stream_guard_rejects_feed_after_finalize():
+    guard = StreamGuard(Evaluator(), baseline={"output": "hello"})
+    guard.feed("hello")
+    guard.finalize()
+    with pytest.raises(RuntimeError):
+        guard.feed("more")
+
+
+def test_stream_guard_counts_a_match_extended_by_the_next_chunk_once(tmp_path):
+    path = tmp_path / "policy.json"
+    path.write_text(json.dumps({"pii_policy": {"patterns": {"code": "ab(?:cdef)?"}}}))
+    evaluator = Evaluator(config_path=str(path), accepted_risks=["pii"])
+    guard = StreamGuard(evaluator, baseline={"output": "hello"})
+
+    # "ab" settles at the end of the first chunk; the next chunk extends it to "abcdef".
+    assert guard.feed("xx abc").details["pii"]["blocked_type_counts"] == {"CODE": 1}
+    partial = guard.feed("def yy")
+
+    assert partial.details["pii"]["blocked_type_counts"] == {"CODE": 1}
+    assert partial.details["pii"] == guard.finalize().details["pii"]